@@ -0,0 +1,4 @@
+"""
+Biblioteca compartilhada do gerador de currículos.
+Reúne o código usado tanto pelos scripts de linha de comando quanto pela interface web.
+"""
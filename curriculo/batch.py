@@ -0,0 +1,175 @@
+"""
+Geração em lote de currículos (idiomas x formatos/templates).
+Os dados de cada idioma são lidos uma única vez e cada documento é entregue assim
+que fica pronto, permitindo montar um ZIP em fluxo, sem guardar o arquivo inteiro
+em memória.
+"""
+import os
+import zipfile
+from collections import deque
+
+from curriculo import engine
+from curriculo.model import normalize
+from curriculo.render_pool import PoolSaturated, RenderTimeout
+from templates import TemplateManager
+
+# Combinações oferecidas pela página /generate: (formato, template)
+DEFAULT_TARGETS = [
+    ('pdf', 'pdf'),
+    ('pdf', 'pdf_moderno'),
+    ('pdf_ats', 'pdf_ats'),
+    ('docx', 'docx'),
+]
+
+# Formatos de saída; cada template pertence ao formato que é prefixo do seu nome
+FORMATS = ('pdf', 'pdf_ats', 'docx')
+
+def template_format(template_name):
+    """Formato ao qual um template pertence (o prefixo mais longo), ou None."""
+    matches = [f for f in FORMATS if template_name == f or template_name.startswith(f + '_')]
+    return max(matches, key=len) if matches else None
+
+def get_targets(formats=None, templates=None):
+    """Lista de (formato, template) com todos os templates instalados dos formatos pedidos.
+
+    `templates`, se informado, restringe o resultado a esses nomes de template.
+    """
+    formats = formats or FORMATS
+    targets = []
+    for template_name in sorted(TemplateManager().list_templates()):
+        format_type = template_format(template_name)
+        if format_type not in formats:
+            continue
+        if templates and template_name not in templates:
+            continue
+        targets.append((format_type, template_name))
+    # Ordenar na ordem dos formatos pedidos, mantendo o template padrão primeiro
+    targets.sort(key=lambda t: (formats.index(t[0]), t[1] != t[0], t[1]))
+    return targets
+
+def build_matrix(resumes, targets=None):
+    """Lista de (idioma, formato, template) para cada idioma em `resumes` e cada alvo."""
+    targets = targets or DEFAULT_TARGETS
+    return [(language, format_type, template)
+            for language in resumes
+            for format_type, template in targets]
+
+def member_name(data, language, format_type, template):
+    """Caminho do documento dentro do ZIP: <idioma>/<template>/<arquivo>."""
+    template_name = engine.resolve_template(format_type, template)
+    filename = engine.get_output_filename(data, language, format_type)
+    return f"{language}/{template_name}/{filename}"
+
+def iter_rendered(resumes, matrix, pool=None, cache=None, compact=False):
+    """Gera (nome no ZIP, bytes) para cada item da matriz, na ordem em que ficam prontos.
+
+    `compact` gera os PDFs no modo compacto.
+
+    Com um `pool`, até `pool.workers` documentos são gerados em paralelo, cada um
+    esperado por no máximo `pool.timeout` segundos: um documento que não fica pronto
+    a tempo é trocado por um aviso `<nome>.erro.txt`, sem interromper os demais. Se a fila
+    do pool estiver cheia, espera-se por um dos documentos em andamento e o pedido é
+    reenviado; só quando nada estiver em andamento o documento é gerado no próprio
+    processo, para garantir progresso.
+    """
+    in_flight = deque()
+    max_in_flight = max(getattr(pool, 'workers', 0), 1)
+    # Normalizar cada idioma uma única vez para todos os formatos
+    resumes = {language: normalize(data) for language, data in resumes.items()}
+
+    def drain_one():
+        name, key, future = in_flight.popleft()
+        try:
+            document = pool.wait(future)
+        except RenderTimeout as e:
+            print(f"Documento não gerado ({name}): {str(e)}")
+            return error_member(name, e)
+        if cache is not None:
+            cache.put(key, document)
+        return name, document
+
+    for language, format_type, template in matrix:
+        data = resumes[language]
+        name = member_name(data, language, format_type, template)
+        key = engine.cache_key(data, language, format_type, template, compact)
+
+        document = cache.get(key) if cache is not None else None
+        if document is not None:
+            yield name, document
+            continue
+
+        if pool is None or pool.workers <= 0:
+            document = engine.render_bytes(data, language, format_type, template, compact)
+            if cache is not None:
+                cache.put(key, document)
+            yield name, document
+            continue
+
+        while len(in_flight) >= max_in_flight:
+            yield drain_one()
+        future = None
+        while future is None:
+            try:
+                future = pool.submit(engine.render_bytes, data, language, format_type, template, compact)
+            except PoolSaturated:
+                if not in_flight:
+                    break
+                # Pool ocupado com outros pedidos: esperar por um dos nossos e tentar de novo
+                yield drain_one()
+        if future is None:
+            # Nada nosso em andamento para liberar uma vaga: gerar aqui mesmo
+            document = engine.render_bytes(data, language, format_type, template, compact)
+            if cache is not None:
+                cache.put(key, document)
+            yield name, document
+            continue
+        in_flight.append((name, key, future))
+
+    while in_flight:
+        yield drain_one()
+
+def error_member(name, error):
+    """(nome, conteúdo) do aviso que substitui no lote um documento que não pôde ser gerado."""
+    return f"{name}.erro.txt", f"Não foi possível gerar {name}: {error}\n".encode('utf-8')
+
+def write_files(members, output_dir):
+    """Grava cada (nome, conteúdo) em `output_dir`, mantendo as subpastas do nome."""
+    paths = []
+    for name, content in members:
+        path = os.path.join(output_dir, *name.split('/'))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(content)
+        paths.append(path)
+    return paths
+
+class _ZipStream:
+    """Destino de escrita sem seek para o zipfile; acumula apenas o trecho ainda não enviado."""
+
+    def __init__(self):
+        self._chunks = []
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def pop(self):
+        data = b''.join(self._chunks)
+        self._chunks = []
+        return data
+
+def stream_zip(members):
+    """Gera os bytes de um ZIP a partir de (nome, conteúdo), membro a membro."""
+    stream = _ZipStream()
+    with zipfile.ZipFile(stream, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, content in members:
+            archive.writestr(name, content)
+            chunk = stream.pop()
+            if chunk:
+                yield chunk
+    chunk = stream.pop()
+    if chunk:
+        yield chunk
@@ -0,0 +1,197 @@
+"""
+Pontuação em lote de muitos currículos contra muitas vagas.
+Os termos de cada vaga e de cada currículo são extraídos uma única vez (com a mesma
+lógica de `curriculo/matching.py`) e guardados como vetores esparsos compactos (ids
+de termo e frequências). Só os termos que aparecem em alguma vaga entram na
+multiplicação: a matriz das vagas é montada uma vez e os currículos são processados
+em blocos densos de tamanho limitado, multiplicados pela matriz das vagas com o
+NumPy. Para cada vaga, apenas os N melhores currículos são mantidos entre os blocos.
+"""
+import csv
+import glob
+import json
+import os
+
+import numpy as np
+
+from curriculo.keywords import get_extractor, resume_texts
+from curriculo.matching import BM25_K1, DEFAULT_METHOD, METHODS, expand_terms
+from curriculo.model import normalize
+from curriculo.stopwords import get_job_posting_words
+
+DEFAULT_TOP_N = 10
+
+# Número máximo de células (currículos x termos das vagas) de cada bloco denso (~64 MB em float32)
+MAX_CHUNK_CELLS = 16 * 1024 * 1024
+
+class Vocabulary:
+    """Termo -> id, com a frequência de documentos (df) de cada termo."""
+
+    def __init__(self):
+        self.ids = {}
+        self.df = []
+
+    def add_document(self, counts):
+        """Converte {termo: frequência} em (ids, frequências) e atualiza o df."""
+        ids = np.empty(len(counts), dtype=np.int32)
+        tfs = np.empty(len(counts), dtype=np.float32)
+        for position, (key, tf) in enumerate(counts.items()):
+            term_id = self.ids.get(key)
+            if term_id is None:
+                term_id = self.ids[key] = len(self.df)
+                self.df.append(0)
+            self.df[term_id] += 1
+            ids[position] = term_id
+            tfs[position] = tf
+        return ids, tfs
+
+    def idf(self, documents):
+        """IDF de cada termo, com a mesma fórmula de `curriculo/matching.py`."""
+        df = np.asarray(self.df, dtype=np.float32)
+        return np.log1p((documents - df + 0.5) / (df + 0.5))
+
+def resume_terms(extractor, data):
+    """{termo: frequência ponderada} de um currículo (JSON ou `Resume`)."""
+    counts = {}
+    for text, weight in resume_texts(normalize(data)):
+        for key, _, _, factor in expand_terms(extractor, text):
+            counts[key] = counts.get(key, 0.0) + weight * factor
+    return counts
+
+def job_terms(extractor, text, ignored):
+    """{termo: frequência} da descrição de uma vaga, sem o vocabulário comum de anúncios."""
+    counts = {}
+    for key, _, _, factor in expand_terms(extractor, text):
+        if key not in ignored:
+            counts[key] = counts.get(key, 0.0) + factor
+    return counts
+
+def load_jobs(path):
+    """(nome, texto) de cada vaga: um arquivo .txt por vaga em uma pasta, ou um único arquivo."""
+    files = sorted(glob.glob(os.path.join(path, '*.txt'))) if os.path.isdir(path) else [path]
+    for file_path in files:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            yield os.path.splitext(os.path.basename(file_path))[0], f.read()
+
+def load_resumes(path):
+    """(nome, JSON) de cada currículo .json encontrado na pasta (e subpastas) ou no arquivo."""
+    files = sorted(glob.glob(os.path.join(path, '**', '*.json'), recursive=True)) if os.path.isdir(path) else [path]
+    for file_path in files:
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                yield os.path.relpath(file_path, path) if os.path.isdir(path) else file_path, json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Currículo ignorado ({file_path}): {str(e)}")
+
+class BulkScorer:
+    """Vagas e currículos já convertidos em vetores de termos, pontuados todos contra todos em `rank`."""
+
+    def __init__(self, language=None, method=DEFAULT_METHOD, max_chunk_cells=MAX_CHUNK_CELLS):
+        if method not in METHODS:
+            raise ValueError(f"Método desconhecido: {method}. Use: {', '.join(METHODS)}")
+        self.extractor = get_extractor(language)
+        self.ignored = get_job_posting_words(language)
+        self.method = method
+        self.max_chunk_cells = max_chunk_cells
+        self.vocabulary = Vocabulary()
+        self.jobs = []          # (nome, ids, frequências)
+        self.resumes = []       # (nome, ids, frequências)
+
+    def add_job(self, name, text):
+        ids, tfs = self.vocabulary.add_document(job_terms(self.extractor, text, self.ignored))
+        self.jobs.append((name, ids, tfs))
+
+    def add_resume(self, name, data):
+        try:
+            counts = resume_terms(self.extractor, data)
+        except ValueError as e:
+            print(f"Currículo ignorado ({name}): {str(e)}")
+            return
+        ids, tfs = self.vocabulary.add_document(counts)
+        self.resumes.append((name, ids, tfs))
+
+    def _job_matrix(self, idf):
+        """Matriz densa vagas x termos das vagas, e o mapa id global -> coluna."""
+        columns = np.full(len(self.vocabulary.df), -1, dtype=np.int64)
+        job_ids = np.unique(np.concatenate([ids for _, ids, _ in self.jobs])) if self.jobs else np.empty(0, np.int32)
+        columns[job_ids] = np.arange(len(job_ids))
+        matrix = np.zeros((len(self.jobs), len(job_ids)), dtype=np.float32)
+        for row, (_, ids, tfs) in enumerate(self.jobs):
+            matrix[row, columns[ids]] = np.log1p(tfs) * idf[ids]
+        if self.method == 'bm25':
+            # Cada vaga soma 1: a pontuação é a fração do peso da vaga coberta pelo currículo
+            totals = matrix.sum(axis=1, keepdims=True)
+        else:
+            totals = np.sqrt((matrix * matrix).sum(axis=1, keepdims=True))
+        np.divide(matrix, totals, out=matrix, where=totals > 0)
+        return matrix, columns
+
+    def _resume_block(self, block, idf, columns, width):
+        """Bloco denso currículos x termos das vagas, já com os pesos do método escolhido."""
+        lengths = [len(ids) for _, ids, _ in block]
+        rows = np.repeat(np.arange(len(block)), lengths)
+        ids = np.concatenate([ids for _, ids, _ in block]) if block else np.empty(0, np.int32)
+        tfs = np.concatenate([tfs for _, _, tfs in block]) if block else np.empty(0, np.float32)
+
+        if self.method == 'bm25':
+            values = tfs / (tfs + BM25_K1)
+        else:
+            values = np.log1p(tfs) * idf[ids]
+            # Norma sobre todos os termos do currículo, não só os que aparecem nas vagas
+            norms = np.sqrt(np.bincount(rows, weights=values * values, minlength=len(block)))
+            values = values / np.where(norms > 0, norms, 1.0)[rows]
+
+        matrix = np.zeros((len(block), width), dtype=np.float32)
+        mask = columns[ids] >= 0
+        matrix[rows[mask], columns[ids][mask]] = values[mask]
+        return matrix
+
+    def rank(self, top_n=DEFAULT_TOP_N):
+        """Para cada vaga, os `top_n` currículos mais aderentes: {vaga: [(currículo, pontuação), ...]}."""
+        if not self.jobs or not self.resumes:
+            return {name: [] for name, _, _ in self.jobs}
+        idf = self.vocabulary.idf(len(self.jobs) + len(self.resumes))
+        job_matrix, columns = self._job_matrix(idf)
+        width = max(job_matrix.shape[1], 1)
+        chunk = max(1, self.max_chunk_cells // width)
+
+        # Melhores pontuações e índices de currículo de cada vaga até o bloco atual
+        best_scores = np.empty((len(self.jobs), 0), dtype=np.float32)
+        best_index = np.empty((len(self.jobs), 0), dtype=np.int64)
+        for start in range(0, len(self.resumes), chunk):
+            block = self.resumes[start:start + chunk]
+            scores = job_matrix @ self._resume_block(block, idf, columns, job_matrix.shape[1]).T
+            best_scores = np.concatenate([best_scores, scores], axis=1)
+            best_index = np.concatenate([best_index, np.broadcast_to(np.arange(start, start + len(block)), scores.shape)], axis=1)
+            if best_scores.shape[1] > top_n:
+                keep = np.argpartition(-best_scores, top_n - 1, axis=1)[:, :top_n]
+                best_scores = np.take_along_axis(best_scores, keep, axis=1)
+                best_index = np.take_along_axis(best_index, keep, axis=1)
+
+        # Maior pontuação primeiro; empates na ordem em que os currículos foram lidos
+        order = np.lexsort((best_index, -best_scores), axis=1)
+        best_scores = np.take_along_axis(best_scores, order, axis=1)
+        best_index = np.take_along_axis(best_index, order, axis=1)
+        return {
+            name: [(self.resumes[index][0], round(100.0 * float(value), 1))
+                   for index, value in zip(best_index[row], best_scores[row])]
+            for row, (name, _, _) in enumerate(self.jobs)
+        }
+
+# Função que grava o ranking em CSV (vaga, posição, currículo, pontuação)
+def write_ranking(ranking, output):
+    with open(output, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['job', 'rank', 'resume', 'score'])
+        for job, results in ranking.items():
+            for position, (resume, value) in enumerate(results, 1):
+                writer.writerow([job, position, resume, f"{value:.1f}"])
+
+# Função que pontua todos os currículos de `resumes_path` contra todas as vagas de `jobs_path`
+def score_all(jobs_path, resumes_path, language=None, method=DEFAULT_METHOD, top_n=DEFAULT_TOP_N):
+    scorer = BulkScorer(language, method)
+    for name, text in load_jobs(jobs_path):
+        scorer.add_job(name, text)
+    for name, data in load_resumes(resumes_path):
+        scorer.add_resume(name, data)
+    return scorer.rank(top_n), len(scorer.jobs), len(scorer.resumes)
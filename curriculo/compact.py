@@ -0,0 +1,53 @@
+"""
+Modo compacto dos PDFs.
+Por padrão o reportlab grava o conteúdo das páginas comprimido e depois codificado em
+ASCII85 (texto de 7 bits, cerca de 25% maior) e declara a Helvetica como fonte
+inicial de todas as páginas, mesmo em templates que não a usam. No modo compacto as
+páginas são gravadas apenas com Flate e a fonte inicial é a fonte base do template,
+para que nenhuma fonte não usada entre no arquivo.
+"""
+import os
+from io import BytesIO
+
+from reportlab.pdfbase import pdfdoc
+from reportlab.pdfgen.canvas import Canvas
+
+class CompactCanvas(Canvas):
+    """Canvas que grava cada página com compressão Flate, sem a codificação ASCII85."""
+
+    def showPage(self):
+        Canvas.showPage(self)
+        page = self._doc.Pages.pages[-1]
+        if not page.Contents and page.stream:
+            # Com Contents já definido, o reportlab não monta o fluxo com os filtros padrão
+            stream = pdfdoc.PDFStream(content=page.stream, filters=[pdfdoc.PDFZCompress])
+            stream.__Comment__ = "page stream"
+            page.Contents = stream
+
+def build(doc, elements, styles, compact=False):
+    """Gera o documento, no modo compacto se pedido (fonte inicial = a do estilo 'normal')."""
+    if not compact:
+        doc.build(elements)
+        return
+    doc.pageCompression = 1
+    doc.initialFontName = styles['normal'].fontName
+    doc.build(elements, canvasmaker=CompactCanvas)
+
+# Função que monta a linha de relatório de tamanho (bytes antes e depois)
+def size_row(normal_bytes, compact_bytes, **fields):
+    saved = normal_bytes - compact_bytes
+    row = dict(fields)
+    row.update({
+        'bytes': normal_bytes,
+        'compact_bytes': compact_bytes,
+        'saved_bytes': saved,
+        'saved_percent': round(100.0 * saved / normal_bytes, 1) if normal_bytes else 0.0,
+    })
+    return row
+
+# Função que mostra quanto o modo compacto economizou em um arquivo já gerado
+def print_size_report(render, data, selected_lang, template_name, output_filename):
+    buffer = BytesIO()
+    render(data, selected_lang, template_name, buffer)
+    row = size_row(len(buffer.getvalue()), os.path.getsize(output_filename))
+    print(f"Modo compacto: {row['compact_bytes']} bytes (normal: {row['bytes']} bytes, {row['saved_percent']:.1f}% menor)")
@@ -0,0 +1,155 @@
+"""
+Gerador DOCX em fluxo.
+Em vez de montar a árvore do python-docx, o word/document.xml é escrito direto no
+ZIP, parágrafo a parágrafo, a partir do modelo normalizado. As demais partes do
+pacote (estilos, numeração, tema, relacionamentos...) são sempre as mesmas: elas são
+comprimidas uma única vez por processo, a partir do documento base de
+`templates/docx_base.py`, e copiadas prontas para cada documento, na mesma ordem e
+com os mesmos atributos usados pelo python-docx: o arquivo gerado é idêntico ao do
+template `docx`. O uso de memória não depende do tamanho do currículo.
+"""
+import copy
+import io
+import struct
+import threading
+import time
+import zipfile
+
+from templates.docx_base import get_base_document
+
+DOCUMENT_PART = 'word/document.xml'
+
+# Atributos que o python-docx (ZipFile.writestr com o nome da parte) grava em cada entrada
+PART_EXTERNAL_ATTR = 0o600 << 16
+
+def part_info(name, date_time):
+    info = zipfile.ZipInfo(name, date_time=date_time)
+    info.compress_type = zipfile.ZIP_DEFLATED
+    info.external_attr = PART_EXTERNAL_ATTR
+    return info
+
+def _compressed_entries(parts):
+    """(ZipInfo, dados já comprimidos) de cada parte, comprimidas uma única vez."""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as target:
+        for name, data in parts:
+            target.writestr(part_info(name, (1980, 1, 1, 0, 0, 0)), data)
+    raw = buffer.getvalue()
+    entries = []
+    for info in zipfile.ZipFile(buffer).infolist():
+        # Os dados começam depois do cabeçalho local (30 bytes + nome + campo extra)
+        name_length, extra_length = struct.unpack('<HH', raw[info.header_offset + 26:info.header_offset + 30])
+        start = info.header_offset + 30 + name_length + extra_length
+        entries.append((info, raw[start:start + info.compress_size]))
+    return entries
+
+class FixedParts:
+    """Partes fixas do pacote DOCX, já comprimidas, e o início/fim do document.xml."""
+
+    def __init__(self):
+        buffer = io.BytesIO()
+        get_base_document().new_document().save(buffer)
+        source = zipfile.ZipFile(buffer)
+
+        # Partes antes e depois do document.xml, na ordem em que o python-docx as grava
+        names = source.namelist()
+        position = names.index(DOCUMENT_PART)
+        entries = _compressed_entries((name, source.read(name)) for name in names if name != DOCUMENT_PART)
+        self.before = entries[:position]
+        self.after = entries[position:]
+
+        # O corpo do documento base só tem as configurações de página (w:sectPr), que fecham o corpo
+        document = source.read(DOCUMENT_PART)
+        body_end = document.index(b'<w:body>') + len(b'<w:body>')
+        tail_start = document.find(b'<w:sectPr', body_end)
+        if tail_start < 0:
+            tail_start = document.index(b'</w:body>')
+        self.head = document[:body_end]
+        self.tail = document[tail_start:]
+
+_fixed_parts = None
+_fixed_parts_lock = threading.Lock()
+
+def get_fixed_parts():
+    """Partes fixas compartilhadas por todos os documentos em fluxo deste processo."""
+    global _fixed_parts
+    with _fixed_parts_lock:
+        if _fixed_parts is None:
+            _fixed_parts = FixedParts()
+        return _fixed_parts
+
+def iter_body(resume, template):
+    """Fragmentos de XML do corpo do documento, na ordem do gerador DOCX padrão."""
+    header = resume.header
+    yield from template.title_xml(header.name, header.email, header.phone, header.linkedin)
+
+    if resume.summary is not None:
+        yield template.section_title_xml(resume.summary.title)
+        yield template.text_xml(resume.summary.content)
+
+    if resume.experience is not None:
+        yield template.section_title_xml(resume.experience.title)
+        for job in resume.experience.items:
+            if job.position:
+                yield template.bullet_xml(job.position)
+            if job.period:
+                yield template.text_xml(job.period)
+            yield template.text_xml("".join(f"- {item}\n" for item in job.description))
+
+    # Habilidades Técnicas começam em uma nova página
+    yield template.page_break_xml()
+
+    if resume.skills is not None:
+        yield template.section_title_xml(resume.skills.title)
+        for skill in resume.skills.items:
+            yield template.skill_bar_xml(skill.name, skill.level)
+
+    if resume.certifications is not None:
+        yield template.section_title_xml(resume.certifications.title)
+        for cert in resume.certifications.items:
+            yield template.certification_xml(cert)
+
+    for section in (resume.education, resume.in_progress):
+        if section is not None:
+            yield template.section_title_xml(section.title)
+            for item in section.items:
+                yield template.text_xml(item)
+
+def _copy_entry(archive, info, data, date_time):
+    # Entrada já comprimida: só o cabeçalho local é gerado de novo (o zipfile não tem
+    # uma API pública para copiar dados comprimidos, então seguimos o que o writestr faz)
+    info = copy.copy(info)
+    info.date_time = date_time
+    with archive._lock:
+        info.header_offset = archive.fp.tell()
+        archive.fp.write(info.FileHeader())
+        archive.fp.write(data)
+        archive.filelist.append(info)
+        archive.NameToInfo[info.filename] = info
+        archive.start_dir = archive.fp.tell()
+
+def _write_document_part(archive, resume, template, fixed, date_time):
+    with archive.open(part_info(DOCUMENT_PART, date_time), 'w') as part:
+        part.write(fixed.head)
+        for fragment in iter_body(resume, template):
+            part.write(fragment.encode('utf-8'))
+        part.write(fixed.tail)
+
+def write(resume, template, output):
+    """Grava o currículo em `output` (caminho ou arquivo binário) como um pacote DOCX."""
+    fixed = get_fixed_parts()
+    if isinstance(output, (str, bytes)) or hasattr(output, '__fspath__'):
+        with open(output, 'w+b') as file:
+            _write(file, resume, template, fixed)
+    else:
+        _write(output, resume, template, fixed)
+
+def _write(file, resume, template, fixed):
+    # Também funciona em destinos sem posicionamento (ex.: resposta HTTP em fluxo)
+    date_time = time.localtime(time.time())[:6]
+    with zipfile.ZipFile(file, 'w', zipfile.ZIP_DEFLATED) as archive:
+        for info, data in fixed.before:
+            _copy_entry(archive, info, data, date_time)
+        _write_document_part(archive, resume, template, fixed, date_time)
+        for info, data in fixed.after:
+            _copy_entry(archive, info, data, date_time)
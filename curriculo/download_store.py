@@ -0,0 +1,175 @@
+"""
+Armazenamento temporário de downloads compartilhado entre processos.
+Os documentos gerados são gravados em um diretório de spool e indexados em um
+pequeno banco SQLite, de modo que qualquer worker do gunicorn consiga servir um
+download criado por outro. As entradas expiram após um TTL e o total em disco é
+limitado por uma cota; uma thread em segundo plano remove o que sobrar.
+"""
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+import uuid
+
+# Padrões: 15 minutos de validade e 256 MB de cota total
+DEFAULT_TTL = 15 * 60
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+DEFAULT_GC_INTERVAL = 60
+
+def default_spool_dir():
+    return os.path.join(tempfile.gettempdir(), 'cv-generator-downloads')
+
+class DownloadStore:
+    def __init__(self, spool_dir=None, ttl=DEFAULT_TTL, max_bytes=DEFAULT_MAX_BYTES):
+        self.spool_dir = spool_dir or default_spool_dir()
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.index_path = os.path.join(self.spool_dir, 'index.sqlite3')
+        self._local = threading.local()
+        self._gc_thread = None
+        os.makedirs(self.spool_dir, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS downloads (
+                    id TEXT PRIMARY KEY,
+                    filename TEXT NOT NULL,
+                    mimetype TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    expires_at REAL NOT NULL
+                )
+            ''')
+            conn.execute('CREATE INDEX IF NOT EXISTS downloads_expires_at ON downloads (expires_at)')
+
+    def _connect(self):
+        # Uma conexão por thread; WAL permite leituras concorrentes entre processos
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.index_path, timeout=10)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        return conn
+
+    def _path(self, file_id):
+        return os.path.join(self.spool_dir, file_id)
+
+    def _remove_file(self, file_id):
+        try:
+            os.remove(self._path(file_id))
+        except FileNotFoundError:
+            pass
+
+    def put(self, content, filename, mimetype):
+        """Grava o documento no spool e retorna o id usado para baixá-lo.
+
+        Levanta ValueError se o documento sozinho for maior que a cota.
+        """
+        if len(content) > self.max_bytes:
+            raise ValueError(f"Documento de {len(content)} bytes excede a cota de downloads ({self.max_bytes} bytes)")
+        file_id = uuid.uuid4().hex
+        path = self._path(file_id)
+        # Gravar em um arquivo temporário e renomear: nenhum leitor vê o arquivo pela metade
+        temp_path = path + '.tmp'
+        with open(temp_path, 'wb') as f:
+            f.write(content)
+        os.replace(temp_path, path)
+
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                'INSERT INTO downloads (id, filename, mimetype, size, created_at, expires_at) VALUES (?, ?, ?, ?, ?, ?)',
+                (file_id, filename, mimetype, len(content), now, now + self.ttl),
+            )
+        self._enforce_quota(keep=file_id)
+        return file_id
+
+    def open(self, file_id):
+        """Retorna (arquivo aberto, nome, tipo MIME) ou None se não existir ou tiver expirado."""
+        row = self._connect().execute(
+            'SELECT filename, mimetype, expires_at FROM downloads WHERE id = ?', (file_id,)
+        ).fetchone()
+        if row is None or row[2] < time.time():
+            return None
+        try:
+            # Abrir já aqui: mesmo que a coleta apague o arquivo, o descritor continua válido
+            f = open(self._path(file_id), 'rb')
+        except FileNotFoundError:
+            return None
+        return f, row[0], row[1]
+
+    def _enforce_quota(self, keep=None):
+        # `keep`: o download que acabou de ser gravado nunca é removido pela cota
+        conn = self._connect()
+        total = conn.execute('SELECT COALESCE(SUM(size), 0) FROM downloads').fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        # Remover os downloads mais antigos até caber na cota
+        removed = []
+        for file_id, size in conn.execute('SELECT id, size FROM downloads WHERE id != ? ORDER BY created_at',
+                                          (keep or '',)):
+            if total <= self.max_bytes:
+                break
+            removed.append(file_id)
+            total -= size
+        self._delete(removed)
+
+    def _delete(self, file_ids):
+        if not file_ids:
+            return
+        with self._connect() as conn:
+            conn.executemany('DELETE FROM downloads WHERE id = ?', [(file_id,) for file_id in file_ids])
+        for file_id in file_ids:
+            self._remove_file(file_id)
+
+    def collect(self):
+        """Remove downloads expirados e arquivos órfãos do spool. Retorna quantos foram removidos."""
+        now = time.time()
+        conn = self._connect()
+        expired = [row[0] for row in conn.execute('SELECT id FROM downloads WHERE expires_at < ?', (now,))]
+        self._delete(expired)
+
+        # Arquivos sem entrada no índice (ex.: processo interrompido durante a gravação)
+        known = {row[0] for row in conn.execute('SELECT id FROM downloads')}
+        orphans = 0
+        for name in os.listdir(self.spool_dir):
+            if name.startswith('index.sqlite3') or name in known:
+                continue
+            path = os.path.join(self.spool_dir, name)
+            try:
+                # Dar uma margem para gravações em andamento
+                if now - os.path.getmtime(path) > self.ttl:
+                    os.remove(path)
+                    orphans += 1
+            except FileNotFoundError:
+                pass
+        return len(expired) + orphans
+
+    def start_collector(self, interval=DEFAULT_GC_INTERVAL):
+        """Inicia a coleta periódica em uma thread daemon (uma vez por processo)."""
+        if self._gc_thread is not None:
+            return
+
+        def run():
+            while True:
+                time.sleep(interval)
+                try:
+                    self.collect()
+                except Exception as e:
+                    print(f"Erro na coleta de downloads expirados: {str(e)}")
+
+        self._gc_thread = threading.Thread(target=run, name='download-store-gc', daemon=True)
+        self._gc_thread.start()
+
+    def stats(self):
+        count, total = self._connect().execute(
+            'SELECT COUNT(*), COALESCE(SUM(size), 0) FROM downloads'
+        ).fetchone()
+        return {
+            'spool_dir': self.spool_dir,
+            'downloads': count,
+            'bytes': total,
+            'max_bytes': self.max_bytes,
+            'ttl': self.ttl,
+        }
@@ -0,0 +1,120 @@
+"""
+Motor de renderização em processo.
+Este módulo expõe os geradores de `curriculo_pdf.py`, `curriculo_pdf_ats.py` e
+`curriculo_docx.py` como funções, evitando iniciar um novo interpretador Python
+para cada documento gerado.
+"""
+import os
+import sys
+from io import BytesIO
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.append(ROOT_DIR)
+
+import curriculo_pdf
+import curriculo_pdf_ats
+import curriculo_docx
+from templates import TemplateManager
+from curriculo import render_cache
+from curriculo import compact as compact_pdf
+from curriculo.model import normalize
+
+# Extensão e tipo MIME de cada família de formato
+MIMETYPES = {
+    '.pdf': 'application/pdf',
+    '.docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+}
+
+def get_renderer(format_type):
+    """Retorna o módulo gerador correspondente ao formato escolhido."""
+    if format_type == 'pdf_ats':
+        return curriculo_pdf_ats
+    elif format_type.startswith('pdf'):
+        return curriculo_pdf
+    # docx e outros
+    return curriculo_docx
+
+def resolve_template(format_type, template=None):
+    """Determina o nome completo do template a partir do formato e do template pedidos.
+
+    Segue as mesmas regras usadas pela interface web: um template sem prefixo
+    recebe o formato como prefixo e formatos compostos (como pdf_ats) já são
+    o próprio template.
+    """
+    if template and template != format_type:
+        if '_' in template:
+            # O nome do template já inclui o formato, usar como está
+            return template
+        # Adicionar o formato como prefixo
+        return f"{format_type}_{template}"
+    # Sem template explícito, o próprio formato é o template padrão
+    return format_type
+
+def get_extension(format_type):
+    return '.pdf' if format_type.startswith('pdf') else '.docx'
+
+def get_mimetype(format_type):
+    return MIMETYPES[get_extension(format_type)]
+
+def get_output_filename(data, language, format_type):
+    """Nome de arquivo sugerido para o documento, com a extensão correta."""
+    return get_renderer(format_type).get_output_filename(data, language)
+
+def render_resume(data, language, format_type, template=None, output=None, compact=False):
+    """Gera o currículo para `data` e grava em `output` (caminho ou buffer).
+
+    `compact` pede o modo compacto dos PDFs (ignorado no DOCX, que já é um ZIP).
+    Retorna o destino usado pelo gerador.
+    """
+    renderer = get_renderer(format_type)
+    template_name = resolve_template(format_type, template)
+    if compact and get_extension(format_type) == '.pdf':
+        return renderer.render(data, language, template_name, output, compact=True)
+    return renderer.render(data, language, template_name, output)
+
+def get_template_version(template_name):
+    """Versão do arquivo do template (mtime e tamanho), usada para invalidar caches."""
+    return TemplateManager().get_template_version(template_name)
+
+def render_bytes(data, language, format_type, template=None, compact=False):
+    """Gera o currículo em memória e retorna o conteúdo do documento."""
+    buffer = BytesIO()
+    render_resume(data, language, format_type, template, buffer, compact)
+    return buffer.getvalue()
+
+def cache_key(data, language, format_type, template=None, compact=False):
+    """Chave do cache de renderização para este pedido."""
+    template_name = resolve_template(format_type, template)
+    version = get_template_version(template_name)
+    if compact and get_extension(format_type) == '.pdf':
+        # Documentos compactos e normais do mesmo currículo ficam em entradas separadas
+        version = f"{version}-compact"
+    # A forma normalizada ignora sinônimos de chaves e campos que não aparecem no documento
+    return render_cache.make_key(normalize(data).to_dict(), language, format_type, template_name, version)
+
+def render_cached(cache, data, language, format_type, template=None, render=None, compact=False):
+    """Como `render_bytes`, mas reaproveita documentos idênticos já gerados em `cache`.
+
+    `render` permite trocar a função que gera o documento em caso de falta no cache
+    (por exemplo, a de um pool de processos); por padrão usa `render_bytes`.
+    """
+    render = render or render_bytes
+    key = cache_key(data, language, format_type, template, compact)
+    return cache.get_or_render(key, lambda: render(data, language, format_type, template, compact=compact))
+
+def size_report(data, language, targets):
+    """Tamanho de cada PDF gerado no modo normal e no compacto.
+
+    `targets` é uma lista de (formato, template); formatos que não são PDF são ignorados.
+    """
+    resume = normalize(data)
+    report = []
+    for format_type, template in targets:
+        if get_extension(format_type) != '.pdf':
+            continue
+        normal = len(render_bytes(resume, language, format_type, template))
+        compact = len(render_bytes(resume, language, format_type, template, compact=True))
+        report.append(compact_pdf.size_row(normal, compact, language=language, format=format_type,
+                                           template=resolve_template(format_type, template)))
+    return report
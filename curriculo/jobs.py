@@ -0,0 +1,182 @@
+"""
+Trabalhos de renderização assíncronos compartilhados entre processos.
+O estado de cada trabalho fica em uma tabela do índice SQLite do armazenamento de
+downloads (`curriculo/download_store.py`) e o documento gerado é gravado no próprio
+spool de downloads, de modo que qualquer worker do gunicorn responda às consultas de
+um trabalho criado por outro. Nenhum documento fica em memória: o espaço ocupado
+pelos resultados é limitado pela cota do armazenamento de downloads. Só o worker que
+criou o trabalho guarda o Future do pool, até a renderização terminar.
+"""
+import sqlite3
+import threading
+import time
+import uuid
+
+# Tempo de vida padrão de um trabalho concluído, em segundos
+DEFAULT_TTL = 10 * 60
+
+# Tempo máximo padrão para um trabalho terminar; depois disso ele é dado como perdido
+# (por exemplo, se o worker que o criou foi reiniciado)
+DEFAULT_TIMEOUT = 5 * 60
+
+class Job:
+    __slots__ = ('id', 'filename', 'mimetype', 'status', 'file_id', 'size', 'error',
+                 'created_at', 'finished_at')
+
+    def __init__(self, job_id, filename, mimetype, status='queued', file_id=None, size=None,
+                 error=None, created_at=None, finished_at=None):
+        self.id = job_id
+        self.filename = filename
+        self.mimetype = mimetype
+        self.status = status
+        self.file_id = file_id
+        self.size = size
+        self.error = error
+        self.created_at = created_at if created_at is not None else time.time()
+        self.finished_at = finished_at
+
+    def to_dict(self):
+        end = self.finished_at or time.time()
+        return {
+            'job_id': self.id,
+            'status': self.status,
+            'filename': self.filename,
+            'created_at': self.created_at,
+            'finished_at': self.finished_at,
+            'elapsed_seconds': round(end - self.created_at, 4),
+            'size': self.size,
+            'error': self.error,
+        }
+
+class JobStore:
+    def __init__(self, download_store, ttl=DEFAULT_TTL, timeout=DEFAULT_TIMEOUT):
+        self.download_store = download_store
+        self.ttl = ttl
+        self.timeout = timeout
+        self._local = threading.local()
+        # id do trabalho -> Future dos trabalhos criados por este processo e ainda em andamento
+        self._futures = {}
+        self._lock = threading.Lock()
+        with self._connect() as conn:
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id TEXT PRIMARY KEY,
+                    filename TEXT NOT NULL,
+                    mimetype TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    file_id TEXT,
+                    size INTEGER,
+                    error TEXT,
+                    created_at REAL NOT NULL,
+                    finished_at REAL
+                )
+            ''')
+
+    def _connect(self):
+        # Mesmo banco do índice de downloads; uma conexão por thread
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.download_store.index_path, timeout=10)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        return conn
+
+    def _purge_expired(self):
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute('DELETE FROM jobs WHERE finished_at IS NOT NULL AND finished_at < ?', (now - self.ttl,))
+            # Trabalhos que nunca terminaram (worker reiniciado no meio da renderização)
+            conn.execute('DELETE FROM jobs WHERE finished_at IS NULL AND created_at < ?',
+                         (now - self.timeout - self.ttl,))
+
+    def create(self, filename, mimetype):
+        job = Job(uuid.uuid4().hex, filename, mimetype)
+        self._purge_expired()
+        with self._connect() as conn:
+            conn.execute('INSERT INTO jobs (id, filename, mimetype, status, created_at) VALUES (?, ?, ?, ?, ?)',
+                         (job.id, job.filename, job.mimetype, job.status, job.created_at))
+        return job
+
+    def finish(self, job, result=None, error=None):
+        """Conclui o trabalho: o documento vai para o spool de downloads, o estado para o banco."""
+        file_id = None
+        if error is None:
+            try:
+                file_id = self.download_store.put(result, job.filename, job.mimetype)
+            except ValueError as e:
+                error = str(e)
+        job.file_id = file_id
+        job.size = len(result) if file_id is not None else None
+        job.error = error
+        job.status = 'error' if error is not None else 'done'
+        job.finished_at = time.time()
+        with self._connect() as conn:
+            conn.execute('UPDATE jobs SET status = ?, file_id = ?, size = ?, error = ?, finished_at = ? WHERE id = ?',
+                         (job.status, job.file_id, job.size, job.error, job.finished_at, job.id))
+
+    def attach(self, job, future, on_result=None):
+        """Associa o Future da renderização ao trabalho.
+
+        `on_result(bytes)` é chamado quando o documento fica pronto (por exemplo,
+        para guardá-lo no cache de renderização).
+        """
+        with self._lock:
+            self._futures[job.id] = future
+
+        def done(f):
+            with self._lock:
+                self._futures.pop(job.id, None)
+            try:
+                if f.cancelled():
+                    self.finish(job, error='Trabalho cancelado')
+                    return
+                error = f.exception()
+                if error is not None:
+                    self.finish(job, error=str(error))
+                    return
+                result = f.result()
+                self.finish(job, result=result)
+                if on_result is not None:
+                    on_result(result)
+            except Exception as e:
+                print(f"Erro ao concluir o trabalho {job.id}: {str(e)}")
+
+        future.add_done_callback(done)
+
+    def get(self, job_id):
+        """Trabalho com o estado atual, ou None se não existir ou tiver expirado."""
+        # Só leitura: as consultas de estado não disputam a trava de escrita do banco
+        row = self._connect().execute(
+            'SELECT id, filename, mimetype, status, file_id, size, error, created_at, finished_at FROM jobs WHERE id = ?',
+            (job_id,),
+        ).fetchone()
+        if row is None:
+            return None
+        job = Job(*row)
+        if job.finished_at is not None and time.time() - job.finished_at > self.ttl:
+            return None
+        if job.status == 'queued':
+            with self._lock:
+                future = self._futures.get(job_id)
+            if future is not None and future.running():
+                # O Future deste processo sabe quando o pool começou a trabalhar no pedido
+                job.status = 'running'
+            elif time.time() - job.created_at > self.timeout:
+                job.status = 'error'
+                job.error = 'A geração do currículo não terminou a tempo'
+        return job
+
+    def open_result(self, job):
+        """(arquivo aberto, nome, tipo MIME) do documento de um trabalho concluído, ou None."""
+        if job.file_id is None:
+            return None
+        return self.download_store.open(job.file_id)
+
+    def stats(self):
+        self._purge_expired()
+        counts = dict(self._connect().execute('SELECT status, COUNT(*) FROM jobs GROUP BY status').fetchall())
+        with self._lock:
+            in_flight = len(self._futures)
+        return {'jobs': sum(counts.values()), 'by_status': counts, 'in_flight': in_flight,
+                'ttl': self.ttl, 'timeout': self.timeout}
@@ -0,0 +1,168 @@
+"""
+Extração de palavras-chave do currículo (usada pelo template ATS).
+O texto é dividido por expressões regulares pré-compiladas que preservam termos
+técnicos (C#, Node.js, .NET, CI/CD). As stopwords vêm da tabela do idioma do
+currículo e sequências de nomes próprios/termos técnicos viram expressões de várias
+palavras ("AWS Lambda", "Spring Boot"). Todas as seções relevantes são lidas, cada
+uma com o seu peso, e as mais relevantes são escolhidas com um heap (top-k), sem
+ordenar a lista inteira.
+"""
+import heapq
+import re
+from collections import Counter
+from functools import lru_cache
+
+from curriculo.stopwords import get_stopwords
+
+DEFAULT_MIN_LENGTH = 4
+DEFAULT_TOP_K = 20
+
+# Número máximo de palavras de uma expressão; sequências maiores contam palavra a palavra
+MAX_PHRASE_WORDS = 3
+
+# Textos com até este número de palavras são nomes (habilidades, certificações, cargos),
+# não frases: a primeira palavra em maiúscula pode iniciar uma expressão
+SHORT_TEXT_WORDS = 6
+
+# Peso de cada seção na contagem
+SECTION_WEIGHTS = {
+    'summary': 1.0,
+    'experience': 1.0,
+    'skills': 2.0,
+    'certifications': 1.5,
+}
+
+# Palavra, com pontuação interna de termos técnicos (Node.js, CI/CD, C++, .NET, back-end)
+_TOKEN_RE = re.compile(r'\.?\w+(?:[.+#/&-]\w+)*[+#]*')
+# Só espaços entre duas palavras: elas podem formar uma expressão
+_GAP_RE = re.compile(r'[ \t]+')
+# Pontuação que encerra uma frase
+_SENTENCE_END_RE = re.compile(r'[.!?;:\n]')
+# Termos técnicos, aceitos mesmo se curtos: C#, C++, .NET, Node.js, CI/CD
+_TECHNICAL_RE = re.compile(r'[#+]|\w[./]\w|^\.\w')
+
+class Term:
+    """Contagem de um termo: pontuação, primeira posição e as grafias encontradas."""
+    __slots__ = ('key', 'first', 'score', 'forms')
+
+    def __init__(self, key, first):
+        self.key = key
+        self.first = first
+        self.score = 0.0
+        self.forms = Counter()
+
+    @property
+    def form(self):
+        """Grafia mais frequente (a primeira encontrada, em caso de empate)."""
+        return self.forms.most_common(1)[0][0]
+
+def _has_letter(token):
+    return any(char.isalpha() for char in token)
+
+def _is_technical(token):
+    return (len(token) > 1 and token.isupper()) or _TECHNICAL_RE.search(token) is not None
+
+def _is_name(token):
+    """Nome próprio ou termo técnico, que pode fazer parte de uma expressão."""
+    return token[0].isupper() or _is_technical(token)
+
+class KeywordExtractor:
+    def __init__(self, language=None, min_length=DEFAULT_MIN_LENGTH):
+        self.language = language
+        self.stopwords = get_stopwords(language)
+        self.min_length = min_length
+
+    def is_keyword(self, token):
+        """Palavra isolada aceita como palavra-chave (longa o bastante ou técnica)."""
+        return len(token) >= self.min_length or _is_technical(token)
+
+    def terms(self, text):
+        """Termos do texto, na ordem: expressões de várias palavras e palavras isoladas."""
+        run = []
+        matches = list(_TOKEN_RE.finditer(text))
+        short = len(matches) <= SHORT_TEXT_WORDS
+        previous_end = None
+        for match in matches:
+            token = match.group()
+            if previous_end is None:
+                adjacent, sentence_start = False, True
+            else:
+                adjacent = _GAP_RE.fullmatch(text, previous_end, match.start()) is not None
+                sentence_start = _SENTENCE_END_RE.search(text, previous_end, match.start()) is not None
+            previous_end = match.end()
+
+            if not _has_letter(token) or (token.lower() in self.stopwords and not _is_technical(token)):
+                yield from self._flush(run)
+                continue
+            # Em frases, a maiúscula do início não indica um nome ("Built AWS Lambda")
+            if _is_name(token) and (short or not sentence_start or _is_technical(token)):
+                if run and not adjacent:
+                    yield from self._flush(run)
+                run.append(token)
+                continue
+            yield from self._flush(run)
+            if self.is_keyword(token):
+                yield token
+        yield from self._flush(run)
+
+    def _flush(self, run):
+        if 1 < len(run) <= MAX_PHRASE_WORDS:
+            yield ' '.join(run)
+        else:
+            for token in run:
+                if self.is_keyword(token):
+                    yield token
+        run.clear()
+
+    def count(self, texts):
+        """Pontuação de cada termo em `texts` (textos ou pares (texto, peso)).
+
+        Uma expressão pontua pelo seu número de palavras a cada ocorrência.
+        """
+        counts = {}
+        position = 0
+        for text in texts:
+            text, weight = (text, 1.0) if isinstance(text, str) else text
+            for term in self.terms(text):
+                key = term.casefold()
+                entry = counts.get(key)
+                if entry is None:
+                    entry = counts[key] = Term(key, position)
+                entry.score += weight * (term.count(' ') + 1)
+                entry.forms[term] += 1
+                position += 1
+        return counts
+
+    def extract(self, texts, top_k=DEFAULT_TOP_K):
+        """As `top_k` palavras-chave mais relevantes, da maior para a menor pontuação."""
+        counts = self.count(texts)
+        top = heapq.nlargest(top_k, counts.values(), key=lambda term: (term.score, -term.first))
+        return [term.form for term in top]
+
+@lru_cache(maxsize=None)
+def get_extractor(language=None, min_length=DEFAULT_MIN_LENGTH):
+    """Extrator compartilhado para o idioma (as tabelas são montadas uma única vez)."""
+    return KeywordExtractor(language, min_length)
+
+def resume_texts(resume):
+    """Pares (texto, peso) de todas as seções do currículo normalizado que contam para as palavras-chave."""
+    if resume.summary and resume.summary.content:
+        yield resume.summary.content, SECTION_WEIGHTS['summary']
+    if resume.experience:
+        weight = SECTION_WEIGHTS['experience']
+        for job in resume.experience.items:
+            for text in (job.position, job.company):
+                if text:
+                    yield text, weight
+            for item in job.description:
+                yield item, weight
+    if resume.skills:
+        for skill in resume.skills.items:
+            yield skill.name, SECTION_WEIGHTS['skills']
+    if resume.certifications:
+        for cert in resume.certifications.items:
+            yield cert, SECTION_WEIGHTS['certifications']
+
+# Função que extrai as palavras-chave de um currículo normalizado no idioma informado
+def extract_keywords(resume, language=None, top_k=DEFAULT_TOP_K):
+    return get_extractor(language).extract(resume_texts(resume), top_k)
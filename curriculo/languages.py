@@ -0,0 +1,107 @@
+"""
+Registro de idiomas disponíveis (arquivos curriculo_XX.json).
+Os metadados de cada idioma são lidos uma vez e só são relidos quando o arquivo
+muda (mtime ou tamanho). A lista de arquivos só é refeita quando o próprio
+diretório muda, então uma consulta normal custa apenas alguns `stat`.
+Usado pelos scripts de linha de comando (cv-generator.py, curriculo_pdf.py...); a
+interface web lista os idiomas de cada usuário a partir do banco de currículos
+(`curriculo/resume_store.py`).
+"""
+import glob
+import json
+import os
+import threading
+
+class LanguageRegistry:
+    def __init__(self, root_dir):
+        self.root_dir = root_dir
+        self._lock = threading.Lock()
+        self._dir_signature = None
+        self._files = []
+        # Caminho do arquivo -> {'code', 'name', 'file', 'signature', 'data'}
+        self._entries = {}
+
+    @staticmethod
+    def _signature(stat):
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _refresh(self):
+        # Deve ser chamado com o lock adquirido
+        try:
+            dir_signature = os.stat(self.root_dir).st_mtime_ns
+        except FileNotFoundError:
+            self._files, self._entries = [], {}
+            return
+        if dir_signature != self._dir_signature:
+            # Arquivos foram criados, removidos ou renomeados: refazer a lista
+            self._files = sorted(glob.glob(os.path.join(self.root_dir, 'curriculo_*.json')))
+            self._entries = {path: entry for path, entry in self._entries.items() if path in self._files}
+            self._dir_signature = dir_signature
+
+        for path in self._files:
+            try:
+                signature = self._signature(os.stat(path))
+            except FileNotFoundError:
+                self._entries.pop(path, None)
+                continue
+            entry = self._entries.get(path)
+            if entry is not None and entry['signature'] == signature:
+                continue
+            self._entries[path] = self._load(path, signature)
+
+    def _load(self, path, signature):
+        # Extrair o código do idioma do nome do arquivo (curriculo_XX.json -> XX)
+        lang_code = os.path.basename(path).replace('curriculo_', '').replace('.json', '')
+        entry = {'code': lang_code, 'name': None, 'file': path, 'signature': signature, 'data': None}
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            # Nome do idioma na própria língua, ou o código como fallback
+            entry['name'] = data.get('languageName') or lang_code.upper()
+            entry['data'] = data
+        except Exception as e:
+            # Arquivo inválido: fica registrado (para não ser relido à toa), mas não é listado
+            print(f"Erro ao carregar {path}: {str(e)}")
+        return entry
+
+    def get_languages(self):
+        """Dicionário {código: {'name', 'file'}} com os idiomas válidos."""
+        with self._lock:
+            self._refresh()
+            return {
+                entry['code']: {'name': entry['name'], 'file': entry['file']}
+                for entry in self._entries.values()
+                if entry['data'] is not None
+            }
+
+    def get(self, lang_code):
+        """Metadados de um idioma ({'name', 'file'}) ou None."""
+        return self.get_languages().get(lang_code)
+
+    def load(self, lang_code):
+        """Conteúdo já analisado do JSON de um idioma, ou None.
+
+        O dicionário retornado é compartilhado pelo cache e não deve ser modificado.
+        """
+        with self._lock:
+            self._refresh()
+            for entry in self._entries.values():
+                if entry['code'] == lang_code:
+                    return entry['data']
+        return None
+
+_registries = {}
+_registries_lock = threading.Lock()
+
+def get_registry(root_dir=None):
+    """Registro compartilhado para um diretório (padrão: diretório atual)."""
+    root_dir = os.path.abspath(root_dir or os.getcwd())
+    with _registries_lock:
+        registry = _registries.get(root_dir)
+        if registry is None:
+            registry = _registries[root_dir] = LanguageRegistry(root_dir)
+        return registry
+
+# Função para listar idiomas disponíveis
+def get_available_languages(root_dir=None):
+    return get_registry(root_dir).get_languages()
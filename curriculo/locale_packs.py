@@ -0,0 +1,123 @@
+"""
+Pacotes de idioma (locale packs): rótulos, nomes dos níveis de habilidade, títulos das
+seções e stopwords de cada idioma, em `curriculo/locales/<código>.json`.
+Cada pacote é lido uma única vez por processo, na primeira consulta, e convertido em
+tabelas prontas (tupla de níveis indexada pelo nível, frozensets de palavras), de modo
+que nenhuma renderização precisa de if/elif por idioma. Para adicionar um idioma basta
+criar o arquivo JSON; chaves ausentes vêm do pacote padrão (português), exceto as
+stopwords, que caem na união de todos os pacotes.
+"""
+import glob
+import json
+import os
+import re
+import threading
+
+LOCALES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'locales')
+DEFAULT_LOCALE = 'pt'
+
+# Códigos aceitos como nome de arquivo: "pt", "en", "pt-br", "pt_BR"...
+_CODE_RE = re.compile(r'^[a-z]{2,3}(?:[-_][a-z0-9]{2,8})?$')
+
+def _words(lines):
+    """Palavras de uma lista de linhas separadas por espaço (formato das listas no JSON)."""
+    return frozenset(word for line in lines for word in line.split())
+
+class LocalePack:
+    """Tabelas de um idioma, montadas uma vez a partir do JSON."""
+    __slots__ = ('code', 'name', 'labels', 'level_names', 'default_level_name',
+                 'section_titles', 'stopwords', 'job_posting')
+
+    def __init__(self, code, data, base=None):
+        self.code = code
+        self.name = data.get('name') or code.upper()
+        self.labels = {**(base.labels if base else {}), **data.get('labels', {})}
+        self.section_titles = {**(base.section_titles if base else {}), **data.get('sections', {})}
+        if data.get('levels'):
+            levels = tuple(data['levels'])
+            # Índice 0 sem uso: o nível 1 é level_names[1]
+            self.level_names = ('',) + levels
+            default = data.get('default_level', (len(levels) + 1) // 2)
+            self.default_level_name = self.level_names[default]
+        else:
+            self.level_names = base.level_names if base else ('',)
+            self.default_level_name = base.default_level_name if base else ''
+        self.stopwords = _words(data['stopwords']) if 'stopwords' in data else None
+        self.job_posting = _words(data['job_posting']) if 'job_posting' in data else None
+
+    def level_text(self, level):
+        """Nome do nível de habilidade (o nível padrão para valores fora da escala)."""
+        if isinstance(level, int) and 0 < level < len(self.level_names):
+            return self.level_names[level]
+        return self.default_level_name
+
+_packs = {}
+_packs_lock = threading.Lock()
+_all_words = {}
+
+def is_valid_locale_code(code):
+    """Código de idioma aceito ("pt", "en", "pt-BR"...); também é seguro como parte de um nome de arquivo."""
+    return isinstance(code, str) and _CODE_RE.match(code.lower()) is not None
+
+def _normalize_code(code):
+    code = (code or '').strip().lower()
+    return code if _CODE_RE.match(code) else None
+
+def _load(code):
+    # Deve ser chamado com o lock adquirido; None se o idioma não tiver pacote
+    if code in _packs:
+        return _packs[code]
+    path = os.path.join(LOCALES_DIR, f'{code}.json')
+    if not os.path.exists(path):
+        # Idioma sem pacote: não fica no cache, para que um pacote novo seja encontrado
+        return None
+    pack = None
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        base = _load(DEFAULT_LOCALE) if code != DEFAULT_LOCALE else None
+        pack = LocalePack(code, data, base)
+    except Exception as e:
+        # Pacote inválido: fica registrado como ausente (para não ser relido à toa)
+        print(f"Erro ao carregar o pacote de idioma {path}: {str(e)}")
+    _packs[code] = pack
+    return pack
+
+def find_locale_pack(code):
+    """Pacote do idioma ("pt-BR" também encontra "pt"), ou None se não houver."""
+    code = _normalize_code(code)
+    if code is None:
+        return None
+    with _packs_lock:
+        pack = _load(code)
+        if pack is None and len(code) > 2:
+            pack = _load(code[:2])
+        return pack
+
+def get_locale_pack(code):
+    """Pacote do idioma, ou o pacote padrão (português) se o idioma não tiver um."""
+    pack = find_locale_pack(code)
+    if pack is None:
+        with _packs_lock:
+            pack = _load(DEFAULT_LOCALE)
+    return pack
+
+def get_locale_codes():
+    """Códigos de todos os pacotes de idioma disponíveis."""
+    return sorted(os.path.splitext(os.path.basename(path))[0]
+                  for path in glob.glob(os.path.join(LOCALES_DIR, '*.json')))
+
+def get_all_words(field):
+    """União de um conjunto de palavras ('stopwords' ou 'job_posting') de todos os pacotes."""
+    with _packs_lock:
+        words = _all_words.get(field)
+        if words is not None:
+            return words
+    words = frozenset()
+    for code in get_locale_codes():
+        pack = find_locale_pack(code)
+        if pack is not None and getattr(pack, field) is not None:
+            words |= getattr(pack, field)
+    with _packs_lock:
+        _all_words[field] = words
+    return words
@@ -0,0 +1,164 @@
+"""
+Comparação de um currículo com a descrição de uma vaga.
+Os termos e expressões do currículo (os mesmos da extração de palavras-chave do
+template ATS) ficam em um índice invertido, montado uma vez por currículo e guardado
+em cache. Cada passagem do currículo (resumo, cada item de experiência, cada
+habilidade, cada certificação) e cada frase da vaga contam como um documento para o
+IDF, de modo que termos genéricos, presentes em toda parte, pesam menos que termos
+específicos. A vaga é pontuada por BM25 (padrão) ou pela similaridade de cosseno
+TF-IDF, e o resultado traz os termos encontrados e os termos importantes ausentes.
+"""
+import hashlib
+import heapq
+import math
+import re
+import threading
+from collections import Counter, OrderedDict
+
+from curriculo.keywords import get_extractor, resume_texts
+from curriculo.model import normalize
+from curriculo.render_cache import canonical_json
+from curriculo.stopwords import get_job_posting_words
+
+METHODS = ('bm25', 'tfidf')
+DEFAULT_METHOD = 'bm25'
+DEFAULT_TOP = 15
+
+# Saturação da frequência no BM25
+BM25_K1 = 1.2
+
+# Peso de cada palavra de uma expressão ("AWS" em "AWS Lambda"), para casamentos parciais
+COMPONENT_WEIGHT = 0.5
+
+# Número de currículos cujo índice fica em cache
+INDEX_CACHE_SIZE = 32
+
+# Frases e linhas da descrição da vaga
+_PASSAGE_RE = re.compile(r'(?<=[.!?;])\s+|\n+')
+
+def expand_terms(extractor, text):
+    """(chave, grafia, explícito, fator) de cada termo do texto.
+
+    As partes de cada expressão (palavras e sub-expressões, como ".NET Core" em
+    "C# .NET Core") também são indexadas, não explícitas e com peso menor.
+    """
+    for term in extractor.terms(text):
+        yield term.casefold(), term, True, 1.0
+        if ' ' not in term:
+            continue
+        words = term.split(' ')
+        for size in range(len(words) - 1, 0, -1):
+            for start in range(len(words) - size + 1):
+                part = ' '.join(words[start:start + size])
+                if size > 1 or extractor.is_keyword(part):
+                    yield part.casefold(), part, False, COMPONENT_WEIGHT
+
+class ResumeIndex:
+    """Índice invertido dos termos de um currículo: termo -> {passagem: frequência ponderada}."""
+
+    def __init__(self, resume, language=None):
+        self.language = language
+        self.extractor = get_extractor(language)
+        self.postings = {}
+        self.forms = {}
+        self.passages = 0
+        for text, weight in resume_texts(resume):
+            passage = self.passages
+            self.passages += 1
+            for key, form, explicit, factor in expand_terms(self.extractor, text):
+                posting = self.postings.setdefault(key, {})
+                posting[passage] = posting.get(passage, 0.0) + weight * factor
+                if explicit:
+                    self.forms.setdefault(key, form)
+        # Frequência de cada termo no currículo inteiro
+        self.tf = {key: sum(posting.values()) for key, posting in self.postings.items()}
+
+class JobDescription:
+    """Termos da descrição de uma vaga: frequência, frequência por frase e grafia.
+
+    O vocabulário comum de anúncios ("experiência", "requisitos"...) é ignorado.
+    """
+
+    def __init__(self, text, extractor, language=None):
+        ignored = get_job_posting_words(language)
+        self.tf = Counter()
+        self.df = Counter()
+        self.forms = {}
+        self.passages = 0
+        for passage in _PASSAGE_RE.split(text):
+            if not passage or not passage.strip():
+                continue
+            self.passages += 1
+            seen = set()
+            for key, form, explicit, factor in expand_terms(extractor, passage):
+                if key in ignored:
+                    continue
+                self.tf[key] += factor
+                seen.add(key)
+                if explicit:
+                    self.forms.setdefault(key, form)
+            self.df.update(seen)
+
+def _idf(index, job, key, total):
+    df = len(index.postings.get(key, ())) + job.df[key]
+    return math.log(1.0 + (total - df + 0.5) / (df + 0.5))
+
+def score(index, job, method=DEFAULT_METHOD, top=DEFAULT_TOP):
+    """Pontua a vaga contra o índice do currículo (0 a 100), com os termos encontrados e ausentes."""
+    if method not in METHODS:
+        raise ValueError(f"Método desconhecido: {method}. Use: {', '.join(METHODS)}")
+    total = index.passages + job.passages
+    idf = {key: _idf(index, job, key, total) for key in job.tf}
+    # Peso de cada termo da vaga
+    weights = {key: math.log1p(tf) * idf[key] for key, tf in job.tf.items()}
+
+    if method == 'bm25':
+        # O currículo é um único documento: sem normalização pelo tamanho (b = 0)
+        gained = sum(weight * index.tf[key] / (index.tf[key] + BM25_K1)
+                     for key, weight in weights.items() if key in index.tf)
+        possible = sum(weights.values())
+        value = gained / possible if possible else 0.0
+    else:
+        resume_vector = {key: math.log1p(tf) * (idf[key] if key in idf else _idf(index, job, key, total))
+                         for key, tf in index.tf.items()}
+        dot = sum(weight * resume_vector[key] for key, weight in weights.items() if key in resume_vector)
+        norm = math.sqrt(sum(w * w for w in weights.values())) * math.sqrt(sum(w * w for w in resume_vector.values()))
+        value = dot / norm if norm else 0.0
+
+    explicit = [key for key in weights if key in job.forms]
+    matched = sorted((key for key in explicit if key in index.tf), key=lambda key: -weights[key])
+    missing = heapq.nlargest(top, (key for key in explicit if key not in index.tf), key=lambda key: weights[key])
+    return {
+        'method': method,
+        'score': round(100.0 * value, 1),
+        'matched': [{'term': index.forms.get(key, job.forms[key]), 'weight': round(weights[key], 3)}
+                    for key in matched],
+        'missing': [{'term': job.forms[key], 'weight': round(weights[key], 3)} for key in missing],
+    }
+
+_index_cache = OrderedDict()
+_index_cache_lock = threading.Lock()
+
+def get_resume_index(data, language=None):
+    """Índice do currículo (JSON ou `Resume`), montado uma vez para cada conteúdo e idioma."""
+    resume = normalize(data)
+    key = hashlib.sha256(f"{language}:{canonical_json(resume.to_dict())}".encode('utf-8')).hexdigest()
+    with _index_cache_lock:
+        index = _index_cache.get(key)
+        if index is not None:
+            _index_cache.move_to_end(key)
+            return index
+    index = ResumeIndex(resume, language)
+    with _index_cache_lock:
+        _index_cache[key] = index
+        while len(_index_cache) > INDEX_CACHE_SIZE:
+            _index_cache.popitem(last=False)
+    return index
+
+# Função que compara um currículo com a descrição de uma vaga
+def match(data, language, job_description, method=DEFAULT_METHOD, top=DEFAULT_TOP):
+    if not job_description or not job_description.strip():
+        raise ValueError("Descrição da vaga vazia")
+    index = get_resume_index(data, language)
+    job = JobDescription(job_description, index.extractor, language)
+    return score(index, job, method, top)
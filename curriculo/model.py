@@ -0,0 +1,241 @@
+"""
+Modelo normalizado de currículo.
+Os arquivos curriculo_XX.json usam chaves diferentes em cada idioma (nome/name/nombre,
+secoes/sections/secciones...). `normalize` resolve todos esses sinônimos em uma única
+passada, usando um índice pré-calculado, e produz objetos compactos consumidos por
+todos os geradores. `Resume.to_dict()` é a forma canônica usada pelos caches.
+"""
+
+# Sinônimos aceitos para cada campo, em ordem de preferência
+TOP_LEVEL_ALIASES = {
+    'name': ['nome', 'name', 'nombre'],
+    'email': ['email'],
+    'phone': ['telefone', 'phone', 'telefono', 'teléfono'],
+    'linkedin': ['linkedin'],
+    'output_filename': ['nomeArquivoSaida', 'outputFileName', 'nombreArchivoSalida'],
+    'sections': ['secoes', 'sections', 'secciones', 'sektionen'],
+}
+
+SECTION_ALIASES = {
+    'summary': ['resumoProfissional', 'professionalSummary', 'resumenProfesional', 'resumentProfessionnel'],
+    'experience': ['experienciaProfissional', 'workExperience', 'experienciaLaboral', 'experienceProfessionnelle'],
+    'skills': ['habilidadesTecnicas', 'technicalSkills', 'competencesTechniques'],
+    'certifications': ['certificacoes', 'certifications', 'certificaciones'],
+    'education': ['educacao', 'education', 'educacion'],
+    'in_progress': ['emAndamento', 'inProgress', 'enProgreso', 'enCours'],
+}
+
+# Campos dentro de uma seção: título, texto e as listas de cada tipo de seção
+SECTION_FIELD_ALIASES = {
+    'title': ['titulo', 'title', 'titre', 'titel'],
+    'content': ['conteudo', 'content', 'contenido', 'inhalt'],
+    'jobs': ['empregos', 'jobs', 'empleos', 'emplois'],
+    'skills': ['habilidades', 'skills', 'competencias', 'competences'],
+    'list': ['lista', 'list', 'liste'],
+    'degrees': ['formacao', 'degrees', 'formacion', 'diplomes'],
+    'courses': ['cursos', 'courses', 'cours'],
+}
+
+JOB_ALIASES = {
+    'position': ['cargo', 'position'],
+    'company': ['empresa', 'company'],
+    'period': ['periodo', 'period'],
+    'description': ['descricao', 'description', 'descripcion'],
+}
+
+SKILL_ALIASES = {
+    'name': ['nome', 'name', 'nombre'],
+    'level': ['nivel', 'level'],
+}
+
+# Campo de lista usado por cada seção de itens simples
+SECTION_LIST_FIELDS = {
+    'certifications': 'list',
+    'education': 'degrees',
+    'in_progress': 'courses',
+}
+
+def build_alias_index(aliases):
+    """Converte {campo: [sinônimos]} em {sinônimo: (campo, prioridade)}."""
+    index = {}
+    for field, keys in aliases.items():
+        for rank, key in enumerate(keys):
+            index.setdefault(key, (field, rank))
+    return index
+
+_TOP_LEVEL_INDEX = build_alias_index(TOP_LEVEL_ALIASES)
+_SECTION_INDEX = build_alias_index(SECTION_ALIASES)
+_SECTION_FIELD_INDEX = build_alias_index(SECTION_FIELD_ALIASES)
+_JOB_INDEX = build_alias_index(JOB_ALIASES)
+_SKILL_INDEX = build_alias_index(SKILL_ALIASES)
+
+def resolve_fields(data, index):
+    """Percorre as chaves de `data` uma única vez e retorna {campo: valor}.
+
+    Se mais de um sinônimo do mesmo campo estiver presente, vence o de maior
+    prioridade (o primeiro da lista de sinônimos).
+    """
+    fields = {}
+    ranks = {}
+    for key, value in data.items():
+        match = index.get(key)
+        if match is None:
+            continue
+        field, rank = match
+        if field not in ranks or rank < ranks[field]:
+            fields[field] = value
+            ranks[field] = rank
+    return fields
+
+class Header:
+    __slots__ = ('name', 'email', 'phone', 'linkedin')
+
+    def __init__(self, name, email, phone, linkedin):
+        self.name = name
+        self.email = email
+        self.phone = phone
+        self.linkedin = linkedin
+
+    def to_dict(self):
+        return {'name': self.name, 'email': self.email, 'phone': self.phone, 'linkedin': self.linkedin}
+
+class Job:
+    __slots__ = ('position', 'company', 'period', 'description')
+
+    def __init__(self, position, company, period, description):
+        self.position = position
+        self.company = company
+        self.period = period
+        # Tupla de itens já limpos (sem espaços e sem itens vazios)
+        self.description = description
+
+    def to_dict(self):
+        return {
+            'position': self.position,
+            'company': self.company,
+            'period': self.period,
+            'description': list(self.description),
+        }
+
+class Skill:
+    __slots__ = ('name', 'level')
+
+    def __init__(self, name, level):
+        self.name = name
+        self.level = level
+
+    def to_dict(self):
+        return {'name': self.name, 'level': self.level}
+
+class Section:
+    """Seção do currículo: título e, conforme o tipo, um texto ou uma tupla de itens."""
+    __slots__ = ('title', 'content', 'items')
+
+    def __init__(self, title, content='', items=()):
+        self.title = title
+        self.content = content
+        self.items = items
+
+    def to_dict(self):
+        items = [item.to_dict() if hasattr(item, 'to_dict') else item for item in self.items]
+        return {'title': self.title, 'content': self.content, 'items': items}
+
+class Resume:
+    __slots__ = ('header', 'output_filename', 'summary', 'experience', 'skills',
+                 'certifications', 'education', 'in_progress')
+
+    SECTIONS = ('summary', 'experience', 'skills', 'certifications', 'education', 'in_progress')
+
+    def __init__(self, header, output_filename=None, summary=None, experience=None, skills=None,
+                 certifications=None, education=None, in_progress=None):
+        self.header = header
+        self.output_filename = output_filename
+        # Cada seção é um Section, ou None se não existir no JSON
+        self.summary = summary
+        self.experience = experience
+        self.skills = skills
+        self.certifications = certifications
+        self.education = education
+        self.in_progress = in_progress
+
+    def to_dict(self):
+        result = {'header': self.header.to_dict(), 'output_filename': self.output_filename}
+        for name in self.SECTIONS:
+            section = getattr(self, name)
+            result[name] = section.to_dict() if section is not None else None
+        return result
+
+# Função para transformar a descrição de um emprego (texto ou lista) em itens
+def split_description(description):
+    if isinstance(description, str):
+        # Aceitar tanto quebras de linha reais quanto o texto "\n" digitado no editor
+        lines = description.replace('\\n', '\n').split('\n')
+        return tuple(line.strip() for line in lines if line.strip())
+    if isinstance(description, list):
+        return tuple(str(item).strip() for item in description if str(item).strip())
+    return ()
+
+def _normalize_job(job):
+    fields = resolve_fields(job, _JOB_INDEX)
+    return Job(
+        fields.get('position'),
+        fields.get('company'),
+        fields.get('period'),
+        split_description(fields.get('description')),
+    )
+
+def _normalize_skills(skills):
+    items = []
+    for skill in skills:
+        if not isinstance(skill, dict):
+            print(f"Aviso: Item de habilidade não é um dicionário: {skill}. Pulando.")
+            continue
+        fields = resolve_fields(skill, _SKILL_INDEX)
+        name, level = fields.get('name'), fields.get('level')
+        if not name or not level:
+            continue
+        try:
+            items.append(Skill(name, int(level)))
+        except (TypeError, ValueError):
+            print(f"Aviso: Nível de habilidade inválido para '{name}'. Esperado um número, recebido '{level}'. Pulando esta habilidade.")
+    return tuple(items)
+
+def _normalize_section(name, section):
+    # A seção de habilidades também pode ser diretamente a lista de habilidades
+    if name == 'skills' and isinstance(section, list):
+        return Section("N/A", items=_normalize_skills(section))
+    if not isinstance(section, dict):
+        return None
+
+    fields = resolve_fields(section, _SECTION_FIELD_INDEX)
+    title = fields.get('title', "N/A")
+    if name == 'summary':
+        return Section(title, content=fields.get('content', ""))
+    if name == 'experience':
+        return Section(title, items=tuple(_normalize_job(job) for job in fields.get('jobs', []) if isinstance(job, dict)))
+    if name == 'skills':
+        return Section(title, items=_normalize_skills(fields.get('skills', [])))
+    return Section(title, items=tuple(fields.get(SECTION_LIST_FIELDS[name], [])))
+
+def normalize(data):
+    """Converte o JSON de um currículo (em qualquer idioma) em um `Resume`.
+
+    Aceita também um `Resume` já normalizado, que é retornado como está.
+    """
+    if isinstance(data, Resume):
+        return data
+
+    if not isinstance(data, dict):
+        raise ValueError("Formato de arquivo JSON inválido. O currículo deve ser um objeto.")
+    fields = resolve_fields(data, _TOP_LEVEL_INDEX)
+    # Se não encontrarmos a chave das seções, não podemos continuar
+    if 'sections' not in fields:
+        raise ValueError("Formato de arquivo JSON inválido. A chave de seções não foi encontrada.")
+    if not isinstance(fields['sections'], dict):
+        raise ValueError("Formato de arquivo JSON inválido. As seções devem ser um objeto.")
+
+    header = Header(fields.get('name'), fields.get('email', ''), fields.get('phone'), fields.get('linkedin', ''))
+    sections = {}
+    for name, section in resolve_fields(fields['sections'], _SECTION_INDEX).items():
+        sections[name] = _normalize_section(name, section)
+    return Resume(header, fields.get('output_filename'), **sections)
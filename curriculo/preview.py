@@ -0,0 +1,203 @@
+"""
+Pré-visualização em HTML dos currículos.
+Gera, a partir do mesmo modelo normalizado usado pelos geradores, uma versão HTML/CSS
+aproximada de cada template (pdf, pdf_moderno, pdf_ats e docx). Não passa pelo
+reportlab nem pelo python-docx, por isso custa uma fração de uma renderização real e
+pode ser chamada a cada alteração no editor.
+"""
+from html import escape
+
+from curriculo import engine, render_cache
+from curriculo.locale_packs import get_locale_pack
+from curriculo.model import normalize
+
+# CSS de cada template, restrito ao contêiner da pré-visualização
+BASE_CSS = """
+.cv { max-width: 760px; margin: 0 auto; padding: 32px 48px; background: #fff; color: #000;
+      box-shadow: 0 1px 4px rgba(0,0,0,0.15); line-height: 1.3; }
+.cv h1 { margin: 0 0 8px; font-weight: normal; }
+.cv h2 { margin: 18px 0 8px; font-weight: normal; }
+.cv p { margin: 0 0 4px; }
+.cv .cv-bullet { padding-left: 20px; }
+.cv .cv-job { margin-bottom: 10px; }
+.cv .cv-page-break { border-top: 1px dashed #bbb; margin: 24px -48px; }
+.cv .cv-skill { display: flex; align-items: center; margin-bottom: 6px; }
+.cv .cv-skill-name { width: 50%; }
+.cv .cv-box { display: inline-block; width: 11px; height: 11px; margin-right: 0;
+              box-sizing: border-box; }
+"""
+
+TEMPLATE_CSS = {
+    'pdf': """
+.cv-pdf { font-family: 'Times New Roman', Times, serif; font-size: 11pt; }
+.cv-pdf h1 { font-size: 22pt; text-align: center; }
+.cv-pdf .cv-contact { margin-bottom: 6px; }
+.cv-pdf .cv-rule { border-bottom: 1px solid #000; margin-bottom: 10px; }
+.cv-pdf h2 { font-size: 14pt; }
+.cv-pdf h2 .cv-mark { color: #2F75B5; }
+.cv-pdf .cv-box { border: 0.5px solid #2F75B5; }
+.cv-pdf .cv-box.filled { background: #2F75B5; }
+""",
+    'pdf_moderno': """
+.cv-pdf_moderno { font-family: Helvetica, Arial, sans-serif; font-size: 11pt; padding-top: 0; }
+.cv-pdf_moderno .cv-band { height: 36px; background: #99CCE6; margin: 0 -48px 22px; }
+.cv-pdf_moderno h1 { font-size: 26pt; font-weight: bold; color: #1A3366; }
+.cv-pdf_moderno .cv-contact { font-size: 10pt; color: #808080; }
+.cv-pdf_moderno .cv-rule { border-bottom: 2px solid #1A3366; margin: 8px 0 14px; }
+.cv-pdf_moderno h2 { font-size: 14pt; font-weight: bold; color: #1A3366;
+                     border: 1px solid #99CCE6; border-radius: 5px; padding: 5px; }
+.cv-pdf_moderno .cv-box { width: 14px; height: 14px; border: 0.5px solid #99CCE6; background: #E6E6E6; }
+.cv-pdf_moderno .cv-box.filled { border: 1px solid #1A3366; background: #1A3366; }
+""",
+    'pdf_ats': """
+.cv-pdf_ats { font-family: Helvetica, Arial, sans-serif; font-size: 11pt; }
+.cv-pdf_ats h1 { font-size: 18pt; font-weight: bold; text-align: center; }
+.cv-pdf_ats .cv-contact { text-align: center; color: #333; }
+.cv-pdf_ats .cv-rule { border-bottom: 1px solid #808080; margin: 8px 0 14px; }
+.cv-pdf_ats h2 { font-size: 14pt; font-weight: bold; }
+.cv-pdf_ats h3 { font-size: 12pt; font-weight: bold; color: #333; margin: 8px 0 4px; }
+""",
+    'docx': """
+.cv-docx { font-family: Calibri, Carlito, Arial, sans-serif; font-size: 11pt; }
+.cv-docx h1 { font-size: 22pt; font-weight: bold; }
+.cv-docx h2 { font-size: 14pt; font-weight: bold; }
+.cv-docx h2 .cv-mark { color: #2F75B5; }
+.cv-docx .cv-description { white-space: pre-line; margin-bottom: 8px; }
+.cv-docx .cv-bar { color: #2F75B5; }
+""",
+}
+
+# Template cuja aparência a pré-visualização imita, para templates sem CSS próprio
+def get_preview_style(template_name):
+    if template_name in TEMPLATE_CSS:
+        return template_name
+    if template_name.startswith('pdf_ats'):
+        return 'pdf_ats'
+    if template_name.startswith('docx'):
+        return 'docx'
+    return 'pdf'
+
+def _text(value):
+    return escape(str(value)) if value is not None else ''
+
+def _header(style, header, labels):
+    parts = []
+    if style == 'pdf_moderno':
+        parts.append('<div class="cv-band"></div>')
+    parts.append(f'<h1>{_text(header.name)}</h1>')
+    if style == 'pdf_ats':
+        contact = (f"{labels['email']}: {_text(header.email)} | {labels['phone']}: {_text(header.phone)} | "
+                   f"{labels['linkedin']}: {_text(header.linkedin)}")
+    elif style == 'pdf_moderno':
+        contact = f"📧 {_text(header.email)} | 📱 {_text(header.phone)} | 🌐 {_text(header.linkedin)}"
+    elif style == 'docx':
+        contact = '&nbsp;&nbsp;&nbsp;'.join(
+            f"<b>{icon}</b> {_text(value)}"
+            for icon, value in (('📧', header.email), ('📱', header.phone), ('🌐', header.linkedin)) if value
+        )
+    else:
+        contact = f"📧 {_text(header.email)}&nbsp;&nbsp;&nbsp;📱 {_text(header.phone)}&nbsp;&nbsp;&nbsp;🌐 {_text(header.linkedin)}"
+    parts.append(f'<p class="cv-contact">{contact}</p>')
+    if style == 'docx':
+        parts.append('<p>' + '―' * 50 + '</p>')
+    else:
+        parts.append('<div class="cv-rule"></div>')
+    return ''.join(parts)
+
+def _section_title(style, title):
+    if style in ('pdf', 'docx'):
+        return f'<h2><span class="cv-mark">■</span> {_text(title)}</h2>'
+    return f'<h2>{_text(title)}</h2>'
+
+def _job(style, job, labels):
+    parts = ['<div class="cv-job">']
+    if style == 'pdf_ats':
+        position, company = job.position, job.company
+        # Mesma regra do gerador ATS: "Cargo - Empresa" vira dois campos
+        if not company and position and ' - ' in position:
+            position, company = [part.strip() for part in position.split(' - ', 1)]
+        parts.append(f"<h3>{labels['position']}: {_text(position)}</h3>")
+        if company:
+            parts.append(f"<p><b>{labels['company']}:</b> {_text(company)}</p>")
+        if job.period:
+            parts.append(f"<p><b>{labels['period']}:</b> {_text(job.period)}</p>")
+        if job.description:
+            parts.append(f"<p><b>{labels['description_heading']}:</b></p>")
+            parts.extend(f'<p class="cv-bullet">• {_text(item)}</p>' for item in job.description)
+    elif style == 'docx':
+        if job.position:
+            parts.append(f'<p class="cv-bullet">• {_text(job.position)}</p>')
+        if job.period:
+            parts.append(f'<p>{_text(job.period)}</p>')
+        description = ''.join(f"- {item}\n" for item in job.description)
+        parts.append(f'<p class="cv-description">{_text(description)}</p>')
+    else:
+        if job.position:
+            parts.append(f'<p class="cv-bullet">• {_text(job.position)}</p>')
+        if job.period:
+            parts.append(f'<p>{_text(job.period)}</p>')
+        parts.extend(f'<p class="cv-bullet">- {_text(item)}</p>' for item in job.description)
+    parts.append('</div>')
+    return ''.join(parts)
+
+def _skill(style, skill, language, max_level=5):
+    name = _text(skill.name)
+    if style == 'pdf_ats':
+        return f'<p>{name}: {_text(get_locale_pack(language).level_text(skill.level))}</p>'
+    if style == 'docx':
+        bar = "■" * skill.level + "□" * (max_level - skill.level)
+        return f'<p>{name}: <span class="cv-bar">{bar}</span></p>'
+    label = f"{name}:" if style == 'pdf' else name
+    boxes = ''.join(
+        f'<span class="cv-box{" filled" if i < skill.level else ""}"></span>' for i in range(max_level)
+    )
+    return f'<div class="cv-skill"><span class="cv-skill-name">{label}</span><span>{boxes}</span></div>'
+
+def render_html(data, language, template_name='pdf'):
+    """Gera a pré-visualização HTML (fragmento com o próprio CSS) de um currículo."""
+    resume = normalize(data)
+    style = get_preview_style(template_name)
+    labels = get_locale_pack(language).labels
+
+    parts = [f'<style>{BASE_CSS}{TEMPLATE_CSS[style]}</style>',
+             f'<div class="cv cv-{style}">', _header(style, resume.header, labels)]
+
+    if resume.summary:
+        parts.append(_section_title(style, resume.summary.title))
+        parts.append(f'<p>{_text(resume.summary.content)}</p>')
+
+    if resume.experience:
+        parts.append(_section_title(style, resume.experience.title))
+        parts.extend(_job(style, job, labels) for job in resume.experience.items)
+
+    # As habilidades técnicas começam em uma nova página em todos os templates
+    parts.append('<div class="cv-page-break"></div>')
+
+    if resume.skills:
+        parts.append(_section_title(style, resume.skills.title))
+        parts.extend(_skill(style, skill, language) for skill in resume.skills.items)
+
+    if resume.certifications:
+        parts.append(_section_title(style, resume.certifications.title))
+        # O template ATS usa texto simples, sem emojis
+        prefix = '' if style == 'pdf_ats' else '🏅 '
+        parts.extend(f'<p>{prefix}{_text(cert)}</p>' for cert in resume.certifications.items)
+
+    for section in (resume.education, resume.in_progress):
+        if section:
+            parts.append(_section_title(style, section.title))
+            parts.extend(f'<p>{_text(item)}</p>' for item in section.items)
+
+    if style == 'pdf_ats':
+        keywords = engine.get_renderer('pdf_ats').collect_keywords(resume, language)
+        parts.append(_section_title(style, get_locale_pack(language).section_titles['keywords']))
+        if keywords:
+            parts.append(f'<p>{_text(", ".join(keywords))}</p>')
+
+    parts.append('</div>')
+    return ''.join(parts)
+
+def preview_key(data, language, template_name):
+    """Chave de cache da pré-visualização (mesma forma canônica do cache de renderização)."""
+    return render_cache.make_key(normalize(data).to_dict(), language, 'html', template_name,
+                                 engine.get_template_version(template_name))
@@ -0,0 +1,90 @@
+"""
+Cache de documentos renderizados endereçado pelo conteúdo.
+A chave é um hash canônico do JSON do currículo, do idioma, do formato, do nome do
+template e da versão do arquivo do template. As entradas são mantidas em ordem LRU
+até um limite total de bytes.
+"""
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+
+# Limite padrão do cache: 64 MB de documentos gerados
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+def canonical_json(data):
+    """Serializa o JSON de forma determinística (chaves ordenadas, sem espaços)."""
+    return json.dumps(data, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+
+def make_key(data, language, format_type, template_name, template_version):
+    """Calcula a chave do cache para um pedido de renderização."""
+    digest = hashlib.sha256()
+    digest.update(canonical_json(data).encode('utf-8'))
+    for part in (language, format_type, template_name, template_version):
+        digest.update(b'\0')
+        digest.update(str(part).encode('utf-8'))
+    return digest.hexdigest()
+
+class RenderCache:
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        """Retorna o documento em cache (ou None), marcando-o como usado recentemente."""
+        with self._lock:
+            content = self._entries.get(key)
+            if content is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return content
+
+    def put(self, key, content):
+        """Armazena um documento, descartando os menos usados se o limite for excedido."""
+        size = len(content)
+        if size > self.max_bytes:
+            # Documento maior que o cache inteiro: não vale a pena guardar
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.current_bytes -= len(previous)
+            self._entries[key] = content
+            self.current_bytes += size
+            while self.current_bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.current_bytes -= len(evicted)
+                self.evictions += 1
+
+    def get_or_render(self, key, render):
+        """Retorna o documento em cache ou chama `render()` e guarda o resultado."""
+        content = self.get(key)
+        if content is None:
+            content = render()
+            self.put(key, content)
+        return content
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'bytes': self.current_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+            }
@@ -0,0 +1,187 @@
+"""
+Pool de processos de renderização pré-aquecidos.
+Os processos do pool importam reportlab, python-docx e todos os templates uma única
+vez ao iniciar. Os pedidos entram em uma fila limitada; quando ela está cheia, o pool
+recusa novos trabalhos com `PoolSaturated` em vez de acumular espera indefinidamente,
+e quem espera um documento desiste após um tempo limite (`RenderTimeout`).
+"""
+import math
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, TimeoutError as FutureTimeout
+from concurrent.futures.process import BrokenProcessPool
+
+from curriculo import engine
+from templates import TemplateManager
+
+class PoolSaturated(RuntimeError):
+    """A fila do pool está cheia; `retry_after` sugere quantos segundos aguardar."""
+
+    def __init__(self, retry_after):
+        super().__init__(f"Fila de renderização cheia, tente novamente em {retry_after}s")
+        self.retry_after = retry_after
+
+class RenderTimeout(RuntimeError):
+    """A renderização não terminou dentro do tempo limite."""
+
+    def __init__(self, timeout):
+        super().__init__(f"A renderização não terminou em {timeout}s")
+        self.timeout = timeout
+
+# Tempo máximo de espera por um documento, em segundos
+DEFAULT_TIMEOUT = 60
+
+def _mp_context():
+    # Os processos não devem nascer de um fork do processo web, que já tem threads
+    # (coleta de downloads, servidor); forkserver/spawn partem de um processo limpo
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+
+def _warm_up():
+    """Inicializador de cada processo: carrega bibliotecas e templates antes do primeiro pedido."""
+    template_manager = TemplateManager()
+    for template_name in template_manager.list_templates():
+        template_manager.get_template(template_name)
+
+class RenderPool:
+    def __init__(self, workers=2, max_queue=8, timeout=DEFAULT_TIMEOUT):
+        self.workers = workers
+        self.max_queue = max_queue
+        self.timeout = timeout
+        # Vagas = processos ocupados + pedidos aguardando na fila
+        self._slots = threading.BoundedSemaphore(max(workers, 1) + max_queue)
+        self._lock = threading.Lock()
+        self._executor = None
+        self.pending = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.timed_out = 0
+        self.avg_seconds = 1.0
+        # Futures que passaram do tempo limite mas ainda estavam rodando: não contam como concluídos
+        self._abandoned = set()
+
+    def _get_executor(self):
+        with self._lock:
+            if self._executor is None:
+                if self.workers <= 0:
+                    # Pool desativado: trabalhos assíncronos rodam em uma thread do próprio processo
+                    self._executor = ThreadPoolExecutor(max_workers=1)
+                else:
+                    self._executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_warm_up,
+                                                         mp_context=_mp_context())
+            return self._executor
+
+    def start(self):
+        """Cria os processos imediatamente, em vez de esperar pelo primeiro pedido."""
+        if self.workers <= 0:
+            return
+        executor = self._get_executor()
+        for future in [executor.submit(time.sleep, 0) for _ in range(self.workers)]:
+            future.result()
+
+    def retry_after(self):
+        """Estimativa, em segundos, de quando a fila deve ter espaço novamente."""
+        per_worker = self.pending / max(self.workers, 1)
+        return max(1, math.ceil(per_worker * self.avg_seconds))
+
+    def _finish(self, started, future=None, error=None):
+        # `future`: o trabalho terminado; `error`: exceção de um trabalho sem Future
+        cancelled = future is not None and future.cancelled()
+        if future is not None and not cancelled:
+            error = future.exception()
+        elapsed = time.monotonic() - started
+        with self._lock:
+            self.pending -= 1
+            abandoned = future in self._abandoned
+            self._abandoned.discard(future)
+            if error is not None:
+                self.failed += 1
+            elif not cancelled and not abandoned:
+                # Cancelados e abandonados já foram contados em `timed_out`
+                self.completed += 1
+            # Média móvel exponencial do tempo total (fila + renderização)
+            self.avg_seconds = 0.8 * self.avg_seconds + 0.2 * elapsed
+            if isinstance(error, BrokenProcessPool):
+                # Um processo morreu; o próximo pedido cria um executor novo
+                self._executor = None
+        self._slots.release()
+
+    def _acquire(self):
+        # Vaga no pool (processo ou fila); sem vaga, o pedido é recusado na hora
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self.rejected += 1
+            raise PoolSaturated(self.retry_after())
+        with self._lock:
+            self.pending += 1
+        return time.monotonic()
+
+    def submit(self, fn, *args):
+        """Agenda `fn(*args)` em um processo do pool e retorna um Future."""
+        started = self._acquire()
+        try:
+            future = self._get_executor().submit(fn, *args)
+        except Exception as e:
+            self._finish(started, error=e)
+            raise
+        future.add_done_callback(lambda f: self._finish(started, future=f))
+        return future
+
+    def wait(self, future, timeout=None):
+        """Resultado de um Future do pool, esperando no máximo `timeout` segundos.
+
+        Levanta `RenderTimeout` se ele não ficar pronto a tempo (padrão: o tempo
+        limite do pool).
+        """
+        timeout = self.timeout if timeout is None else timeout
+        try:
+            return future.result(timeout)
+        except FutureTimeout:
+            with self._lock:
+                self.timed_out += 1
+                if not future.done():
+                    self._abandoned.add(future)
+            # Se ainda estiver na fila, o trabalho é descartado; se já estiver rodando, o resultado é ignorado
+            future.cancel()
+            raise RenderTimeout(timeout)
+
+    def render(self, data, language, format_type, template=None, timeout=None, compact=False):
+        """Gera o documento em um processo do pool e retorna seus bytes.
+
+        Levanta `RenderTimeout` se o documento não ficar pronto em `timeout` segundos
+        (padrão: o tempo limite do pool).
+        """
+        if self.workers <= 0:
+            # Pool desativado: renderizar no próprio processo, com o mesmo limite de pedidos simultâneos
+            started = self._acquire()
+            try:
+                document = engine.render_bytes(data, language, format_type, template, compact)
+            except Exception as e:
+                self._finish(started, error=e)
+                raise
+            self._finish(started)
+            return document
+        future = self.submit(engine.render_bytes, data, language, format_type, template, compact)
+        return self.wait(future, timeout)
+
+    def stats(self):
+        with self._lock:
+            return {
+                'workers': self.workers,
+                'max_queue': self.max_queue,
+                'pending': self.pending,
+                'completed': self.completed,
+                'failed': self.failed,
+                'rejected': self.rejected,
+                'timed_out': self.timed_out,
+                'timeout': self.timeout,
+                'avg_seconds': round(self.avg_seconds, 4),
+            }
+
+    def shutdown(self, wait=True):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
@@ -0,0 +1,291 @@
+"""
+Armazenamento dos currículos em um banco SQLite embutido.
+Cada currículo é identificado por (dono, idioma). As gravações são atômicas: a
+versão atual e a entrada do histórico de revisões são gravadas na mesma transação,
+e o modo WAL permite que vários workers do gunicorn leiam e gravem no mesmo banco
+sem corromper os dados nem ver um currículo pela metade. As leituras vêm de um
+cache em memória com o JSON já analisado; cada leitura só confere o número da
+revisão no banco (uma consulta pela chave primária), sem reler o conteúdo.
+
+Cada dono (usuário) tem o seu espaço de nomes. A chave primária (dono, idioma)
+serve tanto para buscar um currículo quanto para listar os idiomas de um dono, sem
+percorrer diretórios nem os currículos dos outros usuários. Os currículos de um dono
+de referência (`fallback_owner`, em geral os exemplos importados na partida) podem
+ser vistos por todos até que o usuário grave a sua própria versão.
+"""
+import glob
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+from curriculo.locale_packs import is_valid_locale_code
+
+DEFAULT_OWNER = 'default'
+
+# Número de revisões guardadas por currículo (as mais antigas são apagadas)
+DEFAULT_MAX_REVISIONS = 50
+
+# Número de currículos já analisados mantidos no cache em memória
+DEFAULT_CACHE_SIZE = 1024
+
+# Identificadores de dono aceitos (ids de usuário, e-mails, uuids, "anon:<uuid>")
+_OWNER_RE = re.compile(r'^[A-Za-z0-9_.@+:-]{1,128}$')
+
+def default_db_path(root_dir):
+    """Caminho do banco: RESUME_DB_PATH ou <root_dir>/data/resumes.sqlite3."""
+    return os.environ.get('RESUME_DB_PATH') or os.path.join(root_dir, 'data', 'resumes.sqlite3')
+
+def is_valid_owner(owner):
+    return isinstance(owner, str) and _OWNER_RE.match(owner) is not None
+
+class RevisionConflict(Exception):
+    """O currículo mudou desde a revisão informada por quem está gravando."""
+
+    def __init__(self, owner, language, expected, current):
+        super().__init__(f"Revisão {expected} de {owner}/{language} desatualizada (atual: {current})")
+        self.expected = expected
+        self.current = current
+
+class ResumeStore:
+    def __init__(self, db_path, max_revisions=DEFAULT_MAX_REVISIONS, cache_size=DEFAULT_CACHE_SIZE):
+        self.db_path = db_path
+        self.max_revisions = max_revisions
+        self.cache_size = cache_size
+        self._local = threading.local()
+        # (dono, idioma) -> (revisão, conteúdo analisado)
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        with self._connect() as conn:
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS resumes (
+                    owner TEXT NOT NULL,
+                    language TEXT NOT NULL,
+                    name TEXT NOT NULL,
+                    revision INTEGER NOT NULL,
+                    content TEXT NOT NULL,
+                    updated_at REAL NOT NULL,
+                    PRIMARY KEY (owner, language)
+                )
+            ''')
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS revisions (
+                    owner TEXT NOT NULL,
+                    language TEXT NOT NULL,
+                    revision INTEGER NOT NULL,
+                    content TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    PRIMARY KEY (owner, language, revision)
+                )
+            ''')
+
+    def _connect(self):
+        # Uma conexão por thread; WAL permite leituras concorrentes entre processos
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=10, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        return conn
+
+    def _cache_put(self, key, revision, data):
+        with self._cache_lock:
+            self._cache[key] = (revision, data)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def save(self, owner, language, content, expected_revision=None):
+        """Grava o currículo (dicionário) e retorna o número da nova revisão.
+
+        Com `expected_revision`, a gravação só acontece se a revisão atual for essa
+        (0 = o currículo ainda não existe); senão levanta `RevisionConflict`.
+        Levanta ValueError para um idioma ou uma revisão inválidos.
+        """
+        # O idioma vira nome de arquivo em export_files: nada de barras ou ".."
+        if not is_valid_locale_code(language):
+            raise ValueError(f"Idioma inválido: {language!r}")
+        if expected_revision is not None and (not isinstance(expected_revision, int)
+                                              or isinstance(expected_revision, bool) or expected_revision < 0):
+            raise ValueError(f"Revisão inválida: {expected_revision!r}")
+        text = json.dumps(content, ensure_ascii=False)
+        name = (content.get('languageName') if isinstance(content, dict) else None) or language.upper()
+        now = time.time()
+        conn = self._connect()
+        # BEGIN IMMEDIATE: a leitura da revisão atual e a gravação ficam na mesma trava de escrita
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            row = conn.execute('SELECT revision FROM resumes WHERE owner = ? AND language = ?',
+                               (owner, language)).fetchone()
+            current = row[0] if row else 0
+            if expected_revision is not None and expected_revision != current:
+                raise RevisionConflict(owner, language, expected_revision, current)
+            revision = current + 1
+            conn.execute('''
+                INSERT INTO resumes (owner, language, name, revision, content, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT (owner, language) DO UPDATE SET
+                    name = excluded.name, revision = excluded.revision,
+                    content = excluded.content, updated_at = excluded.updated_at
+            ''', (owner, language, name, revision, text, now))
+            conn.execute('INSERT INTO revisions (owner, language, revision, content, created_at) VALUES (?, ?, ?, ?, ?)',
+                         (owner, language, revision, text, now))
+            conn.execute('DELETE FROM revisions WHERE owner = ? AND language = ? AND revision <= ?',
+                         (owner, language, revision - self.max_revisions))
+            conn.execute('COMMIT')
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+        # Guardar uma cópia própria: o chamador pode continuar alterando o dicionário
+        self._cache_put((owner, language), revision, json.loads(text))
+        return revision
+
+    def create(self, owner, language, content):
+        """Grava um currículo novo; levanta `RevisionConflict` se ele já existir."""
+        return self.save(owner, language, content, expected_revision=0)
+
+    def load(self, owner, language, fallback_owner=None):
+        """Conteúdo já analisado do currículo, ou None.
+
+        O dicionário retornado é compartilhado pelo cache e não deve ser modificado.
+        """
+        entry = self.load_with_revision(owner, language, fallback_owner)
+        return entry[1] if entry else None
+
+    def load_with_revision(self, owner, language, fallback_owner=None):
+        """(revisão, conteúdo) do currículo, ou None se ele não existir.
+
+        Sem currículo próprio, usa o de `fallback_owner` com revisão 0: a primeira
+        gravação do dono cria a sua cópia.
+        """
+        entry = self._load(owner, language)
+        if entry is None and fallback_owner and fallback_owner != owner:
+            entry = self._load(fallback_owner, language)
+            if entry is not None:
+                return 0, entry[1]
+        return entry
+
+    def _load(self, owner, language):
+        key = (owner, language)
+        conn = self._connect()
+        row = conn.execute('SELECT revision FROM resumes WHERE owner = ? AND language = ?', key).fetchone()
+        if row is None:
+            with self._cache_lock:
+                self._cache.pop(key, None)
+            return None
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is not None and cached[0] == row[0]:
+                self._cache.move_to_end(key)
+                return cached
+        # Outro worker gravou uma revisão nova (ou o currículo não estava no cache)
+        row = conn.execute('SELECT revision, content FROM resumes WHERE owner = ? AND language = ?', key).fetchone()
+        if row is None:
+            return None
+        data = json.loads(row[1])
+        self._cache_put(key, row[0], data)
+        return row[0], data
+
+    def languages(self, owner, fallback_owner=None):
+        """Dicionário {idioma: {'name', 'revision'}} com os currículos do dono.
+
+        Com `fallback_owner`, inclui os idiomas dele que o dono ainda não tem (revisão 0).
+        """
+        conn = self._connect()
+        languages = {}
+        if fallback_owner and fallback_owner != owner:
+            for language, name in conn.execute(
+                    'SELECT language, name FROM resumes WHERE owner = ?', (fallback_owner,)):
+                languages[language] = {'name': name, 'revision': 0}
+        for language, name, revision in conn.execute(
+                'SELECT language, name, revision FROM resumes WHERE owner = ?', (owner,)):
+            languages[language] = {'name': name, 'revision': revision}
+        return dict(sorted(languages.items()))
+
+    def history(self, owner, language):
+        """Revisões guardadas do currículo, da mais recente para a mais antiga."""
+        rows = self._connect().execute(
+            'SELECT revision, created_at FROM revisions WHERE owner = ? AND language = ? ORDER BY revision DESC',
+            (owner, language),
+        )
+        return [{'revision': revision, 'created_at': created_at} for revision, created_at in rows]
+
+    def load_revision(self, owner, language, revision):
+        """Conteúdo de uma revisão do histórico, ou None."""
+        row = self._connect().execute(
+            'SELECT content FROM revisions WHERE owner = ? AND language = ? AND revision = ?',
+            (owner, language, revision),
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def import_files(self, owner, root_dir):
+        """Importa os arquivos curriculo_XX.json de `root_dir` que o dono ainda não tem no banco."""
+        existing = self.languages(owner)
+        imported = []
+        for path in sorted(glob.glob(os.path.join(root_dir, 'curriculo_*.json'))):
+            language = os.path.basename(path)[len('curriculo_'):-len('.json')]
+            if language in existing or not is_valid_locale_code(language):
+                continue
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    content = json.load(f)
+                self.create(owner, language, content)
+                imported.append(language)
+            except RevisionConflict:
+                # Outro worker importou o mesmo arquivo ao mesmo tempo
+                continue
+            except Exception as e:
+                print(f"Erro ao importar {path}: {str(e)}")
+        return imported
+
+    def owners(self):
+        """Donos com currículos no banco, do que gravou por último para o mais antigo."""
+        rows = self._connect().execute('''
+            SELECT owner, GROUP_CONCAT(language, ','), MAX(updated_at) FROM resumes
+            GROUP BY owner ORDER BY MAX(updated_at) DESC
+        ''')
+        return [{'owner': owner, 'languages': sorted(languages.split(',')), 'updated_at': updated_at}
+                for owner, languages, updated_at in rows]
+
+    def export_files(self, owner, output_dir, languages=None, fallback_owner=None):
+        """Grava os currículos do dono como curriculo_XX.json em `output_dir` e retorna os caminhos."""
+        os.makedirs(output_dir, exist_ok=True)
+        paths = []
+        for language in languages or self.languages(owner, fallback_owner):
+            if not is_valid_locale_code(language):
+                # Gravado antes da validação dos idiomas: nunca vira caminho fora de `output_dir`
+                print(f"Idioma inválido ignorado: {language!r}")
+                continue
+            content = self.load(owner, language, fallback_owner)
+            if content is None:
+                print(f"Currículo não encontrado: {owner}/{language}")
+                continue
+            path = os.path.join(output_dir, f'curriculo_{language}.json')
+            # Arquivo temporário + rename: quem lê o JSON nunca vê o arquivo pela metade
+            temp_path = path + '.tmp'
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(content, f, indent=2, ensure_ascii=False)
+            os.replace(temp_path, path)
+            paths.append(path)
+        return paths
+
+    def stats(self):
+        resumes, owners = self._connect().execute(
+            'SELECT COUNT(*), COUNT(DISTINCT owner) FROM resumes'
+        ).fetchone()
+        revisions = self._connect().execute('SELECT COUNT(*) FROM revisions').fetchone()[0]
+        with self._cache_lock:
+            cached = len(self._cache)
+        return {
+            'db_path': self.db_path,
+            'resumes': resumes,
+            'owners': owners,
+            'revisions': revisions,
+            'cached': cached,
+            'cache_size': self.cache_size,
+        }
@@ -0,0 +1,139 @@
+"""
+Cache de seções já montadas, para regenerar rapidamente um currículo editado.
+Cada seção do modelo normalizado recebe um hash estrutural (JSON canônico do seu
+conteúdo) combinado com o template e a sua versão. Os flowables do reportlab ou os
+fragmentos XML do DOCX produzidos para essa seção são guardados e reaproveitados,
+de modo que, ao editar um único item, apenas a seção alterada é reconstruída antes
+do `doc.build` / `doc.save` final.
+"""
+import copy
+import hashlib
+import threading
+from collections import OrderedDict
+
+from curriculo.render_cache import canonical_json
+from templates import TemplateManager
+
+# Número padrão de seções guardadas por processo
+DEFAULT_MAX_ENTRIES = 512
+
+# Atributos que apontam para relacionamentos do pacote DOCX (imagens, links...):
+# fragmentos com eles dependem do documento de origem e não podem ser copiados
+_RELATIONSHIP_NS = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+
+class SectionCache:
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def make_key(self, template, section_name, section, *extra):
+        """Chave de uma seção: template (nome e versão), nome da seção, conteúdo e extras."""
+        template_name = template.__name__.replace('template_', '', 1)
+        version = TemplateManager().get_template_version(template_name)
+        payload = canonical_json({
+            'template': template_name,
+            'version': version,
+            'section': section_name,
+            'content': section.to_dict(),
+            'extra': list(extra),
+        })
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, key):
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': (self.hits / total) if total else 0.0,
+            }
+
+    def add_flowables(self, elements, template, styles, section_name, section, build, *extra):
+        """Adiciona a `elements` os flowables da seção, reconstruindo-os só se ela mudou.
+
+        `build(section_elements, template, styles, section, *extra)` monta a seção.
+        O cache guarda cópias profundas feitas antes do layout, que nunca chegam a um
+        documento: o reportlab grava o resultado do `wrap`/`split` no próprio flowable
+        (e nos fragmentos do Paragraph), então cada documento recebe a sua própria
+        cópia profunda. Estilos congelados e estilos de barras são compartilhados, não
+        copiados.
+        """
+        if section is None:
+            return
+        key = self.make_key(template, section_name, section, *extra)
+        flowables = self.get(key)
+        if flowables is None:
+            built = []
+            build(built, template, styles, section, *extra)
+            self.put(key, copy.deepcopy(built))
+            elements.extend(built)
+            return
+        elements.extend(copy.deepcopy(flowables))
+
+    def add_fragment(self, doc, template, section_name, section, build, *extra):
+        """Adiciona ao documento DOCX os elementos da seção, reconstruindo-os só se ela mudou.
+
+        `build(doc, template, section, *extra)` monta a seção diretamente no documento;
+        os elementos XML criados são guardados e copiados para os próximos documentos.
+        """
+        if section is None:
+            return
+        body = doc.element.body
+        key = self.make_key(template, section_name, section, *extra)
+        fragment = self.get(key)
+        if fragment is not None:
+            sect_pr = body.sectPr
+            for element in fragment:
+                element = copy.deepcopy(element)
+                if sect_pr is not None:
+                    sect_pr.addprevious(element)
+                else:
+                    body.append(element)
+            return
+
+        # Manter as referências vivas: o lxml só preserva a identidade dos proxies em uso
+        existing = list(body)
+        existing_ids = {id(element) for element in existing}
+        build(doc, template, section, *extra)
+        created = [element for element in body if id(element) not in existing_ids]
+        if any(attr.startswith(_RELATIONSHIP_NS) for element in created
+               for node in element.iter() for attr in node.attrib):
+            return
+        self.put(key, [copy.deepcopy(element) for element in created])
+
+_section_cache = None
+_section_cache_lock = threading.Lock()
+
+def get_section_cache():
+    """Cache de seções compartilhado por todas as renderizações deste processo."""
+    global _section_cache
+    with _section_cache_lock:
+        if _section_cache is None:
+            _section_cache = SectionCache()
+        return _section_cache
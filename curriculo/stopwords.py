@@ -0,0 +1,21 @@
+"""
+Palavras comuns (stopwords) de cada idioma, ignoradas na extração de palavras-chave,
+e o vocabulário comum de anúncios de vaga, ignorado na comparação com vagas.
+As tabelas vêm dos pacotes de idioma (`curriculo/locales/<código>.json`) e são
+frozensets montados uma vez por processo, para consultas em tempo constante.
+"""
+from curriculo.locale_packs import find_locale_pack, get_all_words
+
+def get_stopwords(language):
+    """Stopwords do idioma; todas as conhecidas se o idioma não tiver tabela."""
+    pack = find_locale_pack(language)
+    if pack is not None and pack.stopwords is not None:
+        return pack.stopwords
+    return get_all_words('stopwords')
+
+def get_job_posting_words(language):
+    """Vocabulário de anúncios de vaga do idioma (todos os conhecidos se o idioma não tiver tabela)."""
+    pack = find_locale_pack(language)
+    if pack is not None and pack.job_posting is not None:
+        return pack.job_posting
+    return get_all_words('job_posting')
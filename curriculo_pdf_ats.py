@@ -9,520 +9,285 @@ from reportlab.pdfbase.ttfonts import TTFont
 import os
 import json
 import sys
-import glob
 import argparse
 from templates import TemplateManager
-import re
-
-# Função genérica para obter valores do JSON de maneira padronizada
-def get_field(data, primary_key, fallback_key=None, additional_fallbacks=None):
-    if primary_key in data:
-        return data[primary_key]
-    elif fallback_key and fallback_key in data:
-        return data[fallback_key]
-    
-    # Verificar chaves adicionais específicas para alguns campos
-    if additional_fallbacks:
-        for key in additional_fallbacks:
-            if key in data:
-                return data[key]
-    
-    return None
-
-# Função genérica para obter título de seção
-def get_section_title(section_data, title_keys=['titulo', 'title', 'titre', 'titel']):
-    for key in title_keys:
-        if key in section_data:
-            return section_data[key]
-    return "N/A"  # Fallback
-
-# Função genérica para obter conteúdo de seção
-def get_section_content(section_data, content_keys=['conteudo', 'content', 'contenido', 'inhalt']):
-    for key in content_keys:
-        if key in section_data:
-            return section_data[key]
-    return ""  # Fallback
-
-# Função genérica para obter lista de itens
-def get_section_list(section_data, list_keys=['lista', 'list', 'liste', 'lista']):
-    for key in list_keys:
-        if key in section_data:
-            return section_data[key]
-    return []  # Fallback
-
-# Função genérica para obter lista de empregos/experiências
-def get_jobs(section_data, jobs_keys=['empregos', 'jobs', 'empleos', 'emplois']):
-    for key in jobs_keys:
-        if key in section_data:
-            return section_data[key]
-    return []  # Fallback
-
-# Função para extrair palavras-chave do resumo profissional
-def extract_keywords_from_resume(resume_text, min_length=4):
-    # Remover pontuação e converter para minúsculas
-    cleaned_text = re.sub(r'[^\w\s]', ' ', resume_text.lower())
-    
-    # Dividir em palavras
-    words = cleaned_text.split()
-    
-    # Filtrar palavras curtas e palavras comuns (stopwords em português)
-    stopwords = ["de", "a", "o", "que", "e", "do", "da", "em", "um", "para", "é", "com", 
-                "não", "uma", "os", "no", "se", "na", "por", "mais", "as", "dos", "como", 
-                "mas", "foi", "ao", "ele", "das", "tem", "seu", "sua", "ou", "ser", "quando",
-                "muito", "nos", "já", "está", "eu", "também", "só", "pelo", "pela", "até",
-                "isso", "ela", "entre", "era", "depois", "sem", "mesmo", "aos", "ter", "seus",
-                "quem", "nas", "me", "esse", "eles", "estão", "você", "tinha", "foram", "essa",
-                "num", "nem", "suas", "meu", "às", "minha", "têm", "numa", "pelos", "elas",
-                "havia", "seja", "qual", "será", "nós", "tenho", "lhe", "deles", "essas",
-                "esses", "pelas", "este", "fosse", "dele", "tu", "te", "vocês", "vos", "lhes",
-                "meus", "minhas", "teu", "tua", "teus", "tuas", "nosso", "nossa", "nossos",
-                "nossas", "dela", "delas", "esta", "estes", "estas", "aquele", "aquela",
-                "aqueles", "aquelas", "isto", "aquilo", "estou", "está", "estamos", "estão",
-                "estive", "esteve", "estivemos", "estiveram", "estava", "estávamos", "estavam",
-                "estivera", "estivéramos", "esteja", "estejamos", "estejam", "estivesse",
-                "estivéssemos", "estivessem", "estiver", "estivermos", "estiverem", "hei",
-                "há", "havemos", "hão", "houve", "houvemos", "houveram", "houvera",
-                "houvéramos", "haja", "hajamos", "hajam", "houvesse", "houvéssemos",
-                "houvessem", "houver", "houvermos", "houverem", "houverei", "houverá",
-                "houveremos", "houverão", "houveria", "houveríamos", "houveriam", "sou",
-                "somos", "são", "era", "éramos", "eram", "fui", "foi", "fomos", "foram",
-                "fora", "fôramos", "seja", "sejamos", "sejam", "fosse", "fôssemos", "fossem",
-                "for", "formos", "forem", "serei", "será", "seremos", "serão", "seria",
-                "seríamos", "seriam", "tenho", "tem", "temos", "tém", "tinha", "tínhamos",
-                "tinham", "tive", "teve", "tivemos", "tiveram", "tivera", "tivéramos", "tenha",
-                "tenhamos", "tenham", "tivesse", "tivéssemos", "tivessem", "tiver", "tivermos",
-                "tiverem", "terei", "terá", "teremos", "terão", "teria", "teríamos", "teriam"]
-    
-    filtered_words = [word for word in words if len(word) >= min_length and word not in stopwords]
-    
-    # Contar frequência das palavras
-    word_freq = {}
-    for word in filtered_words:
-        if word in word_freq:
-            word_freq[word] += 1
-        else:
-            word_freq[word] = 1
-    
-    # Ordenar por frequência e retornar as top palavras
-    sorted_words = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)
-    top_words = [word for word, freq in sorted_words[:20]]
-    
-    return top_words
-
-# Configurar os argumentos de linha de comando
-parser = argparse.ArgumentParser(description='Gerar currículo em formato PDF otimizado para ATS.')
-parser.add_argument('language', nargs='?', help='Código do idioma (ex: pt, en, es)')
-parser.add_argument('--template', '-t', help='Nome do template a ser usado', default='pdf_ats')
-parser.add_argument('--json-file', help='Caminho para um arquivo JSON personalizado', default=None)
-args = parser.parse_args()
-
-# Função para listar idiomas disponíveis
-def get_available_languages():
-    # Procurar todos os arquivos JSON que seguem o padrão curriculo_XX.json
-    json_files = glob.glob('curriculo_*.json')
-    languages = {}
-    
-    for file in json_files:
-        # Extrair o código do idioma do nome do arquivo (curriculo_XX.json -> XX)
-        lang_code = file.replace('curriculo_', '').replace('.json', '')
-        
-        # Carregar o arquivo para obter o nome do idioma na própria língua
-        try:
-            with open(file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                
-                # Verificar se o arquivo tem a estrutura esperada
-                if 'languageName' in data:
-                    lang_name = data['languageName']
-                else:
-                    # Fallback para casos onde o nome do idioma não está definido
-                    lang_name = lang_code.upper()
-                
-                languages[lang_code] = {
-                    'name': lang_name,
-                    'file': file
-                }
-        except:
-            # Se houver erro ao carregar ou analisar, pular este arquivo
-            pass
-    
-    return languages
-
-# Determinar o idioma a ser usado
-available_languages = get_available_languages()
-
-# Default para português se disponível, caso contrário usa o primeiro idioma disponível
-default_lang = 'pt' if 'pt' in available_languages else list(available_languages.keys())[0] if available_languages else None
-
-# Verificar qual idioma usar com base nos argumentos de linha de comando
-selected_lang = default_lang
-if args.language:
-    lang_arg = args.language.lower()
-    if lang_arg in available_languages:
-        selected_lang = lang_arg
-
-# Se não houver idiomas disponíveis, terminar o programa
-if not selected_lang and not args.json_file:
-    print("Erro: Não foram encontrados arquivos de idioma válidos.")
-    sys.exit(1)
-
-# Carregar o arquivo JSON
-if args.json_file:
-    print(f"Usando arquivo JSON personalizado: {args.json_file}")
-    # Usar o arquivo JSON personalizado
+from curriculo.languages import get_available_languages
+from curriculo.locale_packs import get_locale_pack
+from curriculo.model import normalize
+from curriculo.section_cache import get_section_cache
+from curriculo import compact as compact_pdf
+from curriculo.keywords import extract_keywords, get_extractor
+
+# Função para extrair palavras-chave de um texto (ver curriculo/keywords.py)
+def extract_keywords_from_resume(resume_text, min_length=4, language='pt'):
+    return get_extractor(language, min_length).extract([resume_text])
+
+# Carregar um template pelo nome, usando o padrão 'pdf_ats' se ele não existir
+def load_template(template_name, default_template='pdf_ats'):
+    template_manager = TemplateManager()
     try:
-        with open(args.json_file, 'r', encoding='utf-8') as file:
-            data = json.load(file)
-    except Exception as e:
-        print(f"Erro ao carregar arquivo JSON personalizado: {str(e)}")
-        sys.exit(1)
-else:
-    # Carregar o arquivo JSON do idioma selecionado
-    json_file = available_languages[selected_lang]['file']
-    with open(json_file, 'r', encoding='utf-8') as file:
-        data = json.load(file)
-
-# Extrair dados básicos do JSON
-# Estrutura padronizada para todas as línguas
-nome = get_field(data, 'nome', 'name', ['nombre'])
-email = data['email']  # Email geralmente é o mesmo em qualquer idioma
-telefone = get_field(data, 'telefone', 'phone')
-linkedin = data['linkedin']  # LinkedIn geralmente é o mesmo em qualquer idioma
-
-# Determinar qual é a chave principal para seções
-secoes_key = None
-for key in ['secoes', 'sections', 'secciones', 'sektionen']:
-    if key in data:
-        secoes_key = key
-        break
-
-# Se não encontrarmos a chave das seções, não podemos continuar
-if not secoes_key:
-    print("Erro: Formato de arquivo JSON inválido. A chave de seções não foi encontrada.")
-    sys.exit(1)
-
-secoes = data[secoes_key]
-
-# Carregar o template
-template_manager = TemplateManager()
-template_name = args.template
-
-try:
-    template = template_manager.get_template(template_name)
-    print(f"Usando template: {template_name}")
-except ValueError as e:
-    print(f"Erro ao carregar template: {str(e)}")
-    print(f"Templates disponíveis: {', '.join(template_manager.list_templates())}")
-    print("Usando o template padrão 'pdf_ats'.")
-    template = template_manager.get_template('pdf_ats')
+        template = template_manager.get_template(template_name)
+        print(f"Usando template: {template_name}")
+    except ValueError as e:
+        print(f"Erro ao carregar template: {str(e)}")
+        print(f"Templates disponíveis: {', '.join(template_manager.list_templates())}")
+        print(f"Usando o template padrão '{default_template}'.")
+        template = template_manager.get_template(default_template)
+    return template
 
 # Obter nome do arquivo para saída PDF
-output_filename = get_field(data, 'nomeArquivoSaida', 'outputFileName')
-if not output_filename:    # Se nenhum nome de arquivo for especificado, criar um a partir do nome e idioma
-    if nome:
-        output_filename = f"Curriculo_ATS_{nome.replace(' ', '_')}_{selected_lang}.pdf"
+def get_output_filename(data, selected_lang):
+    resume = normalize(data)
+    nome = resume.header.name
+    output_filename = resume.output_filename
+    if not output_filename:    # Se nenhum nome de arquivo for especificado, criar um a partir do nome e idioma
+        if nome:
+            output_filename = f"Curriculo_ATS_{nome.replace(' ', '_')}_{selected_lang}.pdf"
+        else:
+            output_filename = f"Curriculo_ATS_{selected_lang}.pdf"
     else:
-        output_filename = f"Curriculo_ATS_{selected_lang}.pdf"
-else:
-    # Adicionar sufixo ATS ao nome do arquivo e garantir extensão .pdf
-    base_name, ext = os.path.splitext(output_filename)
-    output_filename = f"{base_name}_ATS.pdf"
-
-# Criar documento PDF
-doc = template.create_document(output_filename)
-
-# Obter estilos definidos no template
-styles = template.get_styles()
-
-# Lista para elementos do PDF
-elements = []
-
-# Montar o currículo visual
-template.add_title(elements, nome, email, telefone, linkedin, styles)
-
-# Resumo Profissional - procurar por várias possíveis chaves
-resume_section = None
-for key in ['resumoProfissional', 'professionalSummary', 'resumenProfesional', 'resumentProfessionnel']:
-    if key in secoes:
-        resume_section = secoes[key]
-        break
-
-# Extrair palavras-chave do resumo profissional para uso posterior
-keywords = []
-if resume_section:
-    resume_text = get_section_content(resume_section)
-    if resume_text:
-        keywords = extract_keywords_from_resume(resume_text)
+        # Adicionar sufixo ATS ao nome do arquivo e garantir extensão .pdf
+        base_name, ext = os.path.splitext(output_filename)
+        output_filename = f"{base_name}_ATS.pdf"
+    return output_filename
+
+# Palavras-chave de todas as seções (no idioma do currículo) somadas aos nomes das habilidades técnicas
+def collect_keywords(resume, language='pt'):
+    keywords = extract_keywords(resume, language)
+
+    if keywords:
+        # Adicionar nomes das habilidades técnicas à lista de palavras-chave
+        if resume.skills:
+            for skill in resume.skills.items:
+                keywords.append(skill.name)
     
-    template.add_section_title(elements, get_section_title(resume_section), styles)
-    elements.append(Paragraph(resume_text, styles['normal']))
+        # Remover duplicatas (sem diferenciar maiúsculas) e ordenar
+        keywords = list({keyword.casefold(): keyword for keyword in reversed(keywords)}.values())
+        keywords.sort(key=str.casefold)
+    return keywords
+
+# Funções que montam os elementos de cada seção (resultado guardado no cache de seções)
+def build_title(elements, template, styles, header, selected_lang):
+    labels = get_locale_pack(selected_lang).labels
+    template.add_title(elements, header.name, header.email, header.phone, header.linkedin, styles, labels)
+
+def build_summary(elements, template, styles, section):
+    template.add_section_title(elements, section.title, styles)
+    elements.append(Paragraph(section.content, styles['normal']))
     elements.append(Spacer(1, 0.1*inch))
 
-# Experiência Profissional - procurar por várias possíveis chaves
-experience_section = None
-for key in ['experienciaProfissional', 'workExperience', 'experienciaLaboral', 'experienceProfessionnelle']:
-    if key in secoes:
-        experience_section = secoes[key]
-        break
+def build_experience(elements, template, styles, section, selected_lang):
+    template.add_section_title(elements, section.title, styles)
 
-if experience_section:
-    template.add_section_title(elements, get_section_title(experience_section), styles)
-    
-    # Obter lista de empregos
-    jobs = get_jobs(experience_section)
-    
-    # Adicionar empregos no formato otimizado para ATS
-    for job in jobs:
-        position_raw = get_field(job, 'cargo', 'position') # e.g., "Senior Development Consultant - Avanade"
-        period = get_field(job, 'periodo', 'period')
+    # Rótulos localizados (português como padrão)
+    labels = get_locale_pack(selected_lang).labels
 
-        position = position_raw
-        company = get_field(job, 'empresa', 'company') # Try dedicated field first
+    # Adicionar empregos no formato otimizado para ATS
+    for job in section.items:
+        position = job.position # e.g., "Senior Development Consultant - Avanade"
+        company = job.company # Try dedicated field first
 
-        if not company and position_raw and ' - ' in position_raw: # If no dedicated company field, parse from position_raw
-            parts = position_raw.split(' - ', 1)
+        if not company and position and ' - ' in position: # If no dedicated company field, parse from position
+            parts = position.split(' - ', 1)
             position = parts[0].strip()
             company = parts[1].strip()
         elif not company: # Ensure company is an empty string if not found/parsed
             company = ""
-        
-        # Obter descrição - procurar por várias possíveis chaves
-        description_content = None # Initialize to None
-        for key in ['descricao', 'description', 'descripcion']:
-            if key in job:
-                description_content = job[key]
-                break
-        
-        # Define localized labels
-        if selected_lang == 'en':
-            labels = {
-                "position": "Position",
-                "company": "Company",
-                "period": "Period",
-                "description_heading": "Responsibilities and Achievements"
-            }
-        elif selected_lang == 'es':
-            labels = {
-                "position": "Cargo", # Or "Puesto"
-                "company": "Empresa",
-                "period": "Período",
-                "description_heading": "Responsabilidades y Logros"
-            }
-        else: # Default to Portuguese
-            labels = {
-                "position": "Cargo",
-                "company": "Empresa",
-                "period": "Período",
-                "description_heading": "Responsabilidades e Realizações"
-            }
 
         # Usar a função especializada do template ATS
         if hasattr(template, 'add_job_experience'):
-            template.add_job_experience(elements, position, company, period, description_content, styles, labels)
+            template.add_job_experience(elements, position, company, job.period, list(job.description), styles, labels)
         else:
             # Fallback caso o template não tenha a função especializada
             if position:
                 elements.append(Paragraph(f"<b>{labels['position']}:</b> {position}", styles['bullet'])) # Use localized label
-            
+        
             if company:
                  elements.append(Paragraph(f"<b>{labels['company']}:</b> {company}", styles['normal']))
 
-            if period:
-                elements.append(Paragraph(f"<b>{labels['period']}:</b> {period}", styles['normal'])) # Use localized label
-            
-            # Fallback description handling (simplified)
-            processed_desc_items = []
-            if isinstance(description_content, str):
-                processed_desc_items = [s.strip() for s in description_content.split('\\n') if s.strip()]
-                if not processed_desc_items and description_content.strip():
-                    processed_desc_items = [description_content.strip()]
-            elif isinstance(description_content, list):
-                processed_desc_items = [str(item).strip() for item in description_content if str(item).strip()]
-
-            if processed_desc_items:
+            if job.period:
+                elements.append(Paragraph(f"<b>{labels['period']}:</b> {job.period}", styles['normal'])) # Use localized label
+        
+            if job.description:
                 elements.append(Paragraph(f"<b>{labels['description_heading']}:</b>", styles['normal'])) # Use localized label
-                for item_text in processed_desc_items:
+                for item_text in job.description:
                     elements.append(Paragraph(f"- {item_text}", styles['bullet']))
-                
+            
             elements.append(Spacer(1, 0.1*inch))
 
-# Adicionar palavras-chave extraídas para melhorar a compatibilidade ATS
-if keywords and hasattr(template, 'add_keywords_section'):
-    # Adicionar palavras-chave do resumo e habilidades técnicas
-    skills_section = None
-    for key in ['habilidadesTecnicas', 'technicalSkills', 'habilidadesTecnicas', 'competencesTechniques']:
-        if key in secoes:
-            skills_section = secoes[key]
-            break
-    
-    if skills_section:
-        # Obter lista de habilidades
-        skills = []
-        for key in ['habilidades', 'skills', 'habilidades', 'competences']:
-            if key in skills_section:
-                skills = skills_section[key]
-                break
-        
-        # Adicionar nomes das habilidades à lista de palavras-chave
-        for skill in skills:
-            skill_name = get_field(skill, 'nome', 'name')
-            if skill_name:
-                keywords.append(skill_name)
-    
-    # Remover duplicatas e ordenar
-    keywords = list(set(keywords))
-    keywords.sort()
-    
-
-# Adicionar quebra de página antes das habilidades técnicas
-template.add_page_break(elements)
+def build_skills(elements, template, styles, section, selected_lang):
+    template.add_section_title(elements, section.title, styles)
 
-# Habilidades Técnicas - procurar por várias possíveis chaves
-skills_section_content = None
-# Use a set for unique keys and then convert to list if necessary for order, or just iterate the set
-unique_skill_section_keys = {'habilidadesTecnicas', 'technicalSkills', 'competencesTechniques'}
-for key in unique_skill_section_keys:
-    if key in secoes:
-        skills_section_content = secoes[key]
-        break
+    for skill in section.items:
+        if hasattr(template, 'add_skill'):
+            template.add_skill(elements, skill.name, styles, skill.level, lang=selected_lang) # Pass selected_lang
+        elif hasattr(template, 'add_skill_bar'): 
+            template.add_skill_bar(elements, skill.name, styles, skill.level)
 
-if skills_section_content:
-    template.add_section_title(elements, get_section_title(skills_section_content), styles)
-    
-    skill_objects_list = [] # This will hold the list of skill *objects*
-
-    if isinstance(skills_section_content, dict):
-        # Typical case: skills_section_content is an object like {"titulo": "...", "habilidades": [...]}
-        found_list = False
-        unique_skill_list_keys = {'habilidades', 'skills', 'competencias'}
-        for list_key in unique_skill_list_keys:
-            if list_key in skills_section_content and isinstance(skills_section_content[list_key], list):
-                skill_objects_list = skills_section_content[list_key]
-                found_list = True
-                break
-        if not found_list:
-            # If no list found under standard keys, it might be a single skill object.
-            if 'nombre' in skills_section_content and 'nivel' in skills_section_content:
-                 # Check it's not a container object with a title etc.
-                if not any(k in skills_section_content for k in ['titulo', 'title'] + list(unique_skill_list_keys)):
-                    skill_objects_list = [skills_section_content] # Treat as a list with one skill
-    elif isinstance(skills_section_content, list):
-        # Case: skills_section_content is directly a list of skill objects
-        skill_objects_list = skills_section_content
-    
-    for skill_item in skill_objects_list:
-        if not isinstance(skill_item, dict):
-            print(f"Aviso (ATS PDF): Item de habilidade não é um dicionário: {skill_item}. Pulando.")
-            continue
-        skill_name = get_field(skill_item, 'nombre', 'name')
-        skill_level_str = get_field(skill_item, 'nivel', 'level') # Get level as string
-        if skill_name and skill_level_str:
-            try:
-                skill_level = int(skill_level_str) # Convert to int
-                if hasattr(template, 'add_skill'):
-                    template.add_skill(elements, skill_name, styles, skill_level, lang=selected_lang) # Pass selected_lang
-                elif hasattr(template, 'add_skill_bar'): 
-                    template.add_skill_bar(elements, skill_name, styles, skill_level)
-            except ValueError:
-                print(f"Aviso (ATS PDF): Nível de habilidade inválido para '{skill_name}'. Esperado um número, recebido '{skill_level_str}'. Pulando.")
-    
     elements.append(Spacer(1, 0.1*inch))
 
-# Certificações - procurar por várias possíveis chaves
-certifications_section = None
-for key in ['certificacoes', 'certifications', 'certificaciones', 'certifications']:
-    if key in secoes:
-        certifications_section = secoes[key]
-        break
+def build_certifications(elements, template, styles, section):
+    template.add_section_title(elements, section.title, styles)
 
-if certifications_section:
-    template.add_section_title(elements, get_section_title(certifications_section), styles)
-    certifications = get_section_list(certifications_section)
-    
-    for cert in certifications:
+    for cert in section.items:
         # Usar texto simples para certificações (sem emojis) para melhor compatibilidade ATS
         elements.append(Paragraph(cert, styles['normal']))
-    
+
     elements.append(Spacer(1, 0.1*inch))
 
-# Educação - procurar por várias possíveis chaves
-education_section = None
-for key in ['educacao', 'education', 'educacion', 'education']:
-    if key in secoes:
-        education_section = secoes[key]
-        break
+def build_education(elements, template, styles, section):
+    template.add_section_title(elements, section.title, styles)
 
-if education_section:
-    template.add_section_title(elements, get_section_title(education_section), styles)
-    
-    # Obter lista de formações
-    degrees = []
-    for key in ['formacao', 'degrees', 'formacion', 'diplomes']:
-        if key in education_section:
-            degrees = education_section[key]
-            break
-    
-    for degree in degrees:
+    for degree in section.items:
         elements.append(Paragraph(degree, styles['normal']))
-    
+
     elements.append(Spacer(1, 0.1*inch))
 
-# Em Andamento - procurar por várias possíveis chaves
-in_progress_section = None
-for key in ['emAndamento', 'inProgress', 'enProgreso', 'enCours']:
-    if key in secoes:
-        in_progress_section = secoes[key]
-        break
+def build_in_progress(elements, template, styles, section):
+    template.add_section_title(elements, section.title, styles)
 
-if in_progress_section:
-    template.add_section_title(elements, get_section_title(in_progress_section), styles)
-    
-    # Obter lista de cursos
-    courses = []
-    for key in ['cursos', 'courses', 'cursos', 'cours']:
-        if key in in_progress_section:
-            courses = in_progress_section[key]
-            break
-    
-    for course in courses:
+    for course in section.items:
         elements.append(Paragraph(course, styles['normal']))
 
-template.add_keywords_section(elements, keywords, styles)
+def render(data, selected_lang, template_name='pdf_ats', output=None, compact=False):
+    """Monta o currículo em PDF otimizado para ATS a partir dos dados já carregados.
+
+    `data` pode ser o JSON do currículo ou um `Resume` já normalizado. `output`
+    pode ser um caminho de arquivo ou um buffer binário; se omitido, o nome é
+    derivado dos próprios dados. Com `compact`, usa o modo compacto de
+    `curriculo.compact`. Retorna o destino usado.
+    """
+    # Resolver todas as chaves do JSON (em qualquer idioma) de uma vez
+    resume = normalize(data)
+    if output is None:
+        output = get_output_filename(resume, selected_lang)
+
+    # Carregar o template
+    template = load_template(template_name)
+
+    # Criar documento PDF
+    doc = template.create_document(output)
+
+    # Obter estilos definidos no template
+    styles = template.get_styles()
+
+    # Lista para elementos do PDF; seções que não mudaram vêm prontas do cache
+    elements = []
+    cache = get_section_cache()
+
+    # Montar o currículo visual
+    cache.add_flowables(elements, template, styles, 'header', resume.header, build_title, selected_lang)
+    cache.add_flowables(elements, template, styles, 'summary', resume.summary, build_summary)
+
+    cache.add_flowables(elements, template, styles, 'experience', resume.experience, build_experience, selected_lang)
+
+    # Palavras-chave extraídas para melhorar a compatibilidade ATS
+    keywords = collect_keywords(resume, selected_lang)
+
+    # Adicionar quebra de página antes das habilidades técnicas
+    template.add_page_break(elements)
+
+    cache.add_flowables(elements, template, styles, 'skills', resume.skills, build_skills, selected_lang)
+    cache.add_flowables(elements, template, styles, 'certifications', resume.certifications, build_certifications)
+    cache.add_flowables(elements, template, styles, 'education', resume.education, build_education)
+    cache.add_flowables(elements, template, styles, 'in_progress', resume.in_progress, build_in_progress)
+
+    template.add_keywords_section(elements, keywords, styles, get_locale_pack(selected_lang).section_titles['keywords'])
+
+    # Gerar o PDF
+    compact_pdf.build(doc, elements, styles, compact)
+    return output
+
+def main(argv=None):
+    # Configurar os argumentos de linha de comando
+    parser = argparse.ArgumentParser(description='Gerar currículo em formato PDF otimizado para ATS.')
+    parser.add_argument('language', nargs='?', help='Código do idioma (ex: pt, en, es)')
+    parser.add_argument('--template', '-t', help='Nome do template a ser usado', default='pdf_ats')
+    parser.add_argument('--json-file', help='Caminho para um arquivo JSON personalizado', default=None)
+    parser.add_argument('--compact', action='store_true', help='Gerar o PDF no modo compacto e mostrar o tamanho antes e depois')
+    args = parser.parse_args(argv)
+
+    # Determinar o idioma a ser usado
+    available_languages = get_available_languages()
 
-# Gerar o PDF
-try:   
-    if os.path.exists(output_filename):
+    # Default para português se disponível, caso contrário usa o primeiro idioma disponível
+    default_lang = 'pt' if 'pt' in available_languages else list(available_languages.keys())[0] if available_languages else None
+
+    # Verificar qual idioma usar com base nos argumentos de linha de comando
+    selected_lang = default_lang
+    if args.language:
+        lang_arg = args.language.lower()
+        if lang_arg in available_languages:
+            selected_lang = lang_arg
+
+    # Se não houver idiomas disponíveis, terminar o programa
+    if not selected_lang and not args.json_file:
+        print("Erro: Não foram encontrados arquivos de idioma válidos.")
+        sys.exit(1)
+
+    # Carregar o arquivo JSON
+    if args.json_file:
+        print(f"Usando arquivo JSON personalizado: {args.json_file}")
+        # Usar o arquivo JSON personalizado
         try:
-            # Tentar renomear temporariamente o arquivo existente
-            temp_name = output_filename + ".old"
-            if os.path.exists(temp_name):
-                os.remove(temp_name)
-            os.rename(output_filename, temp_name)
-            
-        # Gerar o novo PDF
-            doc.build(elements)
-            
-            # Se deu certo, remover o arquivo antigo
-            if os.path.exists(temp_name):
-                os.remove(temp_name)
-                
+            with open(args.json_file, 'r', encoding='utf-8') as file:
+                data = json.load(file)
         except Exception as e:
-            # Se falhar em renomear, tentar outro nome de arquivo
-            alternative_filename = os.path.splitext(output_filename)[0] + "_new.pdf"
-            doc = template.create_document(alternative_filename)
-            doc.build(elements)
-            output_filename = alternative_filename
+            print(f"Erro ao carregar arquivo JSON personalizado: {str(e)}")
+            sys.exit(1)
     else:
-        # Se não existir, simplesmente criar o arquivo
-        doc.build(elements)
-        
-    print(f"Arquivo PDF otimizado para ATS salvo como: {output_filename}")
-    print("\nDicas para aumentar a compatibilidade com ATS:")
-    print("1. Use termos-chave específicos da sua área em seu resumo profissional")
-    print("2. Liste habilidades técnicas relevantes para a vaga desejada")
-    print("3. Mantenha um formato limpo e direto, evitando tabelas complexas")
-    print("4. Certifique-se de incluir datas completas nas experiências (mm/aaaa - mm/aaaa)")
-    
-except Exception as e:
-    print(f"Erro ao gerar o PDF: {str(e)}")
-    print("Tente fechar o arquivo PDF se ele estiver aberto em outro programa.")
+        # Carregar o arquivo JSON do idioma selecionado
+        json_file = available_languages[selected_lang]['file']
+        with open(json_file, 'r', encoding='utf-8') as file:
+            data = json.load(file)
+
+    # Normalizar o JSON uma única vez: o mesmo modelo serve para o nome do arquivo e para o documento
+    try:
+        data = normalize(data)
+    except ValueError as e:
+        print(f"Erro: {str(e)}")
+        sys.exit(1)
+
+    output_filename = get_output_filename(data, selected_lang)
+
+    # Gerar o PDF
+    try:
+        if os.path.exists(output_filename):
+            try:
+                # Tentar renomear temporariamente o arquivo existente
+                temp_name = output_filename + ".old"
+                if os.path.exists(temp_name):
+                    os.remove(temp_name)
+                os.rename(output_filename, temp_name)
+
+                # Gerar o novo PDF
+                render(data, selected_lang, args.template, output_filename, compact=args.compact)
+
+                # Se deu certo, remover o arquivo antigo
+                if os.path.exists(temp_name):
+                    os.remove(temp_name)
+
+            except Exception as e:
+                # Se falhar em renomear, tentar outro nome de arquivo
+                alternative_filename = os.path.splitext(output_filename)[0] + "_new.pdf"
+                render(data, selected_lang, args.template, alternative_filename, compact=args.compact)
+                output_filename = alternative_filename
+        else:
+            # Se não existir, simplesmente criar o arquivo
+            render(data, selected_lang, args.template, output_filename, compact=args.compact)
+
+        print(f"Arquivo PDF otimizado para ATS salvo como: {output_filename}")
+        if args.compact:
+            compact_pdf.print_size_report(render, data, selected_lang, args.template, output_filename)
+        print("\nDicas para aumentar a compatibilidade com ATS:")
+        print("1. Use termos-chave específicos da sua área em seu resumo profissional")
+        print("2. Liste habilidades técnicas relevantes para a vaga desejada")
+        print("3. Mantenha um formato limpo e direto, evitando tabelas complexas")
+        print("4. Certifique-se de incluir datas completas nas experiências (mm/aaaa - mm/aaaa)")
+
+    except Exception as e:
+        print(f"Erro ao gerar o PDF: {str(e)}")
+        print("Tente fechar o arquivo PDF se ele estiver aberto em outro programa.")
+
+if __name__ == "__main__":
+    main()
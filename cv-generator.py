@@ -1,42 +1,10 @@
 import os
 import sys
-import glob
-import json
-import subprocess
+import time
+import argparse
 from templates import TemplateManager
-
-# Função para listar idiomas disponíveis
-def get_available_languages():
-    # Procurar todos os arquivos JSON que seguem o padrão curriculo_XX.json
-    json_files = glob.glob('curriculo_*.json')
-    languages = {}
-    
-    for file in json_files:
-        # Extrair o código do idioma do nome do arquivo (curriculo_XX.json -> XX)
-        lang_code = file.replace('curriculo_', '').replace('.json', '')
-        
-        # Carregar o arquivo para obter o nome do idioma na própria língua
-        try:
-            with open(file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                
-                # Verificar se o arquivo tem a estrutura esperada
-                if 'languageName' in data:
-                    lang_name = data['languageName']
-                else:
-                    # Fallback para casos onde o nome do idioma não está definido
-                    lang_name = lang_code.upper()
-                
-                languages[lang_code] = {
-                    'name': lang_name,
-                    'file': file
-                }
-        except Exception as e:
-            # Se houver erro ao carregar ou analisar, pular este arquivo
-            print(f"Erro ao carregar {file}: {str(e)}")
-            pass
-    
-    return languages
+from curriculo import engine, batch, matching
+from curriculo.languages import get_registry, get_available_languages
 
 def exibir_menu():
     print("\n== GERADOR DE CURRÍCULO MULTILÍNGUE ==")
@@ -146,30 +114,236 @@ def exibir_menu():
         return None
 
 def gerar_curriculo(opcoes):
-    if opcoes['format'] == 'pdf_ats':
-        script = 'curriculo_pdf_ats.py'
-    elif opcoes['format'] == 'pdf':
-        script = 'curriculo_pdf.py'
-    else:
-        script = 'curriculo_docx.py'
-    
-    # Executar o script com o idioma escolhido
-    cmd = [sys.executable, script, opcoes['language']]
+    # Executar o gerador no próprio processo com o idioma escolhido
+    renderer = engine.get_renderer(opcoes['format'])
+    argv = [opcoes['language']]
     
     # Se houver template especificado, passar como argumento adicional
     if 'template' in opcoes:
-        cmd.append('--template')
-        cmd.append(opcoes['template'])
+        argv.append('--template')
+        argv.append(opcoes['template'])
     
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        print(result.stdout)
-        if result.stderr:
-            print("Erros:", result.stderr)
+        renderer.main(argv)
     except Exception as e:
-        print(f"Erro ao executar o script: {str(e)}")
+        print(f"Erro ao executar o gerador: {str(e)}")
+
+# Converte "pt,en" (ou "all") em uma lista; None significa "todos"
+def parse_list(value):
+    if not value or value == 'all':
+        return None
+    return [item.strip() for item in value.split(',') if item.strip()]
+
+def gerar_lote(args):
+    # Gerar todas as combinações pedidas em um único processo
+    languages = get_available_languages()
+    selected_languages = parse_list(args.languages) or list(languages)
+    unknown = [code for code in selected_languages if code not in languages]
+    if unknown:
+        print(f"Idiomas não encontrados: {', '.join(unknown)}")
+        return 1
+    
+    formats = parse_list(args.formats) or list(batch.FORMATS)
+    invalid = [f for f in formats if f not in batch.FORMATS]
+    if invalid:
+        print(f"Formatos inválidos: {', '.join(invalid)}. Use: {', '.join(batch.FORMATS)}")
+        return 1
+    
+    targets = batch.get_targets(formats, parse_list(args.templates))
+    if not targets:
+        print("Nenhum template encontrado para os formatos escolhidos.")
+        return 1
+    
+    # Os dados de cada idioma são lidos uma vez e reaproveitados em todos os formatos
+    registry = get_registry()
+    resumes = {code: registry.load(code) for code in selected_languages}
+    
+    if args.size_report:
+        return exibir_relatorio_tamanho(resumes, targets)
+    
+    matrix = batch.build_matrix(resumes, targets)
+    print(f"Gerando {len(matrix)} documentos ({len(resumes)} idioma(s) x {len(targets)} template(s))...")
+    
+    pool = None
+    if args.workers > 0:
+        from curriculo.render_pool import RenderPool
+        pool = RenderPool(workers=args.workers, max_queue=args.workers)
+    
+    start = time.perf_counter()
+    try:
+        members = batch.iter_rendered(resumes, matrix, pool=pool, compact=args.compact)
+        if args.zip:
+            with open(args.zip, 'wb') as f:
+                for chunk in batch.stream_zip(members):
+                    f.write(chunk)
+            print(f"Arquivo ZIP salvo como: {args.zip}")
+        else:
+            for path in batch.write_files(members, args.output_dir):
+                print(f"Arquivo salvo como: {path}")
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    
+    print(f"{len(matrix)} documentos gerados em {time.perf_counter() - start:.2f}s")
+    return 0
+
+# Mostra o tamanho de cada PDF no modo normal e no compacto
+def exibir_relatorio_tamanho(resumes, targets):
+    rows = []
+    for code, data in resumes.items():
+        rows.extend(engine.size_report(data, code, targets))
+    if not rows:
+        print("Nenhum template PDF entre os escolhidos.")
+        return 1
+    
+    print(f"{'Idioma':<8}{'Template':<16}{'Normal':>10}{'Compacto':>10}{'Economia':>10}")
+    for row in rows:
+        print(f"{row['language']:<8}{row['template']:<16}{row['bytes']:>10}{row['compact_bytes']:>10}"
+              f"{row['saved_percent']:>9.1f}%")
+    total = sum(row['bytes'] for row in rows)
+    total_compact = sum(row['compact_bytes'] for row in rows)
+    print(f"{'Total':<24}{total:>10}{total_compact:>10}{100.0 * (total - total_compact) / total:>9.1f}%")
+    return 0
 
-def main():
+# Compara os currículos escolhidos com a descrição de uma vaga
+def comparar_vaga(args):
+    languages = get_available_languages()
+    selected_languages = parse_list(args.languages) or list(languages)
+    unknown = [code for code in selected_languages if code not in languages]
+    if unknown:
+        print(f"Idiomas não encontrados: {', '.join(unknown)}")
+        return 1
+    
+    try:
+        if args.match == '-':
+            job_description = sys.stdin.read()
+        else:
+            with open(args.match, 'r', encoding='utf-8') as f:
+                job_description = f.read()
+    except OSError as e:
+        print(f"Erro ao ler a descrição da vaga: {str(e)}")
+        return 1
+    
+    registry = get_registry()
+    for code in selected_languages:
+        try:
+            result = matching.match(registry.load(code), code, job_description, args.method, args.top)
+        except ValueError as e:
+            print(f"Erro: {str(e)}")
+            return 1
+        print(f"\n{languages[code]['name']} ({code}): {result['score']:.1f}% ({result['method']})")
+        print(f"  Termos encontrados: {', '.join(t['term'] for t in result['matched']) or '-'}")
+        print(f"  Termos ausentes: {', '.join(t['term'] for t in result['missing']) or '-'}")
+    return 0
+
+# Pontua todos os currículos de uma pasta contra todas as vagas de outra e grava o ranking
+def ranquear_curriculos(args):
+    # NumPy só é necessário para a pontuação em lote
+    from curriculo import bulk_match
+    
+    if not args.resumes:
+        print("Informe a pasta dos currículos com --resumes")
+        return 1
+    for path in (args.bulk_match, args.resumes):
+        if not os.path.exists(path):
+            print(f"Caminho não encontrado: {path}")
+            return 1
+    # Um único idioma escolhido define as stopwords; senão todas as tabelas são usadas
+    selected_languages = parse_list(args.languages) or []
+    language = selected_languages[0] if len(selected_languages) == 1 else None
+    
+    start = time.time()
+    ranking, jobs, resumes = bulk_match.score_all(args.bulk_match, args.resumes, language, args.method, args.top_n)
+    if not jobs or not resumes:
+        print(f"Nada a comparar: {jobs} vaga(s), {resumes} currículo(s)")
+        return 1
+    
+    os.makedirs(args.output_dir, exist_ok=True)
+    output = os.path.join(args.output_dir, 'ranking.csv')
+    bulk_match.write_ranking(ranking, output)
+    print(f"{resumes} currículo(s) x {jobs} vaga(s) em {time.time() - start:.1f}s ({args.method})")
+    print(f"Ranking gravado em: {output}")
+    return 0
+
+# Lista os usuários do banco de currículos da interface web
+def listar_donos(args):
+    from curriculo.resume_store import ResumeStore, default_db_path
+    
+    db_path = args.db or default_db_path(os.getcwd())
+    if not os.path.exists(db_path):
+        print(f"Banco de currículos não encontrado: {db_path}")
+        return 1
+    for entry in ResumeStore(db_path).owners():
+        updated = time.strftime('%Y-%m-%d %H:%M', time.localtime(entry['updated_at']))
+        print(f"{entry['owner']:<40} {updated}  {', '.join(entry['languages'])}")
+    return 0
+
+# Exporta os currículos salvos pela interface web para arquivos curriculo_XX.json
+def exportar_banco(args):
+    from curriculo.resume_store import ResumeStore, DEFAULT_OWNER, default_db_path
+    
+    db_path = args.db or default_db_path(os.getcwd())
+    if not os.path.exists(db_path):
+        print(f"Banco de currículos não encontrado: {db_path}")
+        return 1
+    owner = args.owner or DEFAULT_OWNER
+    # Os exemplos compartilhados completam os idiomas que o usuário ainda não salvou
+    paths = ResumeStore(db_path).export_files(owner, args.output_dir, parse_list(args.languages), DEFAULT_OWNER)
+    for path in paths:
+        print(f"Exportado: {path}")
+    return 0 if paths else 1
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Gerador de currículo multilíngue. Sem argumentos, abre o menu interativo.')
+    parser.add_argument('--batch', '-b', action='store_true',
+                        help='Gerar várias combinações de idiomas x formatos x templates de uma vez')
+    parser.add_argument('--languages', '-l', default='all', help='Idiomas separados por vírgula (padrão: all)')
+    parser.add_argument('--formats', '-f', default='all', help='Formatos separados por vírgula: pdf, pdf_ats, docx (padrão: all)')
+    parser.add_argument('--templates', '-t', default='all', help='Templates separados por vírgula (padrão: todos dos formatos escolhidos)')
+    parser.add_argument('--output-dir', '-o', default='.', help='Pasta de saída, com subpastas <idioma>/<template> (padrão: pasta atual)')
+    parser.add_argument('--zip', help='Gravar todos os documentos em um único arquivo ZIP em vez de uma pasta')
+    parser.add_argument('--workers', '-w', type=int, default=0,
+                        help='Processos de renderização em paralelo (padrão: 0, no próprio processo)')
+    parser.add_argument('--compact', action='store_true',
+                        help='Gerar os PDFs no modo compacto (arquivos menores, para e-mail e sistemas ATS)')
+    parser.add_argument('--size-report', action='store_true',
+                        help='Em vez de gravar os arquivos, mostrar o tamanho de cada PDF no modo normal e no compacto')
+    parser.add_argument('--match', metavar='ARQUIVO',
+                        help="Comparar os currículos com a descrição de uma vaga (arquivo de texto, ou '-' para a entrada padrão)")
+    parser.add_argument('--method', choices=matching.METHODS, default=matching.DEFAULT_METHOD,
+                        help=f'Pontuação usada em --match e --bulk-match (padrão: {matching.DEFAULT_METHOD})')
+    parser.add_argument('--top', type=int, default=matching.DEFAULT_TOP,
+                        help=f'Número máximo de termos ausentes listados em --match (padrão: {matching.DEFAULT_TOP})')
+    parser.add_argument('--bulk-match', metavar='PASTA',
+                        help='Pontuar todos os currículos de --resumes contra todas as vagas (.txt) da pasta e gravar <output-dir>/ranking.csv')
+    parser.add_argument('--resumes', metavar='PASTA',
+                        help='Pasta com os currículos (.json, inclusive em subpastas) usados em --bulk-match')
+    parser.add_argument('--top-n', type=int, default=10,
+                        help='Número de currículos listados por vaga em --bulk-match (padrão: 10)')
+    parser.add_argument('--export-db', action='store_true',
+                        help='Gravar em <output-dir>/curriculo_XX.json os currículos salvos pela interface web')
+    parser.add_argument('--list-owners', action='store_true',
+                        help='Listar os usuários do banco de currículos da interface web')
+    parser.add_argument('--db', metavar='ARQUIVO',
+                        help='Banco de currículos da interface web (padrão: RESUME_DB_PATH ou data/resumes.sqlite3)')
+    parser.add_argument('--owner', help='Usuário exportado em --export-db (padrão: os exemplos compartilhados)')
+    args = parser.parse_args(argv)
+    
+    if args.list_owners:
+        sys.exit(listar_donos(args))
+    
+    if args.export_db:
+        sys.exit(exportar_banco(args))
+    
+    if args.bulk_match:
+        sys.exit(ranquear_curriculos(args))
+    
+    if args.match:
+        sys.exit(comparar_vaga(args))
+    
+    if args.batch or args.size_report:
+        sys.exit(gerar_lote(args))
+    
     opcoes = exibir_menu()
     if opcoes:
         gerar_curriculo(opcoes)
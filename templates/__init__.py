@@ -4,12 +4,39 @@ Este módulo fornece uma classe para gerenciar diferentes templates de currícul
 """
 import os
 import glob
+import threading
 import importlib.util
 
+# Caches compartilhados por todas as instâncias do processo:
+# pasta -> (mtime da pasta, templates descobertos)
+_discovery_cache = {}
+# arquivo do template -> ((mtime, tamanho), módulo carregado)
+_module_cache = {}
+_cache_lock = threading.Lock()
+
+def _file_signature(path):
+    stat = os.stat(path)
+    return (stat.st_mtime_ns, stat.st_size)
+
 class TemplateManager:
-    def __init__(self, template_dir='templates'):
-        self.template_dir = template_dir
-        self.available_templates = self._discover_templates()
+    def __init__(self, template_dir=None):
+        # Por padrão, usar a própria pasta deste pacote (independe do diretório atual)
+        self.template_dir = os.path.abspath(template_dir or os.path.dirname(os.path.abspath(__file__)))
+    
+    @property
+    def available_templates(self):
+        """Templates da pasta; a descoberta só é refeita quando a pasta muda"""
+        try:
+            dir_signature = os.stat(self.template_dir).st_mtime_ns
+        except FileNotFoundError:
+            dir_signature = None
+        cached = _discovery_cache.get(self.template_dir)
+        if cached is not None and cached[0] == dir_signature:
+            return cached[1]
+        templates = self._discover_templates()
+        with _cache_lock:
+            _discovery_cache[self.template_dir] = (dir_signature, templates)
+        return templates
     
     def _discover_templates(self):
         """Descobre todos os templates disponíveis na pasta de templates"""
@@ -36,19 +63,46 @@ class TemplateManager:
         return templates
     
     def get_template(self, template_name):
-        """Carrega um template específico pelo nome"""
-        if template_name not in self.available_templates:
+        """Carrega um template específico pelo nome
+        
+        O módulo é carregado uma vez por processo e só é recarregado quando o
+        arquivo do template muda (mtime ou tamanho).
+        """
+        available_templates = self.available_templates
+        if template_name not in available_templates:
             raise ValueError(f"Template '{template_name}' não encontrado.")
             
-        template_file = self.available_templates[template_name]['file']
+        template_file = available_templates[template_name]['file']
+        signature = _file_signature(template_file)
         
-        # Carregar dinamicamente o módulo de template
-        spec = importlib.util.spec_from_file_location(f"template_{template_name}", template_file)
-        template_module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(template_module)
+        cached = _module_cache.get(template_file)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        
+        with _cache_lock:
+            # Outra thread pode ter carregado o template enquanto esperávamos
+            cached = _module_cache.get(template_file)
+            if cached is not None and cached[0] == signature:
+                return cached[1]
+            
+            # Carregar dinamicamente o módulo de template (sempre um módulo novo,
+            # para não alterar um módulo que ainda esteja em uso)
+            spec = importlib.util.spec_from_file_location(f"template_{template_name}", template_file)
+            template_module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(template_module)
+            
+            _module_cache[template_file] = (signature, template_module)
         
         return template_module
     
+    def get_template_version(self, template_name):
+        """Versão do arquivo do template (mtime e tamanho), ou None se não existir"""
+        info = self.available_templates.get(template_name)
+        if not info:
+            return None
+        mtime_ns, size = _file_signature(info['file'])
+        return f"{mtime_ns}-{size}"
+    
     def list_templates(self):
         """Lista todos os templates disponíveis"""
         return list(self.available_templates.keys())
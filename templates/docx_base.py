@@ -0,0 +1,126 @@
+"""
+Documento base dos templates DOCX, lido uma única vez por processo.
+`Document()` do python-docx descompacta e analisa o pacote .docx padrão a cada
+chamada (só o styles.xml tem cerca de 350 KB). Aqui o pacote é aberto uma vez e
+cada novo documento é um clone barato: as partes binárias são compartilhadas e as
+partes XML só são copiadas quando alguém as acessa. As que não são tocadas durante
+a renderização (estilos, tema, configurações) são gravadas com o XML já serializado
+do documento base.
+"""
+
+import copy
+import threading
+
+from docx import Document
+from docx.enum.style import WD_STYLE_TYPE
+from docx.opc.part import XmlPart
+from docx.package import Package
+
+class _LazyXmlPart:
+    """Parte XML clonada que só copia o XML do documento base quando ele é acessado."""
+
+    _copy = None
+
+    @property
+    def _element(self):
+        if self._copy is None:
+            self._copy = copy.deepcopy(self._base_element)
+        return self._copy
+
+    @_element.setter
+    def _element(self, element):
+        self._copy = element
+
+    @property
+    def blob(self):
+        if self._copy is None:
+            return self._base_blob
+        return XmlPart.blob.fget(self)
+
+_lazy_classes = {}
+
+def _lazy_class(part_class):
+    """Subclasse "preguiçosa" de uma classe de parte XML (StylesPart, SettingsPart...)."""
+    lazy = _lazy_classes.get(part_class)
+    if lazy is None:
+        lazy = type('Lazy' + part_class.__name__, (_LazyXmlPart, part_class), {})
+        _lazy_classes[part_class] = lazy
+    return lazy
+
+class BaseDocument:
+    def __init__(self, docx=None):
+        self.document = Document(docx)
+        self.package = self.document.part.package
+        # XML de cada parte serializado uma única vez, para gravar as partes não tocadas
+        self._blobs = {part: part.blob for part in self.package.iter_parts() if isinstance(part, XmlPart)}
+        self._style_ids = {}
+        self._lock = threading.Lock()
+
+    def new_document(self):
+        """Novo documento, equivalente a `Document()` sem reabrir o pacote."""
+        package = Package()
+        parts = {}
+        main_part = self.document.part
+        for part in self.package.iter_parts():
+            if part is main_part:
+                # O corpo do documento sempre muda: copiado direto
+                parts[part] = type(part)(part.partname, part.content_type, copy.deepcopy(part.element), package)
+            elif isinstance(part, XmlPart):
+                clone = _lazy_class(type(part))(part.partname, part.content_type, None, package)
+                clone._base_element = part.element
+                clone._base_blob = self._blobs[part]
+                parts[part] = clone
+            else:
+                parts[part] = type(part)(part.partname, part.content_type, part.blob, package)
+
+        for source, target in [(self.package, package)] + list(parts.items()):
+            for rel in source.rels.values():
+                target_ref = rel.target_ref if rel.is_external else parts[rel.target_part]
+                target.rels.add_relationship(rel.reltype, target_ref, rel.rId, rel.is_external)
+
+        document_part = parts[main_part]
+        document_part._base_document = self
+        return document_part.document
+
+    def style_id(self, style_name):
+        """Id de um estilo de parágrafo pelo nome (ex.: 'List Bullet' -> 'ListBullet'), em cache."""
+        with self._lock:
+            if style_name not in self._style_ids:
+                self._style_ids[style_name] = self.document.part.get_style_id(style_name, WD_STYLE_TYPE.PARAGRAPH)
+            return self._style_ids[style_name]
+
+_base_document = None
+_base_document_lock = threading.Lock()
+
+def get_base_document():
+    """Documento base compartilhado por todas as renderizações deste processo."""
+    global _base_document
+    with _base_document_lock:
+        if _base_document is None:
+            _base_document = BaseDocument()
+        return _base_document
+
+# Função que cria um documento DOCX novo a partir do documento base em cache
+def new_document():
+    return get_base_document().new_document()
+
+# Função que adiciona vários parágrafos de uma vez, direto no XML do documento
+def add_paragraphs(doc, paragraphs):
+    """`paragraphs` é uma sequência de (texto, nome do estilo ou None).
+
+    Gera o mesmo XML de `doc.add_paragraph(texto, style=...)`, mas sem criar os
+    objetos Paragraph/Run e sem consultar os estilos do documento a cada parágrafo.
+    """
+    base = getattr(doc.part, '_base_document', None)
+    body = doc.element.body
+    for text, style_name in paragraphs:
+        p = body.add_p()
+        if text:
+            p.add_r().text = text
+        if style_name is not None:
+            if base is not None:
+                style_id = base.style_id(style_name)
+            else:
+                style_id = doc.part.get_style_id(style_name, WD_STYLE_TYPE.PARAGRAPH)
+            if style_id is not None:
+                p.style = style_id
@@ -0,0 +1,61 @@
+"""
+Blocos de WordprocessingML (o XML do word/document.xml) montados como texto.
+Usados pelos templates DOCX em fluxo: cada função retorna o mesmo XML que o
+python-docx produziria para o elemento equivalente, sem criar objetos intermediários.
+"""
+
+import re
+
+# Quebras de linha e tabulações viram elementos próprios dentro do run (como no python-docx)
+_SPECIAL_RE = re.compile(r'([\t\r\n])')
+_SPECIAL = {'\t': '<w:tab/>', '\r': '<w:br/>', '\n': '<w:br/>'}
+
+def escape(text):
+    return text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+
+def _text(text):
+    if len(text.strip()) < len(text):
+        return f'<w:t xml:space="preserve">{escape(text)}</w:t>'
+    return f'<w:t>{escape(text)}</w:t>'
+
+# Função que monta um run (trecho de texto com a mesma formatação)
+def run(text, bold=False, color=None, size=None):
+    """`color` em hexadecimal ('2F75B5') e `size` em pontos, como em `RGBColor`/`Pt`."""
+    props = []
+    if bold:
+        props.append('<w:b/>')
+    if color:
+        props.append(f'<w:color w:val="{color}"/>')
+    if size:
+        props.append(f'<w:sz w:val="{int(size * 2)}"/>')
+    parts = ['<w:r>']
+    if props:
+        parts.append(f'<w:rPr>{"".join(props)}</w:rPr>')
+    if text:
+        for piece in _SPECIAL_RE.split(text):
+            if piece in _SPECIAL:
+                parts.append(_SPECIAL[piece])
+            elif piece:
+                parts.append(_text(piece))
+    parts.append('</w:r>')
+    return ''.join(parts)
+
+# Função que monta um parágrafo a partir de runs já montados
+def paragraph(runs='', style_id=None, align=None):
+    """`style_id` é o id do estilo (ex.: 'ListBullet') e `align` o valor de w:jc ('left', 'center'...)."""
+    props = []
+    if style_id:
+        props.append(f'<w:pStyle w:val="{style_id}"/>')
+    if align:
+        props.append(f'<w:jc w:val="{align}"/>')
+    if props:
+        return f'<w:p><w:pPr>{"".join(props)}</w:pPr>{runs}</w:p>'
+    return f'<w:p>{runs}</w:p>'
+
+# Função que monta um parágrafo simples, como `doc.add_paragraph(texto, style=...)`
+def text_paragraph(text, style_id=None):
+    return paragraph(run(text) if text else '', style_id)
+
+# Função que monta um parágrafo com quebra de página
+def page_break():
+    return '<w:p><w:r><w:br w:type="page"/></w:r></w:p>'
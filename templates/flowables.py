@@ -0,0 +1,143 @@
+"""
+Flowables próprios usados pelos templates PDF.
+Em vez de montar tabelas, espaçadores e parágrafos para cada habilidade, `SkillBars`
+desenha a lista inteira (nome + quadrados de nível) diretamente no canvas.
+"""
+
+from functools import lru_cache
+
+from reportlab.lib import colors
+from reportlab.pdfbase import pdfmetrics
+from reportlab.platypus import Flowable
+
+from templates.font_registry import get_font_registry
+
+class SkillBarStyle:
+    """Aparência de uma lista de barras de habilidade.
+
+    As medidas são em pontos, a partir do topo de cada linha. O texto fica em uma
+    coluna de largura `text_width` centralizada no quadro (como a antiga tabela) e os
+    quadrados ficam centralizados no quadro. `filled` e `empty` são tuplas
+    (cor de preenchimento ou None, cor da borda, espessura da borda).
+
+    O estilo é compartilhado por todas as renderizações do processo e guarda as
+    métricas derivadas da fonte: os trechos de cada rótulo já medidos.
+    """
+
+    def __init__(self, font_name, font_size, row_height, text_width, text_padding, text_offset,
+                 box_size, box_offset, filled, empty, label='{}', text_color=colors.black):
+        self.font_name = font_name
+        self.font_size = font_size
+        self.row_height = row_height
+        self.text_width = text_width
+        self.text_padding = text_padding
+        self.text_offset = text_offset
+        self.box_size = box_size
+        self.box_offset = box_offset
+        self.filled = filled
+        self.empty = empty
+        self.label = label
+        self.text_color = text_color
+        self.label_runs = lru_cache(maxsize=1024)(self._label_runs)
+
+    # Somente leitura depois de montado: as cópias dos flowables em cache usam o mesmo estilo
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def _label_runs(self, name):
+        """Trechos (fonte, texto, largura) do rótulo de uma habilidade.
+
+        Caracteres que a fonte base não cobre ficam em trechos com a fonte de fallback.
+        """
+        text = self.label.format(name)
+        runs = get_font_registry().split_runs(text, self.font_name) if not text.isascii() else ((self.font_name, text),)
+        return tuple((font, run, pdfmetrics.stringWidth(run, font, self.font_size)) for font, run in runs)
+
+class SkillBars(Flowable):
+    """Lista de habilidades com barras de nível, em um único flowable.
+
+    `skills` é uma sequência de (nome, nível). Pode ser dividida entre páginas,
+    sempre entre duas habilidades.
+    """
+
+    def __init__(self, skills, style, max_level=5):
+        Flowable.__init__(self)
+        self.skills = tuple(skills)
+        self.style = style
+        self.max_level = max_level
+
+    def wrap(self, availWidth, availHeight):
+        self.width = availWidth
+        self.height = len(self.skills) * self.style.row_height
+        return self.width, self.height
+
+    def split(self, availWidth, availHeight):
+        rows = int((availHeight + 1e-6) // self.style.row_height)
+        if rows <= 0:
+            return []
+        if rows >= len(self.skills):
+            return [self]
+        return [SkillBars(self.skills[:rows], self.style, self.max_level),
+                SkillBars(self.skills[rows:], self.style, self.max_level)]
+
+    def draw(self):
+        style = self.style
+        canv = self.canv
+        text_x = (self.width - style.text_width) / 2 + style.text_padding
+        boxes_x = (self.width - self.max_level * style.box_size) / 2
+
+        canv.saveState()
+        # Mesmas pontas e junções arredondadas das bordas de tabela do reportlab
+        canv.setLineCap(1)
+        canv.setLineJoin(1)
+        canv.setFillColor(style.text_color)
+        self._font = None
+
+        # Quadrados agrupados por aparência: cada grupo vira um único caminho no PDF
+        filled, empty = [], []
+        for row, (name, level) in enumerate(self.skills):
+            top = self.height - row * style.row_height
+            self._draw_label(text_x, top - style.text_offset, name)
+
+            y = top - style.box_offset - style.box_size
+            for i in range(self.max_level):
+                (filled if i < level else empty).append((boxes_x + i * style.box_size, y))
+
+        # Primeiro os preenchimentos, depois as bordas (preenchidos antes dos vazios, como em cada linha)
+        for (fill, _, _), positions in ((style.filled, filled), (style.empty, empty)):
+            if fill is not None and positions:
+                canv.setFillColor(fill)
+                canv.drawPath(self._boxes_path(positions), stroke=0, fill=1)
+        if style.filled[1:] == style.empty[1:]:
+            # Mesma borda nos dois tipos de quadrado: um único caminho basta
+            strokes = ((style.filled, filled + empty),)
+        else:
+            strokes = ((style.filled, filled), (style.empty, empty))
+        for (_, stroke, width), positions in strokes:
+            if positions:
+                canv.setStrokeColor(stroke)
+                canv.setLineWidth(width)
+                canv.drawPath(self._boxes_path(positions), stroke=1, fill=0)
+
+        canv.restoreState()
+
+    def _boxes_path(self, positions):
+        size = self.style.box_size
+        path = self.canv.beginPath()
+        for x, y in positions:
+            path.rect(x, y, size, size)
+        return path
+
+    def _draw_label(self, x, y, name):
+        """Escreve o rótulo trecho a trecho, com fontes de fallback para o que a fonte base não cobre."""
+        style = self.style
+        for font, run, width in style.label_runs(name):
+            # Trocar de fonte só quando necessário: cada troca é um comando no PDF
+            if font != self._font:
+                self.canv.setFont(font, style.font_size)
+                self._font = font
+            self.canv.drawString(x, y, run)
+            x += width
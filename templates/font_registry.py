@@ -0,0 +1,200 @@
+"""
+Registro de fontes de fallback para os templates PDF.
+As fontes padrão do PDF (Times-Roman, Helvetica...) só cobrem o Latin-1, de modo
+que emojis e nomes com caracteres não latinos saíam como quadrados pretos. Este
+módulo registra, uma única vez por processo, fontes TrueType com maior cobertura e
+monta um índice caractere -> fonte. O texto é dividido em trechos por fonte no
+momento da renderização (com a divisão em cache) e o reportlab incorpora apenas o
+subconjunto de glifos realmente usados.
+"""
+
+import os
+import re
+import threading
+from functools import lru_cache
+
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.ttfonts import TTFont
+from reportlab.pdfbase.rl_codecs import RL_Codecs  # registra os codecs das codificações do PDF
+from reportlab.lib.fonts import addMapping
+from reportlab.platypus import Paragraph
+
+# Fontes TrueType procuradas, em ordem de preferência (as que não existirem são ignoradas).
+# PDF_FALLBACK_FONTS (caminhos separados por os.pathsep) tem prioridade sobre estas.
+_WINDOWS_FONTS = os.path.join(os.environ.get('WINDIR', r'C:\Windows'), 'Fonts')
+DEFAULT_FALLBACK_FONTS = [
+    # Linux
+    '/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf',
+    '/usr/share/fonts/dejavu-sans-fonts/DejaVuSans.ttf',
+    '/usr/share/fonts/TTF/DejaVuSans.ttf',
+    '/usr/share/fonts/truetype/noto/NotoSans-Regular.ttf',
+    '/usr/share/fonts/truetype/noto/NotoSansSymbols2-Regular.ttf',
+    '/usr/share/fonts/truetype/noto/NotoEmoji-Regular.ttf',
+    '/usr/share/fonts/truetype/ancient-scripts/Symbola_hint.ttf',
+    # macOS
+    '/System/Library/Fonts/Supplemental/Arial Unicode.ttf',
+    '/Library/Fonts/Arial Unicode.ttf',
+    # Windows
+    os.path.join(_WINDOWS_FONTS, 'seguisym.ttf'),
+    os.path.join(_WINDOWS_FONTS, 'seguiemj.ttf'),
+    os.path.join(_WINDOWS_FONTS, 'arialuni.ttf'),
+]
+
+# Fontes padrão do PDF (nunca incorporadas ao arquivo) usadas como fallback: os
+# símbolos do ZapfDingbats (■, ☎, ✉...) têm prioridade sobre as fontes TrueType e o
+# Symbol (letras gregas, sinais matemáticos) só é usado se nenhuma delas tiver o caractere
+STANDARD_FONTS_BEFORE = ('ZapfDingbats',)
+STANDARD_FONTS_AFTER = ('Symbol',)
+
+# Caracteres que não têm glifo próprio e acompanham a fonte do caractere anterior
+# (seletores de variação dos emojis e o "zero width joiner")
+_COMBINING = frozenset(chr(code) for code in list(range(0xFE00, 0xFE10)) + [0x200D])
+
+# Tags da marcação do Paragraph, que não devem ser divididas
+_TAG_RE = re.compile(r'(<[^>]*>)')
+
+def _encoding_codec(font):
+    return font.encoding.name.replace('Encoding', '').lower()
+
+def _encoding_chars(font_name):
+    """Pontos de código (não ASCII) que uma fonte padrão do PDF tem na sua codificação."""
+    codec = _encoding_codec(pdfmetrics.getFont(font_name))
+    chars = set()
+    for code in range(128, 256):
+        try:
+            char = bytes([code]).decode(codec)
+        except (UnicodeDecodeError, LookupError):
+            continue
+        if len(char) == 1 and char != '\ufffd':
+            chars.add(ord(char))
+    for code in range(32, 128):
+        char = bytes([code]).decode(codec, errors='replace')
+        if len(char) == 1 and not char.isascii():
+            chars.add(ord(char))
+    return chars
+
+def get_fallback_paths():
+    """Caminhos das fontes candidatas: PDF_FALLBACK_FONTS seguido dos padrões do sistema."""
+    extra = [path for path in os.environ.get('PDF_FALLBACK_FONTS', '').split(os.pathsep) if path]
+    return extra + DEFAULT_FALLBACK_FONTS
+
+class FontRegistry:
+    def __init__(self, paths=None):
+        self.paths = list(paths) if paths is not None else get_fallback_paths()
+        self.fonts = []         # Nomes das fontes TrueType registradas, em ordem de preferência
+        self._index = None      # Ponto de código -> nome da fonte de fallback
+        self._base_coverage = {}
+        self._lock = threading.Lock()
+        self.split_runs = lru_cache(maxsize=4096)(self._split_runs)
+
+    def _load(self):
+        """Registra as fontes encontradas e monta o índice de cobertura (uma única vez)."""
+        with self._lock:
+            if self._index is not None:
+                return
+            coverage = [(name, _encoding_chars(name)) for name in STANDARD_FONTS_BEFORE]
+            for path in self.paths:
+                if not path.lower().endswith('.ttf') or not os.path.isfile(path):
+                    continue
+                name = 'Fallback-' + re.sub(r'[^A-Za-z0-9]+', '', os.path.splitext(os.path.basename(path))[0])
+                if name in self.fonts:
+                    continue
+                try:
+                    # Só caracteres fora da fonte base chegam aqui: sem reservar o bloco ASCII
+                    # no subconjunto, apenas os glifos realmente usados são incorporados
+                    font = TTFont(name, path, asciiReadable=False)
+                except Exception as e:
+                    # Fontes só com glifos coloridos ou em CFF não são suportadas pelo reportlab
+                    print(f"Aviso: Fonte '{path}' ignorada: {str(e)}")
+                    continue
+                pdfmetrics.registerFont(font)
+                # Negrito e itálico usam a mesma fonte, para que <b>/<i> não falhem
+                for bold in (0, 1):
+                    for italic in (0, 1):
+                        addMapping(name, bold, italic, name)
+                self.fonts.append(name)
+                coverage.append((name, font.face.charToGlyph))
+
+            coverage.extend((name, _encoding_chars(name)) for name in STANDARD_FONTS_AFTER)
+
+            # Fontes mais prioritárias sobrescrevem as demais
+            index = {}
+            for name, chars in reversed(coverage):
+                index.update(dict.fromkeys(chars, name))
+            self._index = index
+
+    def _covers(self, font_name, char):
+        """Indica se a fonte base tem o caractere (TTF pelo cmap, fontes padrão pela codificação)."""
+        covered = self._base_coverage.get(font_name)
+        if covered is None:
+            font = pdfmetrics.getFont(font_name)
+            if isinstance(font, TTFont):
+                chars = font.face.charToGlyph
+                covered = lambda c: ord(c) in chars
+            else:
+                codec = _encoding_codec(font)
+                def covered(c, codec=codec):
+                    try:
+                        c.encode(codec)
+                        return True
+                    except (UnicodeEncodeError, LookupError):
+                        return False
+            self._base_coverage[font_name] = covered
+        return covered(char)
+
+    def font_for(self, char, base_font):
+        """Fonte usada para um caractere: a base se ela o tiver, senão a primeira que o cobrir."""
+        if char.isascii() or self._covers(base_font, char):
+            return base_font
+        if self._index is None:
+            self._load()
+        return self._index.get(ord(char), base_font)
+
+    def _split_runs(self, text, base_font):
+        runs = []
+        current_font = base_font
+        start = 0
+        for position, char in enumerate(text):
+            if char in _COMBINING:
+                continue
+            font = self.font_for(char, base_font)
+            if font != current_font:
+                if position > start:
+                    runs.append((current_font, text[start:position]))
+                current_font = font
+                start = position
+        if start < len(text):
+            runs.append((current_font, text[start:]))
+        return tuple(runs)
+
+    def markup(self, text, base_font):
+        """Envolve em <font name=...> os trechos da marcação que a fonte base não cobre."""
+        if text.isascii():
+            return text
+        parts = []
+        for part in _TAG_RE.split(text):
+            if not part or part.startswith('<'):
+                parts.append(part)
+                continue
+            for font, run in self.split_runs(part, base_font):
+                parts.append(run if font == base_font else f'<font name="{font}">{run}</font>')
+        return ''.join(parts)
+
+_font_registry = None
+_font_registry_lock = threading.Lock()
+
+def get_font_registry():
+    """Registro de fontes compartilhado por todas as renderizações deste processo."""
+    global _font_registry
+    with _font_registry_lock:
+        if _font_registry is None:
+            _font_registry = FontRegistry()
+        return _font_registry
+
+# Função de conveniência para textos de Paragraph
+def fallback_markup(text, font_name):
+    return get_font_registry().markup(text, font_name)
+
+# Função que cria um Paragraph com os trechos não cobertos pela fonte do estilo em fontes de fallback
+def paragraph(text, style):
+    return Paragraph(fallback_markup(text, style.fontName), style)
@@ -0,0 +1,66 @@
+"""
+Conjuntos de estilos imutáveis compartilhados pelos templates PDF.
+Os estilos de um template são montados uma única vez por processo e usados por todas
+as renderizações (e pelas chaves do cache de seções), então nenhum chamador pode
+alterá-los: cada estilo é congelado e qualquer atribuição gera erro.
+Para um estilo diferente, crie um novo `ParagraphStyle` com o congelado como `parent`.
+"""
+
+from types import MappingProxyType
+
+from reportlab.lib.styles import PropertySet, StyleSheet1
+
+class FrozenStyle:
+    """Mistura que torna um estilo do reportlab somente leitura."""
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"O estilo '{self.name}' é compartilhado e não pode ser alterado")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"O estilo '{self.name}' é compartilhado e não pode ser alterado")
+
+    # O reportlab exige que o pai de um estilo seja exatamente da mesma classe
+    # (ParagraphStyle('X', parent=congelado) compara __class__)
+    @property
+    def __class__(self):
+        return type(self).style_class
+
+    # Imutável: cópias (inclusive as profundas, das seções em cache) usam o próprio objeto
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+# Classe do estilo (ParagraphStyle, ListStyle...) -> subclasse congelada
+_frozen_classes = {}
+
+def freeze_style(style):
+    """Cópia congelada de um estilo do reportlab."""
+    if isinstance(style, FrozenStyle):
+        return style
+    cls = type(style)
+    frozen_cls = _frozen_classes.get(cls)
+    if frozen_cls is None:
+        frozen_cls = _frozen_classes.setdefault(cls, type('Frozen' + cls.__name__, (FrozenStyle, cls), {'style_class': cls}))
+    frozen = frozen_cls.__new__(frozen_cls)
+    # Cópia direta das propriedades: o __init__ passaria pelo __setattr__ bloqueado.
+    # Um estilo filho copia o __dict__ do pai, então herda os valores normalmente.
+    frozen.__dict__.update(style.__dict__)
+    return frozen
+
+# Função que congela o conjunto de estilos montado por um template
+def freeze_styles(styles):
+    """Mapeamento somente leitura com todos os estilos congelados.
+
+    A folha de estilos de exemplo do reportlab (`StyleSheet1`) vira um mapeamento
+    somente leitura nome -> estilo congelado.
+    """
+    frozen = {}
+    for key, value in styles.items():
+        if isinstance(value, StyleSheet1):
+            value = MappingProxyType({name: freeze_style(value[name]) for name in value.byName})
+        elif isinstance(value, PropertySet):
+            value = freeze_style(value)
+        frozen[key] = value
+    return MappingProxyType(frozen)
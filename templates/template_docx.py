@@ -12,6 +12,8 @@ from docx.enum.table import WD_TABLE_ALIGNMENT
 from docx.oxml import parse_xml
 from docx.shared import Inches
 
+from templates.docx_base import new_document
+
 # Função para adicionar título visual
 def add_title(doc, nome, email, telefone, linkedin):
     # Nome grande
@@ -62,6 +64,6 @@ def add_page_break(doc):
     run = doc.add_paragraph().add_run()
     run.add_break(WD_BREAK.PAGE)
 
-# Criar um novo documento DOCX
+# Criar um novo documento DOCX (clone do documento base, lido uma única vez)
 def create_document():
-    return Document()
+    return new_document()
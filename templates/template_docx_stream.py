@@ -0,0 +1,60 @@
+"""
+Template para geração de currículos em formato DOCX, gravado em fluxo.
+Mesmo layout do template 'docx', mas cada elemento é produzido diretamente como XML
+e o word/document.xml é escrito no ZIP parágrafo a parágrafo (ver
+`curriculo/docx_stream.py`), sem montar o documento inteiro em memória. Indicado
+para exportações em lote e currículos muito longos.
+"""
+
+from templates.docx_base import get_base_document
+from templates.docx_xml import run, paragraph, text_paragraph, page_break
+
+# Indica ao gerador DOCX que este template é gravado em fluxo
+STREAMING = True
+
+AZUL = '2F75B5'
+
+# Função para o título visual (nome e linha de contato)
+def title_xml(nome, email, telefone, linkedin):
+    # Nome grande
+    yield paragraph(run(nome, bold=True, size=22), align='left')
+    # Linha de contato com ícones (texto)
+    runs = []
+    if email:
+        runs.append(run("📧 ", bold=True))
+        runs.append(run(email + "   "))
+    if telefone:
+        runs.append(run("📱 ", bold=True))
+        runs.append(run(telefone + "   "))
+    if linkedin:
+        runs.append(run("🌐 ", bold=True))
+        runs.append(run(linkedin))
+    yield paragraph(''.join(runs), align='left')
+
+    # Linha
+    yield paragraph(run("―" * 50))
+
+# Função para título de seção com bloco colorido
+def section_title_xml(title):
+    return paragraph(run("■ ", bold=True, color=AZUL, size=14) + run(title, bold=True, size=14), align='left')
+
+# Função para barra de skill
+def skill_bar_xml(skill, level=5, max_level=5):
+    bar = "■" * level + "□" * (max_level-level)
+    return paragraph(run(skill + ": ", size=11) + run(bar, color=AZUL))
+
+# Função para item de lista com marcador
+def bullet_xml(text):
+    return text_paragraph(text, get_base_document().style_id('List Bullet'))
+
+# Função para parágrafo de texto simples
+def text_xml(text):
+    return text_paragraph(text)
+
+# Função para certificação (ícone em negrito + texto)
+def certification_xml(cert):
+    return paragraph(run("🏅 ", bold=True) + run(cert))
+
+# Função para quebra de página
+def page_break_xml():
+    return page_break()
@@ -8,12 +8,15 @@ from reportlab.lib import colors
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, ListFlowable, ListItem, Table, TableStyle, PageBreak
 from reportlab.lib.units import inch, cm
+from templates.styles import freeze_styles
+from templates.flowables import SkillBarStyle, SkillBars
+from templates.font_registry import paragraph
 from reportlab.pdfgen import canvas
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
 
 # Configuração de estilos
-def get_styles():
+def _build_styles():
     styles = getSampleStyleSheet()
     
     # Adicionar estilos personalizados
@@ -61,92 +64,77 @@ def get_styles():
         leading=14,
     )
     
+    linha_style = ParagraphStyle(
+        'Linha',
+        parent=styles['Normal'],
+        fontName='Times-Roman',
+        fontSize=8,
+    )
+    
     return {
         'base': styles,
         'nome': nome_style,
         'contato': contato_style,
         'secao': secao_style,
         'normal': normal_style,
-        'bullet': bullet_style
+        'bullet': bullet_style,
+        'linha': linha_style
     }
 
+
+# Estilos já montados e congelados (ver templates/styles.py), compartilhados por todas
+# as renderizações deste processo.
+# O template é recarregado quando o arquivo muda, o que também descarta este cache.
+_styles_cache = None
+
+# Função que retorna os estilos do template (montados uma única vez por processo)
+def get_styles():
+    global _styles_cache
+    if _styles_cache is None:
+        _styles_cache = freeze_styles(_build_styles())
+    return _styles_cache
+
 # Função para adicionar título
 def add_title(elements, nome, email, telefone, linkedin, styles):
-    elements.append(Paragraph(nome, styles['nome']))
+    elements.append(paragraph(nome, styles['nome']))
     
     contato_text = f"📧 {email}   📱 {telefone}   🌐 {linkedin}"
-    elements.append(Paragraph(contato_text, styles['contato']))
+    elements.append(paragraph(contato_text, styles['contato']))
     
     # Linha horizontal
-    elements.append(Paragraph("_" * 70, ParagraphStyle(
-        'Linha',
-        parent=styles['base']['Normal'],
-        fontName='Times-Roman',
-        fontSize=8,
-    )))
+    elements.append(paragraph("_" * 70, styles['linha']))
     elements.append(Spacer(1, 0.1*inch))
 
 # Função para adicionar seção
 def add_section_title(elements, title, styles):
     section_text = f"<font color='#2F75B5'>■</font> {title}"
-    elements.append(Paragraph(section_text, styles['secao']))
+    elements.append(paragraph(section_text, styles['secao']))
+
+# Cor azul usada no documento
+AZUL = colors.Color(47/255, 117/255, 181/255)
+
+# Aparência das barras de habilidade (mesmas posições da antiga montagem com tabelas)
+SKILL_BAR_STYLE = SkillBarStyle(
+    font_name='Times-Roman',
+    font_size=11,
+    label='{}:',
+    row_height=21.92,       # Texto (18pt) - 0.22in + linha em branco (14pt) + 0.08in
+    text_width=5.5*inch,
+    text_padding=6,
+    text_offset=14,
+    box_size=0.15*inch,
+    box_offset=5.36,
+    filled=(AZUL, AZUL, 0.5),
+    empty=(None, AZUL, 0.5),
+)
+
+# Função para adicionar uma lista de barras de skill (pares nome, nível) em um único flowable
+def add_skill_bars(elements, skills, styles, max_level=5):
+    elements.append(SkillBars(skills, SKILL_BAR_STYLE, max_level))
 
 # Função para adicionar barra de skill
 def add_skill_bar(elements, skill, styles, level=5, max_level=5):
-    # Definir a cor azul usada no documento
-    azul = colors.Color(47/255, 117/255, 181/255)
-    
-    # Criar dados da tabela - uma célula para o texto e uma para cada quadrado da barra
-    data = [[f"{skill}:"]]
-    
-    # Definir estilo da tabela principal
-    style = TableStyle([
-        ('FONTSIZE', (0,0), (0,0), 11),
-        ('FONTNAME', (0,0), (0,0), 'Times-Roman'),
-        ('VALIGN', (0,0), (0,0), 'MIDDLE'),
-        ('ALIGN', (0,0), (0,0), 'LEFT'),
-    ])
-    
-    # Criar a tabela com o texto da habilidade
-    table = Table(data, colWidths=[5.5*inch])
-    table.setStyle(style)
-    elements.append(table)
-    
-    # Tamanhos dos quadrados azuis
-    square_size = 0.15*inch  
-    
-    # Criar a barra como uma nova tabela logo abaixo
-    boxes_data = [['']*max_level] 
-    boxes_style = TableStyle([
-        ('GRID', (0,0), (-1,-1), 0, colors.white),  # Sem grade interna
-    ])
-    
-    # Adicionar estilo para cada caixa na barra
-    for i in range(max_level):
-        if i < level:
-            # Quadrado preenchido para níveis atingidos
-            boxes_style.add('BACKGROUND', (i,0), (i,0), azul)
-            boxes_style.add('BOX', (i,0), (i,0), 0.5, azul)  # Borda azul
-        else:
-            # Quadrado vazio para níveis não preenchidos
-            boxes_style.add('BOX', (i,0), (i,0), 0.5, azul)  # Apenas borda
-    
-    # Deslocar para posicionar a barra ao lado do texto da habilidade
-    elements.append(Spacer(1, -0.22*inch))  # Ajustando posição vertical
-    
-    # Adicionar espaço em branco para posicionar a barra à direita
-    elements.append(Paragraph("&nbsp;" * 40, styles['normal']))
-    
-    # Deslocar verticalmente para alinhar com o texto
-    elements.append(Spacer(1, -0.15*inch))  # Ajustando para os quadrados menores
-    
-    # Adicionar a barra de habilidade com quadrados menores
-    boxes_table = Table(boxes_data, colWidths=[square_size]*max_level, rowHeights=[square_size])
-    boxes_table.setStyle(boxes_style)
-    elements.append(boxes_table)
-    
-    # Espaço após a barra completa
-    elements.append(Spacer(1, 0.08*inch))
+    add_skill_bars(elements, [(skill, level)], styles, max_level)
 
 # Função para adicionar quebra de página
 def add_page_break(elements):
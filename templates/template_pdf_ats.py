@@ -9,8 +9,11 @@ from reportlab.lib import colors
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak, Image
 from reportlab.lib.units import inch, cm
+from templates.styles import freeze_styles
 from io import BytesIO
 
+from curriculo.locale_packs import get_locale_pack
+
 # Definir cores do template - cores sóbrias para melhor reconhecimento ATS
 PRETO = colors.black
 CINZA_ESCURO = colors.Color(0.2, 0.2, 0.2)
@@ -18,7 +21,7 @@ CINZA_MEDIO = colors.Color(0.5, 0.5, 0.5)
 CINZA_CLARO = colors.Color(0.9, 0.9, 0.9)
 
 # Configuração de estilos otimizados para ATS
-def get_styles():
+def _build_styles():
     styles = getSampleStyleSheet()
     
     # Adicionar estilos personalizados com fontes e formatações simples para melhor leitura ATS
@@ -101,24 +104,41 @@ def get_styles():
         'keyword': keyword_style
     }
 
+
+# Estilos já montados e congelados (ver templates/styles.py), compartilhados por todas
+# as renderizações deste processo.
+# O template é recarregado quando o arquivo muda, o que também descarta este cache.
+_styles_cache = None
+
+# Função que retorna os estilos do template (montados uma única vez por processo)
+def get_styles():
+    global _styles_cache
+    if _styles_cache is None:
+        _styles_cache = freeze_styles(_build_styles())
+    return _styles_cache
+
+# Estilo da linha divisória do cabeçalho, montado uma única vez
+LINE_STYLE = TableStyle([
+    ('GRID', (0,0), (-1,-1), 0.5, CINZA_MEDIO),
+    ('BACKGROUND', (0,0), (-1,-1), CINZA_MEDIO),
+])
+
 # Função para adicionar título - simplificado para melhor compatibilidade ATS
-def add_title(elements, nome, email, telefone, linkedin, styles):
+def add_title(elements, nome, email, telefone, linkedin, styles, labels=None):
     # Nome com estilo claro para ATS
     elements.append(Paragraph(nome, styles['nome']))
     
     # Contato formatado com rótulos explícitos para melhor reconhecimento ATS
-    contact_info = f"E-mail: {email} | Telefone: {telefone} | LinkedIn: {linkedin}"
+    labels = labels or {}
+    contact_info = (f"{labels.get('email', 'E-mail')}: {email} | {labels.get('phone', 'Telefone')}: {telefone} | "
+                    f"{labels.get('linkedin', 'LinkedIn')}: {linkedin}")
     elements.append(Paragraph(contact_info, styles['contato']))
     
     # Linha divisória simples
     elements.append(Spacer(1, 0.1*inch))
     data = [['']]
-    line_style = TableStyle([
-        ('GRID', (0,0), (-1,-1), 0.5, CINZA_MEDIO),
-        ('BACKGROUND', (0,0), (-1,-1), CINZA_MEDIO),
-    ])
     line_table = Table(data, colWidths=[7.5*inch], rowHeights=[0.01*inch])
-    line_table.setStyle(line_style)
+    line_table.setStyle(LINE_STYLE)
     elements.append(line_table)
     elements.append(Spacer(1, 0.2*inch))
 
@@ -132,58 +152,22 @@ def add_skill_bar(elements, skill, styles, level=5, max_level=5):
     # Usar o método add_skill em vez disso
     add_skill(elements, skill, styles, level, max_level)
 
-# Função para adicionar competência - formato de texto plano com nível explícito para ATS
-def add_skill(elements, skill, styles, level=5, max_level=5, lang='pt'): # Add lang parameter
-    # Representação textual do nível para melhor reconhecimento ATS
-    level_text = ""
-    
+# Função que traduz o nível numérico de uma competência (nomes vindos do pacote do idioma)
+def get_skill_level_text(skill, level, lang='pt'):
     # Convert level to int if it's a string, with error handling
     try:
         current_level = int(level)
     except ValueError:
         # Fallback or error message if level is not a valid number string
         print(f"Warning: Invalid skill level '{level}' for skill '{skill}'. Using default.")
-        current_level = 3 # Default to Intermediate
-
-    if lang == 'en':
-        if current_level == 1:
-            level_text = "Basic"
-        elif current_level == 2:
-            level_text = "Lower Intermediate"
-        elif current_level == 3:
-            level_text = "Intermediate"
-        elif current_level == 4:
-            level_text = "Advanced"
-        elif current_level == 5:
-            level_text = "Expert"
-        else:
-            level_text = "Intermediate" # Default for unknown levels
-    elif lang == 'es':
-        if current_level == 1:
-            level_text = "Básico"
-        elif current_level == 2:
-            level_text = "Intermedio Bajo"
-        elif current_level == 3:
-            level_text = "Intermedio"
-        elif current_level == 4:
-            level_text = "Avanzado"
-        elif current_level == 5:
-            level_text = "Experto"
-        else:
-            level_text = "Intermedio" # Default for unknown levels
-    else: # Default to Portuguese (pt)
-        if current_level == 1:
-            level_text = "Básico"
-        elif current_level == 2:
-            level_text = "Intermediário Baixo"
-        elif current_level == 3:
-            level_text = "Intermediário"
-        elif current_level == 4:
-            level_text = "Avançado"
-        elif current_level == 5:
-            level_text = "Especialista"
-        else:
-            level_text = "Intermediário" # Default for unknown levels
+        current_level = None # Nível padrão do idioma (Intermediário)
+
+    return get_locale_pack(lang).level_text(current_level)
+
+# Função para adicionar competência - formato de texto plano com nível explícito para ATS
+def add_skill(elements, skill, styles, level=5, max_level=5, lang='pt'): # Add lang parameter
+    # Representação textual do nível para melhor reconhecimento ATS
+    level_text = get_skill_level_text(skill, level, lang)
     
     # Formatar competência com nível para melhor leitura do ATS
     skill_text = f"{skill}: {level_text}"
@@ -8,6 +8,9 @@ from reportlab.lib import colors
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak, Image
 from reportlab.lib.units import inch, cm
+from templates.styles import freeze_styles
+from templates.flowables import SkillBarStyle, SkillBars
+from templates.font_registry import paragraph
 from io import BytesIO
 
 # Definir cores do template moderno
@@ -16,7 +19,7 @@ AZUL_CLARO = colors.Color(0.6, 0.8, 0.9)
 CINZA = colors.Color(0.9, 0.9, 0.9)
 
 # Configuração de estilos
-def get_styles():
+def _build_styles():
     styles = getSampleStyleSheet()
     
     # Adicionar estilos personalizados
@@ -78,94 +81,80 @@ def get_styles():
         'bullet': bullet_style
     }
 
+
+# Estilos já montados e congelados (ver templates/styles.py), compartilhados por todas
+# as renderizações deste processo.
+# O template é recarregado quando o arquivo muda, o que também descarta este cache.
+_styles_cache = None
+
+# Função que retorna os estilos do template (montados uma única vez por processo)
+def get_styles():
+    global _styles_cache
+    if _styles_cache is None:
+        _styles_cache = freeze_styles(_build_styles())
+    return _styles_cache
+
 # Função para adicionar título
 def add_title(elements, nome, email, telefone, linkedin, styles):
     # Cabeçalho com cores modernas
     data = [['']]
     
-    # Define a cor de fundo
-    header_style = TableStyle([
-        ('BACKGROUND', (0,0), (0,0), AZUL_CLARO),
-        ('GRID', (0,0), (-1,-1), 0, colors.white),
-    ])
-    
     header_table = Table(data, colWidths=[7.5*inch], rowHeights=[0.5*inch])
-    header_table.setStyle(header_style)
+    header_table.setStyle(HEADER_STYLE)
     elements.append(header_table)
     elements.append(Spacer(1, 0.3*inch))
     
     # Nome com estilo moderno
-    elements.append(Paragraph(nome, styles['nome']))
+    elements.append(paragraph(nome, styles['nome']))
     
     # Informações de contato com ícones
-    elements.append(Paragraph(f"📧 {email} | 📱 {telefone} | 🌐 {linkedin}", styles['contato']))
+    elements.append(paragraph(f"📧 {email} | 📱 {telefone} | 🌐 {linkedin}", styles['contato']))
     
     # Linha divisória
     elements.append(Spacer(1, 0.1*inch))
     data = [['']]
-    line_style = TableStyle([
-        ('GRID', (0,0), (-1,-1), 0.5, AZUL_ESCURO),
-        ('BACKGROUND', (0,0), (-1,-1), AZUL_ESCURO),
-    ])
     line_table = Table(data, colWidths=[7.5*inch], rowHeights=[0.03*inch])
-    line_table.setStyle(line_style)
+    line_table.setStyle(LINE_STYLE)
     elements.append(line_table)
     elements.append(Spacer(1, 0.2*inch))
 
 # Função para adicionar seção
 def add_section_title(elements, title, styles):
     # Título da seção com estilo moderno
-    elements.append(Paragraph(title, styles['secao']))
+    elements.append(paragraph(title, styles['secao']))
+
+# Estilos de tabela fixos, montados uma única vez
+HEADER_STYLE = TableStyle([
+    ('BACKGROUND', (0,0), (0,0), AZUL_CLARO),
+    ('GRID', (0,0), (-1,-1), 0, colors.white),
+])
+
+LINE_STYLE = TableStyle([
+    ('GRID', (0,0), (-1,-1), 0.5, AZUL_ESCURO),
+    ('BACKGROUND', (0,0), (-1,-1), AZUL_ESCURO),
+])
+
+# Aparência das barras de habilidade (mesmas posições da antiga montagem com tabelas)
+SKILL_BAR_STYLE = SkillBarStyle(
+    font_name='Helvetica',
+    font_size=11,
+    row_height=28.4,        # Texto (0.3in) - 0.25in + linha em branco (14pt) + 0.15in
+    text_width=7.5*inch,
+    text_padding=6,
+    text_offset=15.8,
+    box_size=0.2*inch,
+    box_offset=3.2,
+    filled=(AZUL_ESCURO, AZUL_ESCURO, 1),
+    empty=(CINZA, AZUL_CLARO, 0.5),
+)
+
+# Função para adicionar uma lista de barras de skill (pares nome, nível) em um único flowable
+def add_skill_bars(elements, skills, styles, max_level=5):
+    elements.append(SkillBars(skills, SKILL_BAR_STYLE, max_level))
 
 # Função para adicionar barra de skill
 def add_skill_bar(elements, skill, styles, level=5, max_level=5):
-    # Criar tabela para a barra de habilidade com o nome da habilidade
-    data = [[skill, '']]
-    skill_style = TableStyle([
-        ('GRID', (0,0), (-1,-1), 0, colors.white),  # Sem grade
-        ('FONTNAME', (0,0), (0,0), 'Helvetica'),
-        ('FONTSIZE', (0,0), (0,0), 11),
-        ('VALIGN', (0,0), (-1,-1), 'MIDDLE'),
-        ('ALIGN', (0,0), (0,0), 'LEFT'),
-    ])
-    
-    skill_table = Table(data, colWidths=[3*inch, 4.5*inch], rowHeights=[0.3*inch])
-    skill_table.setStyle(skill_style)
-    elements.append(skill_table)
-    
-    # Espaço para colocar os quadradinhos na mesma linha
-    elements.append(Spacer(1, -0.25*inch))
-    
-    # Adicionar espaços em branco antes dos quadrados para posicioná-los à direita
-    elements.append(Paragraph("&nbsp;" * 50, styles['normal']))
-    elements.append(Spacer(1, -0.2*inch))
-    
-    # Definir o tamanho e espaçamento dos quadrados
-    square_size = 0.2*inch
-    
-    # Criar uma tabela para os quadrados
-    squares_data = [['' for i in range(max_level)]]
-    squares_style = TableStyle([
-        ('GRID', (0,0), (-1,-1), 0, colors.white),  # Sem grade na tabela
-    ])
-    
-    # Aplicar estilo a cada quadrado
-    for i in range(max_level):
-        if i < level:
-            # Quadrado preenchido
-            squares_style.add('BACKGROUND', (i,0), (i,0), AZUL_ESCURO)
-            squares_style.add('BOX', (i,0), (i,0), 1, AZUL_ESCURO)
-        else:
-            # Quadrado vazio
-            squares_style.add('BOX', (i,0), (i,0), 0.5, AZUL_CLARO)
-            squares_style.add('BACKGROUND', (i,0), (i,0), CINZA)
-    
-    squares_table = Table(squares_data, colWidths=[square_size] * max_level, rowHeights=[square_size])
-    squares_table.setStyle(squares_style)
-    elements.append(squares_table)
-    
-    # Espaço após a barra de habilidade
-    elements.append(Spacer(1, 0.15*inch))
+    add_skill_bars(elements, [(skill, level)], styles, max_level)
 
 # Função para adicionar quebra de página
 def add_page_break(elements):
@@ -0,0 +1,34 @@
+import importlib
+import json
+import os
+import sys
+
+import pytest
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+def load_example(language):
+    """JSON de exemplo de um idioma (curriculo_XX.json da raiz)."""
+    with open(os.path.join(ROOT_DIR, f'curriculo_{language}.json'), 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+JOB_PT = "Procuramos desenvolvedor com experiência em Python, Docker e Kubernetes. Conhecimento em AWS."
+UNRELATED_PT = "Cozinheiro com experiência em massas italianas e confeitaria."
+
+def skills_resume(*names):
+    """Currículo mínimo só com as habilidades informadas."""
+    return {'nome': 'Fulano', 'secoes': {
+        'habilidadesTecnicas': {'titulo': 'Habilidades', 'habilidades': [{'nome': name, 'nivel': 5} for name in names]},
+    }}
+
+@pytest.fixture(scope='session')
+def web_app(tmp_path_factory):
+    # A configuração do app é lida na importação: banco e downloads em pastas temporárias,
+    # documentos gerados no próprio processo
+    base = tmp_path_factory.mktemp('web')
+    os.environ['RESUME_DB_PATH'] = str(base / 'resumes.sqlite3')
+    os.environ['DOWNLOAD_SPOOL_DIR'] = str(base / 'downloads')
+    os.environ['RENDER_POOL_WORKERS'] = '0'
+    os.environ.pop('USER_ID_HEADER', None)
+    return importlib.import_module('web.app')
@@ -0,0 +1,64 @@
+import csv
+
+import pytest
+
+from conftest import JOB_PT, UNRELATED_PT, load_example, skills_resume
+from curriculo import matching
+from curriculo.bulk_match import BulkScorer, write_ranking
+
+def bulk_scorer(method, **kwargs):
+    scorer = BulkScorer('pt', method, **kwargs)
+    scorer.add_job('devops', JOB_PT)
+    scorer.add_job('cozinha', UNRELATED_PT)
+    scorer.add_resume('exemplo.json', load_example('pt'))
+    scorer.add_resume('docker.json', skills_resume('Docker'))
+    scorer.add_resume('cozinheiro.json', skills_resume('Massas italianas', 'Confeitaria'))
+    scorer.add_resume('vazio.json', skills_resume())
+    return scorer
+
+@pytest.mark.parametrize('method', matching.METHODS)
+def test_bulk_ranking(method):
+    ranking = bulk_scorer(method).rank(top_n=2)
+    assert {name for name, _ in ranking['devops']} == {'exemplo.json', 'docker.json'}
+    assert ranking['cozinha'][0][0] == 'cozinheiro.json'
+    for results in ranking.values():
+        scores = [value for _, value in results]
+        assert scores == sorted(scores, reverse=True)
+        assert all(0 <= value <= 100 for value in scores)
+
+def test_bulk_bm25_favors_coverage():
+    # BM25 mede a fração da vaga coberta; o TF-IDF (cosseno) favorece currículos curtos
+    ranking = bulk_scorer('bm25').rank(top_n=2)
+    assert [name for name, _ in ranking['devops']] == ['exemplo.json', 'docker.json']
+
+@pytest.mark.parametrize('method', matching.METHODS)
+def test_bulk_chunking_does_not_change_scores(method):
+    # Blocos de um currículo por vez devem dar o mesmo resultado de um bloco só
+    assert bulk_scorer(method, max_chunk_cells=1).rank(top_n=4) == bulk_scorer(method).rank(top_n=4)
+
+def test_bulk_ties_keep_reading_order():
+    scorer = BulkScorer('pt')
+    scorer.add_job('vaga', 'Docker')
+    for name in ('c.json', 'a.json', 'b.json'):
+        scorer.add_resume(name, skills_resume('Docker'))
+    assert [name for name, _ in scorer.rank()['vaga']] == ['c.json', 'a.json', 'b.json']
+
+def test_bulk_skips_malformed_resumes():
+    scorer = BulkScorer('pt')
+    scorer.add_job('vaga', JOB_PT)
+    scorer.add_resume('lista.json', [1, 2])
+    scorer.add_resume('sem_secoes.json', {'nome': 'Fulano'})
+    scorer.add_resume('exemplo.json', load_example('pt'))
+    assert [name for name, _, _ in scorer.resumes] == ['exemplo.json']
+    assert [name for name, _ in scorer.rank()['vaga']] == ['exemplo.json']
+
+def test_bulk_rejects_unknown_method():
+    with pytest.raises(ValueError):
+        BulkScorer('pt', 'cosseno')
+
+def test_write_ranking(tmp_path):
+    output = tmp_path / 'ranking.csv'
+    write_ranking({'vaga': [('a.json', 87.5), ('b.json', 12.0)]}, str(output))
+    with open(output, encoding='utf-8', newline='') as f:
+        rows = list(csv.reader(f))
+    assert rows == [['job', 'rank', 'resume', 'score'], ['vaga', '1', 'a.json', '87.5'], ['vaga', '2', 'b.json', '12.0']]
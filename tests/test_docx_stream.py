@@ -0,0 +1,53 @@
+import io
+import time
+import zipfile
+
+import pytest
+
+from conftest import load_example, skills_resume
+from curriculo import docx_stream, engine
+from curriculo.model import normalize
+from templates import TemplateManager
+
+@pytest.fixture(autouse=True)
+def fixed_clock(monkeypatch):
+    # As entradas do ZIP levam a hora da gravação: os dois geradores veem o mesmo relógio
+    fixed = time.struct_time((2024, 5, 17, 10, 30, 0, 4, 138, 0))
+    monkeypatch.setattr(time, 'localtime', lambda *args: fixed)
+
+def render_both(data, language):
+    tree = engine.render_bytes(data, language, 'docx', 'docx')
+    stream = engine.render_bytes(data, language, 'docx', 'docx_stream')
+    return tree, stream
+
+@pytest.mark.parametrize('language', ['pt', 'en', 'es'])
+def test_stream_is_byte_identical_to_python_docx(language):
+    tree, stream = render_both(load_example(language), language)
+    assert stream == tree
+
+def test_stream_is_byte_identical_with_missing_sections():
+    tree, stream = render_both(skills_resume('Python', 'Docker'), 'pt')
+    assert stream == tree
+
+class UnseekableOutput:
+    def __init__(self):
+        self.data = bytearray()
+
+    def write(self, chunk):
+        self.data += chunk
+        return len(chunk)
+
+    def flush(self):
+        pass
+
+def test_stream_to_unseekable_output():
+    tree, _ = render_both(load_example('pt'), 'pt')
+    output = UnseekableOutput()
+    docx_stream.write(normalize(load_example('pt')), TemplateManager().get_template('docx_stream'), output)
+
+    archive = zipfile.ZipFile(io.BytesIO(bytes(output.data)))
+    expected = zipfile.ZipFile(io.BytesIO(tree))
+    assert archive.testzip() is None
+    assert archive.namelist() == expected.namelist()
+    for name in expected.namelist():
+        assert archive.read(name) == expected.read(name)
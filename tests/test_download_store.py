@@ -0,0 +1,123 @@
+import os
+
+import pytest
+
+from curriculo import download_store
+from curriculo.download_store import DownloadStore
+
+class Clock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def time(self):
+        return self.now
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(download_store.time, 'time', clock.time)
+    return clock
+
+@pytest.fixture
+def spool(tmp_path):
+    return str(tmp_path / 'spool')
+
+def read(store, file_id):
+    entry = store.open(file_id)
+    if entry is None:
+        return None
+    f, filename, mimetype = entry
+    with f:
+        return f.read(), filename, mimetype
+
+def spool_files(spool):
+    return sorted(name for name in os.listdir(spool) if not name.startswith('index.sqlite3'))
+
+def test_download_is_visible_to_other_workers(spool):
+    writer, reader = DownloadStore(spool), DownloadStore(spool)
+    file_id = writer.put(b'%PDF-1.4 documento', 'cv.pdf', 'application/pdf')
+
+    assert read(reader, file_id) == (b'%PDF-1.4 documento', 'cv.pdf', 'application/pdf')
+    assert read(reader, 'inexistente') is None
+    assert reader.stats()['downloads'] == 1
+    assert reader.stats()['bytes'] == len(b'%PDF-1.4 documento')
+
+def test_download_expires_and_is_collected(spool, clock):
+    store = DownloadStore(spool, ttl=60)
+    file_id = store.put(b'conteudo', 'cv.docx', 'application/octet-stream')
+
+    clock.now += 59
+    assert store.collect() == 0
+    assert read(store, file_id) is not None
+
+    clock.now += 2
+    assert read(store, file_id) is None
+    assert store.collect() == 1
+    assert spool_files(spool) == []
+    assert store.stats()['downloads'] == 0
+
+def test_open_file_survives_collection(spool, clock):
+    store = DownloadStore(spool, ttl=60)
+    file_id = store.put(b'conteudo', 'cv.pdf', 'application/pdf')
+    f, _, _ = store.open(file_id)
+
+    clock.now += 61
+    store.collect()
+    with f:
+        assert f.read() == b'conteudo'
+
+def test_quota_removes_oldest_downloads(spool, clock):
+    store = DownloadStore(spool, max_bytes=10)
+    first = store.put(b'1234', 'a.pdf', 'application/pdf')
+    clock.now += 1
+    second = store.put(b'5678', 'b.pdf', 'application/pdf')
+    clock.now += 1
+    third = store.put(b'90ab', 'c.pdf', 'application/pdf')
+
+    assert read(store, first) is None
+    assert read(store, second) is not None
+    assert read(store, third) is not None
+    assert store.stats()['bytes'] == 8
+    assert spool_files(spool) == sorted([second, third])
+
+def test_new_download_is_kept_even_if_alone_at_quota(spool, clock):
+    store = DownloadStore(spool, max_bytes=10)
+    old = store.put(b'123456', 'a.pdf', 'application/pdf')
+    clock.now += 1
+    new = store.put(b'7890abcdef', 'b.pdf', 'application/pdf')
+
+    assert read(store, old) is None
+    assert read(store, new)[0] == b'7890abcdef'
+
+def test_document_larger_than_quota_is_rejected(spool):
+    store = DownloadStore(spool, max_bytes=10)
+    with pytest.raises(ValueError):
+        store.put(b'x' * 11, 'grande.pdf', 'application/pdf')
+    assert spool_files(spool) == []
+    assert store.stats()['downloads'] == 0
+
+def test_collect_removes_only_old_orphans(spool, clock):
+    store = DownloadStore(spool, ttl=60)
+    file_id = store.put(b'conteudo', 'cv.pdf', 'application/pdf')
+    for name, age in (('interrompido.tmp', 120), ('gravando.tmp', 10)):
+        path = os.path.join(spool, name)
+        with open(path, 'wb') as f:
+            f.write(b'parcial')
+        os.utime(path, (clock.now - age, clock.now - age))
+
+    assert store.collect() == 1
+    assert spool_files(spool) == sorted([file_id, 'gravando.tmp'])
+
+def test_download_route(web_app):
+    client = web_app.app.test_client()
+    file_id = web_app.download_store.put(b'%PDF-1.4 rota', 'cv.pdf', 'application/pdf')
+
+    response = client.get(f'/download/{file_id}')
+    assert response.status_code == 200
+    assert response.data == b'%PDF-1.4 rota'
+    assert 'cv.pdf' in response.headers['Content-Disposition']
+    response.close()
+
+    response = client.get('/download/inexistente')
+    assert response.status_code == 404
+    assert 'error' in response.get_json()
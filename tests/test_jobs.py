@@ -0,0 +1,133 @@
+import json
+import subprocess
+import sys
+import time
+from concurrent.futures import Future
+
+import pytest
+
+from conftest import ROOT_DIR
+from curriculo import jobs
+from curriculo.download_store import DownloadStore
+from curriculo.jobs import JobStore
+
+class Clock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def time(self):
+        return self.now
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(jobs.time, 'time', clock.time)
+    return clock
+
+@pytest.fixture
+def spool(tmp_path):
+    return str(tmp_path / 'spool')
+
+def new_store(spool, **kwargs):
+    return JobStore(DownloadStore(spool), **kwargs)
+
+def read_result(store, job):
+    f, filename, mimetype = store.open_result(job)
+    with f:
+        return f.read(), filename, mimetype
+
+def test_future_result_is_visible_to_other_workers(spool):
+    creator, other = new_store(spool), new_store(spool)
+    job = creator.create('cv.pdf', 'application/pdf')
+    future = Future()
+    creator.attach(job, future)
+
+    assert other.get(job.id).status == 'queued'
+    future.set_running_or_notify_cancel()
+    assert creator.get(job.id).status == 'running'
+
+    future.set_result(b'%PDF-1.4 documento')
+    job = other.get(job.id)
+    assert job.status == 'done'
+    assert job.size == len(b'%PDF-1.4 documento')
+    assert read_result(other, job) == (b'%PDF-1.4 documento', 'cv.pdf', 'application/pdf')
+    assert creator.stats()['in_flight'] == 0
+
+def test_job_is_visible_from_another_process(spool):
+    store = new_store(spool)
+    job = store.create('cv.docx', 'application/octet-stream')
+    store.finish(job, result=b'conteudo')
+
+    script = (
+        'import json, sys\n'
+        'from curriculo.download_store import DownloadStore\n'
+        'from curriculo.jobs import JobStore\n'
+        'store = JobStore(DownloadStore(sys.argv[1]))\n'
+        'job = store.get(sys.argv[2])\n'
+        'f, name, _ = store.open_result(job)\n'
+        'print(json.dumps([job.status, name, f.read().decode()]))\n'
+    )
+    output = subprocess.run([sys.executable, '-c', script, spool, job.id], cwd=ROOT_DIR,
+                            capture_output=True, text=True, check=True).stdout
+    assert json.loads(output) == ['done', 'cv.docx', 'conteudo']
+
+def test_failed_future_reports_error(spool):
+    store = new_store(spool)
+    job = store.create('cv.pdf', 'application/pdf')
+    future = Future()
+    store.attach(job, future)
+    future.set_exception(RuntimeError('falhou'))
+    job = store.get(job.id)
+    assert (job.status, job.error) == ('error', 'falhou')
+    assert store.open_result(job) is None
+
+def test_finished_jobs_expire_after_ttl(spool, clock):
+    store = new_store(spool, ttl=60)
+    job = store.create('cv.pdf', 'application/pdf')
+    store.finish(job, result=b'x')
+    clock.now += 59
+    assert store.get(job.id) is not None
+    clock.now += 2
+    assert store.get(job.id) is None
+    assert store.stats()['jobs'] == 0
+
+def test_lost_job_reports_error_after_timeout(spool, clock):
+    # Trabalho criado por um worker que foi reiniciado: nenhum Future vai concluí-lo
+    store = new_store(spool, timeout=30)
+    job = store.create('cv.pdf', 'application/pdf')
+    assert new_store(spool, timeout=30).get(job.id).status == 'queued'
+    clock.now += 31
+    assert new_store(spool, timeout=30).get(job.id).status == 'error'
+
+def test_results_use_the_download_quota(spool):
+    store = JobStore(DownloadStore(spool, max_bytes=10))
+    job = store.create('cv.pdf', 'application/pdf')
+    store.finish(job, result=b'x' * 11)
+    job = store.get(job.id)
+    assert job.status == 'error'
+    assert 'cota' in job.error
+    assert store.download_store.stats()['bytes'] == 0
+
+def test_jobs_routes(web_app):
+    client = web_app.app.test_client()
+    response = client.post('/jobs', json={'language': 'pt', 'format': 'pdf', 'template': 'pdf'})
+    assert response.status_code == 202
+    job = response.get_json()
+
+    # Sem pool de processos, o trabalho roda em uma thread: esperar o Future terminar
+    status = client.get(job['status_url']).get_json()
+    for _ in range(200):
+        if status['status'] in ('done', 'error'):
+            break
+        future = web_app.job_store._futures.get(job['job_id'])
+        if future is not None:
+            future.exception(timeout=30)
+        # O estado é gravado pelo callback do Future, logo depois de ele terminar
+        time.sleep(0.01)
+        status = client.get(job['status_url']).get_json()
+    assert status['status'] == 'done'
+
+    result = client.get(job['result_url'])
+    assert result.status_code == 200
+    assert result.data.startswith(b'%PDF')
+    assert client.get('/jobs/inexistente').status_code == 404
@@ -0,0 +1,70 @@
+from conftest import load_example
+
+import curriculo_pdf_ats
+from curriculo.keywords import KeywordExtractor, extract_keywords, get_extractor, resume_texts
+from curriculo.model import normalize
+
+def test_technical_terms_and_phrases():
+    text = "Built serverless pipelines with AWS Lambda and Spring Boot using C#, Node.js, .NET and CI/CD."
+    assert list(get_extractor('en').terms(text)) == [
+        'Built', 'serverless', 'pipelines', 'AWS Lambda', 'Spring Boot', 'C#', 'Node.js', '.NET', 'CI/CD',
+    ]
+
+def test_capitalized_sentence_start_does_not_join_a_phrase():
+    terms = list(get_extractor('en').terms("Deployed Docker images. Kubernetes clusters were upgraded."))
+    assert 'Deployed Docker' not in terms
+    assert 'Docker' in terms and 'Kubernetes' in terms
+
+def test_long_name_sequences_count_word_by_word():
+    terms = list(get_extractor('es').terms("Servicios con Google Cloud Platform Engineering Team"))
+    assert terms == ['Servicios', 'Google', 'Cloud', 'Platform', 'Engineering', 'Team']
+
+def test_stopwords_follow_the_resume_language():
+    pt, en = get_extractor('pt'), get_extractor('en')
+    assert 'para' in pt.stopwords and 'the' not in pt.stopwords
+    assert 'the' in en.stopwords
+
+    # Idioma sem tabela própria: todas as stopwords conhecidas
+    assert {'para', 'the'} <= get_extractor('xx').stopwords
+    assert {'para', 'the'} <= get_extractor(None).stopwords
+
+    text = "Experiência com Python para os projetos de dados"
+    assert list(pt.terms(text)) == ['Experiência', 'Python', 'projetos', 'dados']
+
+def test_short_words_need_to_be_technical():
+    extractor = KeywordExtractor('en', min_length=4)
+    assert list(extractor.terms("Migrated Go and SQL with AWS in the lab")) == ['Migrated', 'SQL', 'AWS']
+
+def test_top_k_by_weighted_score_then_first_position():
+    extractor = get_extractor('pt')
+    texts = ["Docker", "Python", "Python", ("Kubernetes", 5.0), "Terraform"]
+    assert extractor.extract(texts, top_k=3) == ['Kubernetes', 'Python', 'Docker']
+    assert extractor.extract(texts, top_k=10) == ['Kubernetes', 'Python', 'Docker', 'Terraform']
+
+def test_case_variants_are_merged_under_the_most_common_form():
+    assert get_extractor('en').extract(["Python", "python", "Python"]) == ['Python']
+
+def test_extractor_is_shared_per_language():
+    assert get_extractor('pt') is get_extractor('pt')
+    assert get_extractor('pt') is not get_extractor('en')
+
+def test_all_resume_sections_are_scanned():
+    resume = normalize(load_example('pt'))
+    texts = [text for text, _ in resume_texts(resume)]
+    assert resume.summary.content in texts
+    assert resume.experience.items[0].description[0] in texts
+    assert resume.skills.items[0].name in texts
+    assert resume.certifications.items[0] in texts
+
+    keywords = extract_keywords(resume, 'pt')
+    assert len(keywords) == 20
+    assert 'Spring Boot' in keywords
+    assert 'C#' in keywords
+
+def test_ats_wrappers_use_the_extractor():
+    assert curriculo_pdf_ats.extract_keywords_from_resume("Experiência com Python e Docker em projetos de dados") == [
+        'Experiência', 'Python', 'Docker', 'projetos', 'dados',
+    ]
+    keywords = curriculo_pdf_ats.collect_keywords(normalize(load_example('pt')), 'pt')
+    assert keywords == sorted(keywords, key=str.casefold)
+    assert len({keyword.casefold() for keyword in keywords}) == len(keywords)
@@ -0,0 +1,119 @@
+import io
+import json
+import os
+import re
+import shutil
+
+import pytest
+from reportlab import rl_config
+
+from conftest import load_example
+
+import curriculo_pdf_ats
+from curriculo import locale_packs
+from curriculo.locale_packs import find_locale_pack, get_locale_pack
+from curriculo.model import normalize
+from curriculo.preview import render_html
+
+LANGUAGES = ['pt', 'en', 'es']
+
+def pdf_strings(document):
+    """Textos desenhados em um PDF sem compressão (operandos dos Tj)."""
+    def unescape(match):
+        value = match.group(1)
+        return chr(int(value, 8)) if value[0].isdigit() else value
+    return [re.sub(r'\\([0-7]{1,3}|.)', unescape, text)
+            for text in re.findall(r'\(((?:[^()\\]|\\.)*)\) Tj', document.decode('latin-1'))]
+
+@pytest.fixture
+def readable_pdf(monkeypatch):
+    monkeypatch.setattr(rl_config, 'pageCompression', 0)
+    monkeypatch.setattr(rl_config, 'invariant', 1)
+
+@pytest.fixture
+def locales_dir(tmp_path, monkeypatch):
+    # Pasta de pacotes própria e caches vazios: os pacotes são relidos dela
+    shutil.copy(os.path.join(locale_packs.LOCALES_DIR, 'pt.json'), tmp_path / 'pt.json')
+    monkeypatch.setattr(locale_packs, 'LOCALES_DIR', str(tmp_path))
+    monkeypatch.setattr(locale_packs, '_packs', {})
+    monkeypatch.setattr(locale_packs, '_all_words', {})
+    return tmp_path
+
+def test_packs_are_loaded_once_into_lookup_tables():
+    pack = get_locale_pack('en')
+    assert get_locale_pack('en') is pack
+    assert pack.level_names == ('', 'Basic', 'Lower Intermediate', 'Intermediate', 'Advanced', 'Expert')
+    assert pack.level_text(5) == 'Expert'
+    assert isinstance(pack.stopwords, frozenset) and 'the' in pack.stopwords
+
+def test_level_text_out_of_scale_uses_default_level():
+    pack = get_locale_pack('pt')
+    for level in (0, 6, None, '3'):
+        assert pack.level_text(level) == pack.default_level_name
+    assert pack.default_level_name == pack.level_names[3]
+
+def test_regional_and_unknown_codes():
+    assert find_locale_pack('pt-BR') is get_locale_pack('pt')
+    assert find_locale_pack('xx') is None
+    assert find_locale_pack('../pt') is None
+    assert get_locale_pack('xx') is get_locale_pack('pt')
+
+def test_new_language_needs_only_a_json_file(locales_dir):
+    (locales_dir / 'it.json').write_text(json.dumps({
+        'name': 'Italiano',
+        'labels': {'position': 'Ruolo'},
+        'levels': ['Base', 'Intermedio', 'Avanzato'],
+        'stopwords': ['il la di'],
+    }), encoding='utf-8')
+
+    pack = get_locale_pack('it')
+    pt = get_locale_pack('pt')
+    assert pack.name == 'Italiano'
+    assert pack.labels['position'] == 'Ruolo'
+    # Chaves ausentes vêm do pacote padrão
+    assert pack.labels['company'] == pt.labels['company']
+    assert pack.section_titles == pt.section_titles
+    assert pack.level_text(3) == 'Avanzato'
+    assert pack.default_level_name == 'Intermedio'
+    assert locale_packs.get_locale_codes() == ['it', 'pt']
+    assert {'il', 'para'} <= locale_packs.get_all_words('stopwords')
+
+def test_invalid_pack_is_reported_as_missing(locales_dir, capsys):
+    (locales_dir / 'de.json').write_text('{ inválido', encoding='utf-8')
+    assert find_locale_pack('de') is None
+    assert get_locale_pack('de') is get_locale_pack('pt')
+    assert 'de.json' in capsys.readouterr().out
+
+@pytest.mark.parametrize('language', LANGUAGES)
+def test_ats_pdf_uses_localized_labels(readable_pdf, language):
+    data = load_example(language)
+    output = io.BytesIO()
+    curriculo_pdf_ats.render(data, language, 'pdf_ats', output)
+    strings = pdf_strings(output.getvalue())
+    text = '\n'.join(strings)
+
+    pack = get_locale_pack(language)
+    labels = pack.labels
+    assert any(s.startswith(f"{labels['position']}: ") for s in strings)
+    for key in ('company', 'period', 'description_heading'):
+        assert f"{labels[key]}:" in strings
+    assert f"{labels['email']}: " in text and f"{labels['phone']}: " in text
+    assert pack.section_titles['keywords'] in strings
+    for skill in normalize(data).skills.items:
+        assert f'{skill.name}: {pack.level_text(skill.level)}' in strings
+
+    others = [get_locale_pack(other) for other in LANGUAGES if other != language]
+    for other in others:
+        if other.labels['description_heading'] != labels['description_heading']:
+            assert f"{other.labels['description_heading']}:" not in strings
+
+@pytest.mark.parametrize('language', LANGUAGES)
+def test_ats_preview_uses_localized_labels(language):
+    data = load_example(language)
+    html = render_html(data, language, 'pdf_ats')
+    pack = get_locale_pack(language)
+    assert pack.labels['description_heading'] in html
+    assert pack.section_titles['keywords'] in html
+
+    skill = normalize(data).skills.items[0]
+    assert f'{skill.name}: {pack.level_text(skill.level)}' in html
@@ -0,0 +1,41 @@
+import pytest
+
+from conftest import JOB_PT, UNRELATED_PT, load_example, skills_resume
+from curriculo import matching
+
+@pytest.mark.parametrize('method', matching.METHODS)
+def test_match_reports_matched_and_missing_terms(method):
+    result = matching.match(load_example('pt'), 'pt', JOB_PT, method)
+    assert result['method'] == method
+    assert 0 < result['score'] < 100
+    assert {'Docker', 'Kubernetes', 'AWS'} <= {term['term'] for term in result['matched']}
+    assert [term['term'] for term in result['missing']] == ['Python']
+
+@pytest.mark.parametrize('method', matching.METHODS)
+def test_unrelated_job_scores_zero(method):
+    result = matching.match(load_example('pt'), 'pt', UNRELATED_PT, method)
+    assert result['score'] == 0.0
+    assert result['matched'] == []
+
+def test_bm25_single_term_saturation():
+    # Um único termo em comum: a pontuação é a saturação tf / (tf + k1) do termo no currículo
+    data = skills_resume('Docker')
+    tf = matching.get_resume_index(data, 'pt').tf['docker']
+    result = matching.match(data, 'pt', 'Docker', 'bm25')
+    assert result['score'] == round(100.0 * tf / (tf + matching.BM25_K1), 1)
+
+def test_tfidf_identical_vocabulary_scores_full():
+    assert matching.match(skills_resume('Docker'), 'pt', 'Docker', 'tfidf')['score'] == 100.0
+
+def test_more_coverage_scores_higher():
+    job = 'Docker, Kubernetes e Terraform'
+    for method in matching.METHODS:
+        partial = matching.match(skills_resume('Docker'), 'pt', job, method)['score']
+        full = matching.match(skills_resume('Docker', 'Kubernetes', 'Terraform'), 'pt', job, method)['score']
+        assert 0 < partial < full
+
+def test_match_rejects_bad_input():
+    with pytest.raises(ValueError):
+        matching.match(load_example('pt'), 'pt', '   ')
+    with pytest.raises(ValueError):
+        matching.match(load_example('pt'), 'pt', JOB_PT, 'cosseno')
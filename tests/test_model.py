@@ -0,0 +1,42 @@
+import pytest
+
+from conftest import load_example
+from curriculo.model import normalize
+
+@pytest.mark.parametrize('data', [None, [], 'texto', 3, ['secoes']])
+def test_rejects_non_object(data):
+    with pytest.raises(ValueError, match='deve ser um objeto'):
+        normalize(data)
+
+def test_rejects_missing_sections():
+    with pytest.raises(ValueError, match='chave de seções'):
+        normalize({'nome': 'Fulano'})
+
+@pytest.mark.parametrize('sections', [[], 'texto', 5, None])
+def test_rejects_sections_that_are_not_an_object(sections):
+    with pytest.raises(ValueError, match='seções devem ser um objeto'):
+        normalize({'nome': 'Fulano', 'secoes': sections})
+
+def test_skips_malformed_sections_and_items():
+    resume = normalize({
+        'nome': 'Fulano',
+        'secoes': {
+            'resumoProfissional': 5,
+            'experienciaProfissional': {'titulo': 'Experiência', 'empregos': [1, None, 'x', {'cargo': 'Dev'}]},
+            'habilidadesTecnicas': {'titulo': 'Habilidades', 'habilidades': [1, None, {'nome': 'Python', 'nivel': 4}]},
+        },
+    })
+    assert resume.summary is None
+    assert [job.position for job in resume.experience.items] == ['Dev']
+    assert [(skill.name, skill.level) for skill in resume.skills.items] == [('Python', 4)]
+
+@pytest.mark.parametrize('language', ['pt', 'en', 'es'])
+def test_examples_resolve_the_same_fields(language):
+    resume = normalize(load_example(language))
+    assert normalize(resume) is resume
+    assert resume.header.name == 'Danilo Neto'
+    assert resume.header.email
+    for section in (resume.summary, resume.experience, resume.skills, resume.certifications,
+                    resume.education, resume.in_progress):
+        assert section is not None
+    assert len(resume.experience.items) == len(normalize(load_example('pt')).experience.items)
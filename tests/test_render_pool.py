@@ -0,0 +1,122 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from conftest import load_example
+from curriculo import batch
+from curriculo.render_pool import PoolSaturated, RenderPool, RenderTimeout
+
+@pytest.fixture
+def gate():
+    # Trabalhos que ficam bloqueados até o teste liberá-los
+    event = threading.Event()
+    yield event
+    event.set()
+
+@pytest.fixture
+def pool():
+    # workers=0: os trabalhos assíncronos rodam em uma thread do próprio processo
+    pool = RenderPool(workers=0, max_queue=1, timeout=5)
+    yield pool
+    pool.shutdown()
+
+def wait_finished(pool, count):
+    for _ in range(500):
+        stats = pool.stats()
+        if stats['completed'] + stats['failed'] >= count and stats['pending'] == 0:
+            return stats
+        time.sleep(0.01)
+    raise AssertionError(pool.stats())
+
+def test_saturated_pool_rejects(pool, gate):
+    # Uma vaga de processo + uma de fila
+    first = pool.submit(gate.wait)
+    second = pool.submit(gate.wait)
+    with pytest.raises(PoolSaturated) as excinfo:
+        pool.submit(gate.wait)
+    assert excinfo.value.retry_after >= 1
+    gate.set()
+    first.result(5), second.result(5)
+    stats = wait_finished(pool, 2)
+    assert (stats['completed'], stats['rejected'], stats['failed']) == (2, 1, 0)
+    # As vagas foram devolvidas
+    pool.submit(time.sleep, 0).result(5)
+
+def test_inline_render_uses_the_same_slots(pool, gate):
+    pool.submit(gate.wait)
+    pool.submit(gate.wait)
+    with pytest.raises(PoolSaturated):
+        pool.render(load_example('pt'), 'pt', 'pdf', 'pdf')
+    gate.set()
+    wait_finished(pool, 2)
+    assert pool.render(load_example('pt'), 'pt', 'pdf', 'pdf').startswith(b'%PDF')
+    assert pool.stats()['completed'] == 3
+
+def test_timeout_is_not_counted_as_completed(pool, gate):
+    running = pool.submit(gate.wait)
+    queued = pool.submit(gate.wait)
+    with pytest.raises(RenderTimeout):
+        pool.wait(running, timeout=0.05)
+    with pytest.raises(RenderTimeout):
+        pool.wait(queued, timeout=0.05)
+    # O trabalho ainda na fila foi descartado; o que já rodava termina, mas o resultado é ignorado
+    assert queued.cancelled()
+    gate.set()
+    stats = wait_finished(pool, 0)
+    assert (stats['timed_out'], stats['completed'], stats['failed']) == (2, 0, 0)
+
+def test_failures_are_counted_separately(pool):
+    future = pool.submit(int, 'não é número')
+    with pytest.raises(ValueError):
+        pool.wait(future)
+    stats = wait_finished(pool, 1)
+    assert (stats['completed'], stats['failed']) == (0, 1)
+
+def test_process_pool_timeout():
+    pool = RenderPool(workers=1, max_queue=0, timeout=0.2)
+    try:
+        pool.start()
+        with pytest.raises(RenderTimeout):
+            pool.wait(pool.submit(time.sleep, 3))
+        assert pool.stats()['timed_out'] == 1
+    finally:
+        pool.shutdown(wait=False)
+
+class HungPool:
+    """Pool em que o documento de um template nunca fica pronto."""
+    workers = 2
+    timeout = 0.05
+
+    def __init__(self, hung_template):
+        self.real = RenderPool(workers=0, max_queue=4, timeout=self.timeout)
+        # Uma thread por documento: o documento travado não atrasa os outros
+        self.real._executor = ThreadPoolExecutor(max_workers=4)
+        self.hung_template = hung_template
+        self.gate = threading.Event()
+
+    def submit(self, fn, data, language, format_type, template, compact):
+        if template == self.hung_template:
+            return self.real.submit(self.gate.wait)
+        return self.real.submit(fn, data, language, format_type, template, compact)
+
+    def wait(self, future):
+        return self.real.wait(future)
+
+def test_batch_replaces_hung_documents_with_an_error_member():
+    pool = HungPool('pdf_moderno')
+    try:
+        resumes = {'pt': load_example('pt')}
+        matrix = batch.build_matrix(resumes, [('pdf', 'pdf'), ('pdf', 'pdf_moderno'), ('docx', 'docx')])
+        members = dict(batch.iter_rendered(resumes, matrix, pool=pool))
+    finally:
+        pool.gate.set()
+        pool.real.shutdown()
+    names = sorted(members)
+    assert len(names) == 3
+    error_name = next(name for name in names if name.endswith('.erro.txt'))
+    assert error_name.startswith('pt/pdf_moderno/')
+    assert b'0.05s' in members[error_name]
+    assert all(members[name].startswith(b'%PDF') or members[name].startswith(b'PK')
+               for name in names if name != error_name)
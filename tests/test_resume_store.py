@@ -0,0 +1,92 @@
+import pytest
+
+from curriculo.resume_store import DEFAULT_OWNER, ResumeStore, RevisionConflict
+
+@pytest.fixture
+def store(tmp_path):
+    return ResumeStore(str(tmp_path / 'resumes.sqlite3'), max_revisions=3)
+
+def test_save_increments_revision(store):
+    assert store.save('alice', 'pt', {'nome': 'A'}) == 1
+    assert store.save('alice', 'pt', {'nome': 'B'}, expected_revision=1) == 2
+    assert store.load_with_revision('alice', 'pt') == (2, {'nome': 'B'})
+
+def test_stale_revision_conflicts(store):
+    store.save('alice', 'pt', {'nome': 'A'})
+    store.save('alice', 'pt', {'nome': 'B'}, expected_revision=1)
+    with pytest.raises(RevisionConflict) as excinfo:
+        store.save('alice', 'pt', {'nome': 'C'}, expected_revision=1)
+    assert excinfo.value.current == 2
+    assert store.load('alice', 'pt') == {'nome': 'B'}
+
+def test_create_conflicts_when_resume_exists(store):
+    store.create('alice', 'pt', {'nome': 'A'})
+    with pytest.raises(RevisionConflict):
+        store.create('alice', 'pt', {'nome': 'B'})
+
+def test_owners_are_isolated(store):
+    store.save(DEFAULT_OWNER, 'pt', {'nome': 'Exemplo'})
+    store.save('alice', 'pt', {'nome': 'Alice'})
+
+    assert store.load('bob', 'pt') is None
+    # Sem currículo próprio, o exemplo do dono padrão aparece com revisão 0
+    assert store.load_with_revision('bob', 'pt', DEFAULT_OWNER) == (0, {'nome': 'Exemplo'})
+    assert store.load_with_revision('alice', 'pt', DEFAULT_OWNER) == (1, {'nome': 'Alice'})
+    assert store.languages('bob', DEFAULT_OWNER) == {'pt': {'name': 'PT', 'revision': 0}}
+
+    # A primeira gravação de bob cria a cópia dele sem mexer nas outras
+    assert store.save('bob', 'pt', {'nome': 'Bob'}, expected_revision=0) == 1
+    assert store.load('alice', 'pt') == {'nome': 'Alice'}
+    assert store.load(DEFAULT_OWNER, 'pt') == {'nome': 'Exemplo'}
+
+def test_history_keeps_max_revisions(store):
+    for number in range(5):
+        store.save('alice', 'pt', {'n': number})
+    assert [entry['revision'] for entry in store.history('alice', 'pt')] == [5, 4, 3]
+    assert store.load_revision('alice', 'pt', 4) == {'n': 3}
+    assert store.load_revision('alice', 'pt', 1) is None
+    assert store.history('bob', 'pt') == []
+
+def test_cached_entry_is_a_copy(store):
+    content = {'nome': 'A'}
+    store.save('alice', 'pt', content)
+    content['nome'] = 'alterado'
+    assert store.load('alice', 'pt') == {'nome': 'A'}
+
+def test_other_connection_sees_new_revision(store):
+    store.save('alice', 'pt', {'nome': 'A'})
+    assert store.load('alice', 'pt') == {'nome': 'A'}
+    # Outro processo (aqui, outra instância) grava no mesmo banco
+    ResumeStore(store.db_path).save('alice', 'pt', {'nome': 'B'})
+    assert store.load_with_revision('alice', 'pt') == (2, {'nome': 'B'})
+
+def test_export_files(store, tmp_path):
+    store.save(DEFAULT_OWNER, 'pt', {'nome': 'Exemplo'})
+    store.save('alice', 'en', {'nome': 'Alice'})
+    paths = store.export_files('alice', str(tmp_path / 'out'), fallback_owner=DEFAULT_OWNER)
+    assert sorted(path.rsplit('/', 1)[1] for path in paths) == ['curriculo_en.json', 'curriculo_pt.json']
+
+@pytest.mark.parametrize('language', ['../../x', 'pt/../../x', '', 'p', None, 'pt.json'])
+def test_save_rejects_invalid_language(store, language):
+    with pytest.raises(ValueError, match='Idioma inválido'):
+        store.save('alice', language, {'nome': 'A'})
+    assert store.languages('alice') == {}
+
+@pytest.mark.parametrize('revision', ['1', 1.0, True, -1, []])
+def test_save_rejects_invalid_revision(store, revision):
+    store.save('alice', 'pt', {'nome': 'A'})
+    with pytest.raises(ValueError, match='Revisão inválida'):
+        store.save('alice', 'pt', {'nome': 'B'}, expected_revision=revision)
+    assert store.load_with_revision('alice', 'pt') == (1, {'nome': 'A'})
+
+def test_export_skips_unsafe_languages(store, tmp_path):
+    store.save('alice', 'pt-BR', {'nome': 'A'})
+    # Linha gravada antes da validação dos idiomas
+    store._connect().execute(
+        "INSERT INTO resumes (owner, language, name, revision, content, updated_at) VALUES ('alice', '../x', 'X', 1, '{}', 0)"
+    )
+    output = tmp_path / 'out'
+    paths = store.export_files('alice', str(output))
+    assert [path.rsplit('/', 1)[1] for path in paths] == ['curriculo_pt-BR.json']
+    assert not [path for path in tmp_path.iterdir() if path.suffix == '.json']
+    assert [path.name for path in output.iterdir()] == ['curriculo_pt-BR.json']
@@ -0,0 +1,113 @@
+import io
+import sys
+import threading
+
+import pytest
+from reportlab import rl_config
+from reportlab.lib.units import inch
+
+from conftest import load_example, skills_resume
+
+import curriculo_pdf
+import curriculo_pdf_ats
+from curriculo.model import normalize
+from curriculo.section_cache import SectionCache, get_section_cache
+
+@pytest.fixture
+def invariant_pdf(monkeypatch):
+    # Sem data de criação nem identificador aleatório: documentos iguais têm os mesmos bytes
+    monkeypatch.setattr(rl_config, 'invariant', 1)
+    get_section_cache().clear()
+    yield
+    get_section_cache().clear()
+
+def build_counter():
+    calls = []
+
+    def build(elements, template, styles, section, *extra):
+        calls.append(extra)
+        curriculo_pdf.build_skills(elements, template, styles, section)
+    return build, calls
+
+def test_hit_miss_and_key():
+    cache = SectionCache()
+    template = curriculo_pdf.load_template('pdf')
+    styles = template.get_styles()
+    build, calls = build_counter()
+    skills = normalize(skills_resume('Python', 'Docker')).skills
+
+    first, second = [], []
+    cache.add_flowables(first, template, styles, 'skills', skills, build)
+    cache.add_flowables(second, template, styles, 'skills', skills, build)
+    assert len(calls) == 1
+    assert cache.stats()['hits'] == 1 and cache.stats()['misses'] == 1
+    assert len(first) == len(second) > 0
+
+    # Conteúdo, extras ou template diferentes são outra seção
+    cache.add_flowables([], template, styles, 'skills', normalize(skills_resume('Python')).skills, build)
+    cache.add_flowables([], template, styles, 'skills', skills, build, 'en')
+    cache.add_flowables([], curriculo_pdf.load_template('pdf_moderno'), styles, 'skills', skills, build)
+    assert len(calls) == 4
+    assert cache.stats()['entries'] == 4
+
+    # Seção ausente: nada a montar
+    cache.add_flowables([], template, styles, 'skills', None, build)
+    assert len(calls) == 4
+
+def test_cached_flowables_never_reach_a_document():
+    cache = SectionCache()
+    template = curriculo_pdf.load_template('pdf')
+    styles = template.get_styles()
+    summary = normalize(load_example('pt')).summary
+
+    first, second = [], []
+    cache.add_flowables(first, template, styles, 'summary', summary, curriculo_pdf.build_summary)
+    cache.add_flowables(second, template, styles, 'summary', summary, curriculo_pdf.build_summary)
+    cached = cache.get(cache.make_key(template, 'summary', summary))
+
+    for flowable in first + second:
+        flowable.wrap(3 * inch, 10 * inch)
+    for flowable, copied in zip(cached, second):
+        assert copied is not flowable
+        assert not hasattr(flowable, 'blPara')
+        if hasattr(flowable, 'frags'):
+            assert copied.frags is not flowable.frags
+            assert copied.style is flowable.style
+
+def render_pdf(module, template_name, data, language):
+    buffer = io.BytesIO()
+    module.render(data, language, template_name, buffer)
+    return buffer.getvalue()
+
+@pytest.mark.parametrize('module,template_name', [
+    (curriculo_pdf, 'pdf'),
+    (curriculo_pdf, 'pdf_moderno'),
+    (curriculo_pdf_ats, 'pdf_ats'),
+])
+def test_concurrent_renders_from_cache_are_identical(invariant_pdf, module, template_name):
+    data = load_example('pt')
+    expected = render_pdf(module, template_name, data, 'pt')
+    # Agora todas as seções vêm do cache
+    assert render_pdf(module, template_name, data, 'pt') == expected
+
+    # Trocas de thread frequentes, para intercalar os layouts das cópias
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    barrier = threading.Barrier(4)
+    results = [None] * 8
+
+    def worker(index):
+        barrier.wait()
+        for i in range(index, len(results), 4):
+            results[i] = render_pdf(module, template_name, data, 'pt')
+
+    threads = [threading.Thread(target=worker, args=(index,)) for index in range(4)]
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+    assert results == [expected] * len(results)
@@ -0,0 +1,141 @@
+import io
+import re
+
+import pytest
+from reportlab.lib import colors
+from reportlab.lib.units import inch
+from reportlab.pdfgen.canvas import Canvas
+from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+
+from templates import template_pdf, template_pdf_moderno
+from templates.flowables import SkillBars
+
+SKILLS = [('Python', 5), ('Docker', 3), ('Kubernetes', 0), ('AWS', 4), ('SQL', 1), ('Go', 2)]
+
+class RecordingCanvas(Canvas):
+    """Canvas que anota, em coordenadas da página, os textos e os retângulos preenchidos."""
+
+    def __init__(self, *args, **kwargs):
+        Canvas.__init__(self, *args, **kwargs)
+        self.texts = []
+        self.rects = []
+
+    def _point(self, x, y):
+        a, b, c, d, e, f = self._currentMatrix
+        return a * x + c * y + e, b * x + d * y + f
+
+    def _add_rect(self, x, y, width, height):
+        (x0, y0), (x1, y1) = self._point(x, y), self._point(x + width, y + height)
+        self.rects.append(tuple(round(v, 2) for v in (min(x0, x1), min(y0, y1), abs(x1 - x0), abs(y1 - y0)))
+                          + (self._fillColorObj.hexval(),))
+
+    def drawString(self, x, y, text, *args, **kwargs):
+        self.texts.append((text,) + tuple(round(v, 2) for v in self._point(x, y)))
+        return Canvas.drawString(self, x, y, text, *args, **kwargs)
+
+    def rect(self, x, y, width, height, stroke=1, fill=0):
+        if fill:
+            self._add_rect(x, y, width, height)
+        return Canvas.rect(self, x, y, width, height, stroke, fill)
+
+    def drawPath(self, path, stroke=1, fill=0, *args, **kwargs):
+        if fill:
+            for code in path._code:
+                match = re.fullmatch(r'(\S+) (\S+) (\S+) (\S+) re', code)
+                if match:
+                    self._add_rect(*map(float, match.groups()))
+        return Canvas.drawPath(self, path, stroke, fill, *args, **kwargs)
+
+def old_pdf_rows(elements, styles):
+    """Montagem anterior do template pdf: tabelas, parágrafo de espaços e espaçadores por linha."""
+    for skill, level in SKILLS:
+        table = Table([[f"{skill}:"]], colWidths=[5.5*inch])
+        table.setStyle(TableStyle([
+            ('FONTSIZE', (0,0), (0,0), 11),
+            ('FONTNAME', (0,0), (0,0), 'Times-Roman'),
+            ('VALIGN', (0,0), (0,0), 'MIDDLE'),
+            ('ALIGN', (0,0), (0,0), 'LEFT'),
+        ]))
+        elements.append(table)
+        elements.append(Spacer(1, -0.22*inch))
+        elements.append(Paragraph("&nbsp;" * 40, styles['normal']))
+        elements.append(Spacer(1, -0.15*inch))
+        boxes = TableStyle([('GRID', (0,0), (-1,-1), 0, colors.white)])
+        for i in range(5):
+            if i < level:
+                boxes.add('BACKGROUND', (i,0), (i,0), template_pdf.AZUL)
+            boxes.add('BOX', (i,0), (i,0), 0.5, template_pdf.AZUL)
+        boxes_table = Table([[''] * 5], colWidths=[0.15*inch] * 5, rowHeights=[0.15*inch])
+        boxes_table.setStyle(boxes)
+        elements.append(boxes_table)
+        elements.append(Spacer(1, 0.08*inch))
+
+def old_moderno_rows(elements, styles):
+    """Montagem anterior do template pdf_moderno."""
+    module = template_pdf_moderno
+    for skill, level in SKILLS:
+        table = Table([[skill, '']], colWidths=[3*inch, 4.5*inch], rowHeights=[0.3*inch])
+        table.setStyle(TableStyle([
+            ('GRID', (0,0), (-1,-1), 0, colors.white),
+            ('FONTNAME', (0,0), (0,0), 'Helvetica'),
+            ('FONTSIZE', (0,0), (0,0), 11),
+            ('VALIGN', (0,0), (-1,-1), 'MIDDLE'),
+            ('ALIGN', (0,0), (0,0), 'LEFT'),
+        ]))
+        elements.append(table)
+        elements.append(Spacer(1, -0.25*inch))
+        elements.append(Paragraph("&nbsp;" * 50, styles['normal']))
+        elements.append(Spacer(1, -0.2*inch))
+        boxes = TableStyle([('GRID', (0,0), (-1,-1), 0, colors.white)])
+        for i in range(5):
+            if i < level:
+                boxes.add('BACKGROUND', (i,0), (i,0), module.AZUL_ESCURO)
+                boxes.add('BOX', (i,0), (i,0), 1, module.AZUL_ESCURO)
+            else:
+                boxes.add('BOX', (i,0), (i,0), 0.5, module.AZUL_CLARO)
+                boxes.add('BACKGROUND', (i,0), (i,0), module.CINZA)
+        boxes_table = Table([[''] * 5], colWidths=[0.2*inch] * 5, rowHeights=[0.2*inch])
+        boxes_table.setStyle(boxes)
+        elements.append(boxes_table)
+        elements.append(Spacer(1, 0.15*inch))
+
+def record(template, add_rows):
+    canvases = []
+
+    def make_canvas(*args, **kwargs):
+        canvases.append(RecordingCanvas(*args, **kwargs))
+        return canvases[-1]
+
+    styles = template.get_styles()
+    elements = [Paragraph('Habilidades', styles['secao'])]
+    add_rows(elements, styles)
+    elements.append(Paragraph('Depois da lista', styles['normal']))
+    SimpleDocTemplate(io.BytesIO()).build(elements, canvasmaker=make_canvas)
+    canvas, = canvases
+    return canvas
+
+@pytest.mark.parametrize('template,old_rows', [
+    (template_pdf, old_pdf_rows),
+    (template_pdf_moderno, old_moderno_rows),
+], ids=['pdf', 'pdf_moderno'])
+def test_skill_bars_match_old_per_row_layout(template, old_rows):
+    old = record(template, old_rows)
+    new = record(template, lambda elements, styles: template.add_skill_bars(elements, SKILLS, styles))
+
+    def text_positions(canvas):
+        return [(text.rstrip(':'), x, y) for text, x, y in canvas.texts if text]
+
+    assert len(new.texts) == len(SKILLS)
+    assert text_positions(new) == text_positions(old)
+    assert sorted(new.rects) == sorted(old.rects)
+
+def test_skill_bars_split_between_rows():
+    style = template_pdf.SKILL_BAR_STYLE
+    bars = SkillBars(SKILLS, style)
+    assert bars.wrap(400, 1000) == (400, len(SKILLS) * style.row_height)
+
+    first, rest = bars.split(400, 2.5 * style.row_height)
+    assert first.skills == tuple(SKILLS[:2])
+    assert rest.skills == tuple(SKILLS[2:])
+    assert bars.split(400, style.row_height - 1) == []
+    assert bars.split(400, 1000) == [bars]
@@ -0,0 +1,67 @@
+import copy
+import io
+
+import pytest
+from reportlab.lib.styles import ParagraphStyle
+from reportlab.pdfbase import pdfmetrics
+
+from conftest import load_example, skills_resume
+
+import curriculo_pdf
+from templates import template_pdf, template_pdf_ats, template_pdf_moderno
+
+TEMPLATES = (template_pdf, template_pdf_moderno, template_pdf_ats)
+
+@pytest.mark.parametrize('template', TEMPLATES, ids=lambda t: t.__name__)
+def test_styles_are_built_once_and_frozen(template):
+    styles = template.get_styles()
+    assert template.get_styles() is styles
+
+    with pytest.raises(AttributeError):
+        styles['normal'].fontSize = 40
+    with pytest.raises(AttributeError):
+        del styles['normal'].leading
+    with pytest.raises(AttributeError):
+        styles['base']['Normal'].fontName = 'Courier'
+    with pytest.raises(TypeError):
+        styles['normal'] = ParagraphStyle('Outro')
+    assert styles['normal'].fontSize != 40
+    assert styles['base']['Normal'].fontName != 'Courier'
+
+def test_frozen_styles_can_be_parents_and_copied():
+    normal = template_pdf.get_styles()['normal']
+    derived = ParagraphStyle('Maior', parent=normal, fontSize=20)
+    derived.leading = 24
+
+    assert (derived.fontName, derived.fontSize, derived.leading) == (normal.fontName, 20, 24)
+    assert normal.fontSize == 11
+    assert copy.copy(normal) is normal
+    assert copy.deepcopy({'style': normal})['style'] is normal
+
+def test_skill_labels_are_measured_once():
+    style = template_pdf.SKILL_BAR_STYLE
+    style.label_runs.cache_clear()
+
+    runs = style.label_runs('Python')
+    assert runs == ((style.font_name, 'Python:', pdfmetrics.stringWidth('Python:', style.font_name, style.font_size)),)
+    assert style.label_runs('Python') is runs
+    assert style.label_runs.cache_info().hits == 1
+
+def test_non_ascii_labels_keep_full_width():
+    style = template_pdf_moderno.SKILL_BAR_STYLE
+    runs = style.label_runs('Programação ☎')
+    assert ''.join(run for _, run, _ in runs) == style.label.format('Programação ☎')
+    for font, run, width in runs:
+        assert width == pdfmetrics.stringWidth(run, font, style.font_size)
+
+@pytest.mark.parametrize('template_name', ['pdf', 'pdf_moderno'])
+def test_renders_do_not_change_shared_styles(template_name):
+    template = curriculo_pdf.load_template(template_name)
+    before = {name: dict(style.__dict__) for name, style in template.get_styles().items() if name != 'base'}
+
+    for data in (load_example('pt'), skills_resume('Python', 'Docker')):
+        for compact in (False, True):
+            curriculo_pdf.render(data, 'pt', template_name, io.BytesIO(), compact=compact)
+
+    after = {name: dict(style.__dict__) for name, style in template.get_styles().items() if name != 'base'}
+    assert after == before
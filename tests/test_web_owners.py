@@ -0,0 +1,101 @@
+import uuid
+
+import pytest
+
+@pytest.fixture
+def web(web_app, monkeypatch):
+    monkeypatch.setattr(web_app, 'USER_ID_HEADER', None)
+    return web_app
+
+def new_client(web):
+    return web.app.test_client()
+
+def load(client, language='pt', **kwargs):
+    response = client.post('/get_json_content', json={'language': language}, **kwargs)
+    assert response.status_code == 200
+    return response.get_json()
+
+def save(client, content, revision, language='pt', **kwargs):
+    return client.post('/save_json', json={'language': language, 'content': content, 'revision': revision}, **kwargs)
+
+def test_stale_save_returns_conflict(web):
+    client = new_client(web)
+    entry = load(client)
+    assert entry['revision'] == 0
+
+    first = save(client, {**entry['content'], 'teste': 1}, entry['revision'])
+    assert first.status_code == 200
+    assert first.get_json()['revision'] == 1
+
+    # Gravação baseada na revisão antiga (outra aba): recusada com a revisão atual
+    stale = save(client, {**entry['content'], 'teste': 2}, entry['revision'])
+    assert stale.status_code == 409
+    assert stale.get_json()['revision'] == 1
+    assert load(client)['content']['teste'] == 1
+
+def test_anonymous_users_are_isolated(web):
+    alice, bob = new_client(web), new_client(web)
+    entry = load(alice)
+    assert save(alice, {**entry['content'], 'dono': 'alice'}, entry['revision']).status_code == 200
+
+    assert load(alice)['content']['dono'] == 'alice'
+    other = load(bob)
+    assert 'dono' not in other['content']
+    assert other['revision'] == 0
+
+def test_anonymous_cookie_is_namespaced(web):
+    client = new_client(web)
+    load(client)
+    cookie = client.get_cookie(web.USER_COOKIE)
+    assert cookie is not None
+    assert cookie.value.startswith(web.ANONYMOUS_PREFIX)
+
+    # Um cookie forjado com o id de outro dono é trocado por um id anônimo novo
+    forged = new_client(web)
+    forged.set_cookie(web.USER_COOKIE, 'default')
+    load(forged)
+    assert forged.get_cookie(web.USER_COOKIE).value.startswith(web.ANONYMOUS_PREFIX)
+
+def test_header_is_required_when_configured(web, monkeypatch):
+    monkeypatch.setattr(web, 'USER_ID_HEADER', 'X-User-Id')
+    client = new_client(web)
+
+    assert client.post('/get_json_content', json={'language': 'pt'}).status_code == 401
+    for owner in ('default', 'anon:' + uuid.uuid4().hex, 'inválido com espaço'):
+        response = client.post('/get_json_content', json={'language': 'pt'}, headers={'X-User-Id': owner})
+        assert response.status_code == 401
+
+    # O cookie anônimo não substitui o cabeçalho
+    client.set_cookie(web.USER_COOKIE, 'anon:' + uuid.uuid4().hex)
+    assert client.post('/get_json_content', json={'language': 'pt'}).status_code == 401
+
+def test_header_users_are_isolated(web, monkeypatch):
+    monkeypatch.setattr(web, 'USER_ID_HEADER', 'X-User-Id')
+    client = new_client(web)
+    carol = {'X-User-Id': 'carol-' + uuid.uuid4().hex}
+    dave = {'X-User-Id': 'dave-' + uuid.uuid4().hex}
+
+    entry = load(client, headers=carol)
+    assert save(client, {**entry['content'], 'dono': 'carol'}, entry['revision'], headers=carol).status_code == 200
+    assert load(client, headers=carol)['content']['dono'] == 'carol'
+    assert 'dono' not in load(client, headers=dave)['content']
+    assert client.get_cookie(web.USER_COOKIE) is None
+
+@pytest.mark.parametrize('revision', ['abc', [], {}, True, -1, 1.5])
+def test_invalid_revision_is_a_bad_request(web, revision):
+    client = new_client(web)
+    entry = load(client)
+    response = save(client, entry['content'], revision)
+    assert response.status_code == 400
+    assert response.get_json()['error'] == 'Revisão inválida'
+
+def test_numeric_string_revision_is_accepted(web):
+    client = new_client(web)
+    entry = load(client)
+    assert save(client, entry['content'], '0').status_code == 200
+
+@pytest.mark.parametrize('language', ['../../x', 'pt/../x', 'x' * 40])
+def test_invalid_language_is_rejected(web, language):
+    client = new_client(web)
+    assert save(client, {'nome': 'A', 'secoes': {}}, None, language=language).status_code == 400
+    assert client.post('/create_json', json={'language': language}).status_code == 400
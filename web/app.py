@@ -1,11 +1,18 @@
 import os
 import sys
-import glob
 import json
-import subprocess
-from flask import Flask, render_template, request, jsonify, send_file, redirect, url_for
+import re
+import uuid
+from flask import Flask, Response, render_template, request, jsonify, send_file, redirect, url_for, stream_with_context, g
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 from templates import TemplateManager
+from curriculo import engine, batch, preview, matching
+from curriculo.locale_packs import find_locale_pack, is_valid_locale_code
+from curriculo.render_cache import RenderCache, DEFAULT_MAX_BYTES
+from curriculo.resume_store import ResumeStore, RevisionConflict, DEFAULT_OWNER, default_db_path, is_valid_owner
+from curriculo.render_pool import RenderPool, PoolSaturated, RenderTimeout, DEFAULT_TIMEOUT as RENDER_TIMEOUT
+from curriculo.jobs import JobStore, DEFAULT_TTL as DEFAULT_JOB_TTL, DEFAULT_TIMEOUT as DEFAULT_JOB_TIMEOUT
+from curriculo.download_store import DownloadStore, DEFAULT_TTL as DOWNLOAD_TTL, DEFAULT_MAX_BYTES as DOWNLOAD_MAX_BYTES
 
 # Detectar se está em ambiente de produção (Render) ou local
 def is_production():
@@ -14,59 +21,111 @@ def is_production():
 
 app = Flask(__name__)
 
-# Cache de arquivos temporários
-file_cache = {}
+# Downloads temporários compartilhados entre workers (spool em disco + índice SQLite)
+download_store = DownloadStore(
+    spool_dir=os.environ.get('DOWNLOAD_SPOOL_DIR'),
+    ttl=int(os.environ.get('DOWNLOAD_TTL_SECONDS', DOWNLOAD_TTL)),
+    max_bytes=int(os.environ.get('DOWNLOAD_MAX_BYTES', DOWNLOAD_MAX_BYTES)),
+)
+download_store.start_collector()
 
-# Função para listar idiomas disponíveis (adaptado do cv-generator.py)
+# Cache de documentos renderizados (mesmo conteúdo, formato e template -> mesmo arquivo)
+render_cache = RenderCache(int(os.environ.get('RENDER_CACHE_MAX_BYTES', DEFAULT_MAX_BYTES)))
+
+# Cache das pré-visualizações HTML do editor (bem menores que os documentos)
+preview_cache = RenderCache(int(os.environ.get('PREVIEW_CACHE_MAX_BYTES', 8 * 1024 * 1024)))
+
+# Pool de processos de renderização com fila limitada (RENDER_POOL_WORKERS=0 renderiza no próprio processo)
+render_pool = RenderPool(
+    workers=int(os.environ.get('RENDER_POOL_WORKERS', 2)),
+    max_queue=int(os.environ.get('RENDER_POOL_QUEUE', 8)),
+    timeout=float(os.environ.get('RENDER_TIMEOUT_SECONDS', RENDER_TIMEOUT)),
+)
+if is_production():
+    # Em produção, criar os processos já aquecidos antes do primeiro pedido
+    render_pool.start()
+
+# Trabalhos de renderização assíncronos (POST /jobs): estado no índice de downloads e documento
+# no spool, para que qualquer worker responda às consultas
+job_store = JobStore(
+    download_store,
+    ttl=int(os.environ.get('JOB_TTL_SECONDS', DEFAULT_JOB_TTL)),
+    timeout=int(os.environ.get('JOB_TIMEOUT_SECONDS', DEFAULT_JOB_TIMEOUT)),
+)
+
+# Diretório raiz do projeto, onde ficam os arquivos curriculo_XX.json
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Currículos salvos pela interface web (SQLite em modo WAL, com histórico de revisões).
+# Os arquivos curriculo_XX.json da raiz que ainda não estão no banco são importados na partida.
+resume_store = ResumeStore(
+    default_db_path(ROOT_DIR),
+    max_revisions=int(os.environ.get('RESUME_MAX_REVISIONS', 50)),
+)
+resume_store.import_files(DEFAULT_OWNER, ROOT_DIR)
+
+# Cada usuário tem os seus currículos. Com USER_ID_HEADER definido, o usuário vem só desse
+# cabeçalho (preenchido por um proxy que faz a autenticação) e pedidos sem ele são recusados.
+# Sem cabeçalho configurado, cada navegador recebe um id anônimo em um cookie na primeira
+# visita; os ids anônimos têm o prefixo "anon:", que nunca é aceito no cabeçalho, então um
+# cookie não consegue se passar por um usuário autenticado. Os currículos do dono padrão
+# (os exemplos importados) servem para todos até o usuário salvar.
+USER_ID_HEADER = os.environ.get('USER_ID_HEADER')
+USER_COOKIE = 'cv_user'
+USER_COOKIE_MAX_AGE = 365 * 24 * 3600
+ANONYMOUS_PREFIX = 'anon:'
+_ANONYMOUS_OWNER_RE = re.compile(r'^anon:[0-9a-f]{32}$')
+
+def _header_owner():
+    owner = request.headers.get(USER_ID_HEADER)
+    # O dono padrão guarda os exemplos compartilhados e não pode ser usado por um usuário
+    if not is_valid_owner(owner) or owner == DEFAULT_OWNER or owner.startswith(ANONYMOUS_PREFIX):
+        return None
+    return owner
+
+@app.before_request
+def require_user_header():
+    """Com USER_ID_HEADER definido, recusa pedidos sem um usuário autenticado."""
+    if USER_ID_HEADER and request.endpoint != 'static' and _header_owner() is None:
+        return jsonify({'error': 'Usuário não autenticado'}), 401
+
+def get_owner():
+    """Dono dos currículos do pedido atual."""
+    owner = getattr(g, 'owner', None)
+    if owner is not None:
+        return owner
+    if USER_ID_HEADER:
+        owner = _header_owner()
+    else:
+        owner = request.cookies.get(USER_COOKIE)
+        if not owner or not _ANONYMOUS_OWNER_RE.match(owner):
+            # Primeira visita: um id anônimo aleatório, gravado no cookie ao fim do pedido
+            owner = g.new_owner = ANONYMOUS_PREFIX + uuid.uuid4().hex
+    g.owner = owner
+    return owner
+
+@app.after_request
+def set_owner_cookie(response):
+    new_owner = getattr(g, 'new_owner', None)
+    if new_owner:
+        response.set_cookie(USER_COOKIE, new_owner, max_age=USER_COOKIE_MAX_AGE, httponly=True, samesite='Lax',
+                            secure=is_production())
+    return response
+
+# Função para listar idiomas disponíveis (os do usuário e os exemplos compartilhados)
 def get_available_languages():
-    # Procurar todos os arquivos JSON que seguem o padrão curriculo_XX.json na pasta raiz
-    root_dir = os.path.dirname(os.path.dirname(__file__))
-    json_files = glob.glob(os.path.join(root_dir, 'curriculo_*.json'))
-    languages = {}
-    
-    print(f"Diretório raiz: {root_dir}")
-    print(f"Arquivos JSON encontrados: {json_files}")
-    
-    for file in json_files:
-        # Extrair o código do idioma do nome do arquivo (curriculo_XX.json -> XX)
-        base_name = os.path.basename(file)
-        lang_code = base_name.replace('curriculo_', '').replace('.json', '')
-        
-        print(f"Processando arquivo: {file}, código de idioma: {lang_code}")
-        
-        # Carregar o arquivo para obter o nome do idioma na própria língua
-        try:
-            with open(file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                
-                # Verificar se o arquivo tem a estrutura esperada
-                if 'languageName' in data:
-                    lang_name = data['languageName']
-                else:
-                    # Fallback para casos onde o nome do idioma não está definido
-                    lang_name = lang_code.upper()
-                
-                languages[lang_code] = {
-                    'name': lang_name,
-                    'file': file
-                }
-                print(f"Idioma adicionado: {lang_code} -> {lang_name}")
-        except Exception as e:
-            # Se houver erro ao carregar ou analisar, pular este arquivo
-            print(f"Erro ao carregar {file}: {str(e)}")
-            pass
+    available = resume_store.languages(get_owner(), DEFAULT_OWNER)
     
     # Se nenhum idioma foi encontrado, adicionar pelo menos o português como fallback
-    if not languages:
+    if not available:
         print("Nenhum idioma encontrado, adicionando fallbacks manuais...")
-        languages = {
-            'pt': {'name': 'Português', 'file': os.path.join(root_dir, 'curriculo_pt.json')},
-            'en': {'name': 'English', 'file': os.path.join(root_dir, 'curriculo_en.json')},
-            'es': {'name': 'Español', 'file': os.path.join(root_dir, 'curriculo_es.json')}
+        available = {
+            'pt': {'name': 'Português', 'file': os.path.join(ROOT_DIR, 'curriculo_pt.json')},
+            'en': {'name': 'English', 'file': os.path.join(ROOT_DIR, 'curriculo_en.json')},
+            'es': {'name': 'Español', 'file': os.path.join(ROOT_DIR, 'curriculo_es.json')}
         }
     
-    print(f"Lista final de idiomas: {languages}")
-    return languages
+    return available
 
 # Obter templates disponíveis
 def get_available_templates():
@@ -86,7 +145,6 @@ def get_available_templates():
         
         # Se encontrou templates, usar eles
         if discovered_templates:
-            print("Templates descobertos:", discovered_templates)
             return discovered_templates
     except Exception as e:
         print(f"Erro ao descobrir templates: {str(e)}")
@@ -255,6 +313,16 @@ def generate():
                            template_groups=template_groups,
                            format_display_names=format_display_names)
 
+# Seção do novo JSON -> chave do título no pacote de idioma
+NEW_JSON_SECTIONS = {
+    "resumo": "summary",
+    "experienciaProfissional": "experience",
+    "educacao": "education",
+    "habilidades": "skills",
+    "idiomas": "languages",
+    "certificacoes": "certifications",
+}
+
 @app.route('/create_json', methods=['POST'])
 def create_json():
     try:
@@ -266,14 +334,14 @@ def create_json():
         
         if not language:
             return jsonify({'error': 'Idioma não especificado'}), 400
+        if not is_valid_locale_code(language):
+            return jsonify({'error': f'Idioma inválido: {language}'}), 400
     except Exception as e:
         return jsonify({'error': f'Erro ao processar requisição: {str(e)}'}), 500
         
-    # Verificar se o arquivo já existe
-    root_dir = os.path.dirname(os.path.dirname(__file__))
-    file_path = os.path.join(root_dir, f'curriculo_{language}.json')
-    
-    if os.path.exists(file_path):
+    # Verificar se o currículo já existe
+    owner = get_owner()
+    if resume_store.load_with_revision(owner, language, DEFAULT_OWNER) is not None:
         return jsonify({'error': f'Arquivo para o idioma {language} já existe'}), 400
     
     # Criar um template básico para o novo arquivo
@@ -311,38 +379,19 @@ def create_json():
         }
     }
     
-    # Definir nomes específicos do idioma
-    if language == "pt":
-        template["languageName"] = "Português"
-        template["secoes"]["resumo"]["titulo"] = "Resumo Profissional"
-        template["secoes"]["experienciaProfissional"]["titulo"] = "Experiência Profissional"
-        template["secoes"]["educacao"]["titulo"] = "Educação"
-        template["secoes"]["habilidades"]["titulo"] = "Habilidades"
-        template["secoes"]["idiomas"]["titulo"] = "Idiomas"
-        template["secoes"]["certificacoes"]["titulo"] = "Certificações"
-    elif language == "en":
-        template["languageName"] = "English"
-        template["secoes"]["resumo"]["titulo"] = "Professional Summary"
-        template["secoes"]["experienciaProfissional"]["titulo"] = "Work Experience"
-        template["secoes"]["educacao"]["titulo"] = "Education"
-        template["secoes"]["habilidades"]["titulo"] = "Skills"
-        template["secoes"]["idiomas"]["titulo"] = "Languages"
-        template["secoes"]["certificacoes"]["titulo"] = "Certifications"
-    elif language == "es":
-        template["languageName"] = "Español"
-        template["secoes"]["resumo"]["titulo"] = "Resumen Profesional"
-        template["secoes"]["experienciaProfissional"]["titulo"] = "Experiencia Profesional"
-        template["secoes"]["educacao"]["titulo"] = "Educación"
-        template["secoes"]["habilidades"]["titulo"] = "Habilidades"
-        template["secoes"]["idiomas"]["titulo"] = "Idiomas"
-        template["secoes"]["certificacoes"]["titulo"] = "Certificaciones"
-    
-    # Salvar o template no arquivo
+    # Nomes específicos do idioma, vindos do pacote de idioma (vazios se o idioma não tiver pacote)
+    pack = find_locale_pack(language)
+    if pack is not None:
+        template["languageName"] = pack.name
+        for key, section in NEW_JSON_SECTIONS.items():
+            template["secoes"][key]["titulo"] = pack.section_titles.get(section, "")
+
+    # Salvar o template no banco (falha se outro pedido criou o mesmo idioma ao mesmo tempo)
     try:
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(template, f, indent=2, ensure_ascii=False)
-        
+        resume_store.create(owner, language, template)
         return jsonify({'success': True, 'message': f'Arquivo JSON para {template["languageName"]} criado com sucesso'})
+    except RevisionConflict:
+        return jsonify({'error': f'Arquivo para o idioma {language} já existe'}), 400
     except Exception as e:
         return jsonify({'error': f'Erro ao criar arquivo: {str(e)}'}), 500
 
@@ -358,14 +407,12 @@ def get_json_content():
         if not language:
             return jsonify({'error': 'Idioma não especificado'}), 400
         
-        file_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), f'curriculo_{language}.json')
-        
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = json.load(f)
-            return jsonify({'content': content})
-        except FileNotFoundError:
-            return jsonify({'error': f'Arquivo para o idioma {language} não encontrado'}), 404
+            entry = resume_store.load_with_revision(get_owner(), language, DEFAULT_OWNER)
+            if entry is None:
+                return jsonify({'error': f'Arquivo para o idioma {language} não encontrado'}), 404
+            revision, content = entry
+            return jsonify({'content': content, 'revision': revision})
         except Exception as e:
             return jsonify({'error': f'Erro ao ler arquivo: {str(e)}'}), 500
             
@@ -384,29 +431,72 @@ def save_json():
         
         if not language or not content:
             return jsonify({'error': 'Dados incompletos'}), 400
+        if not is_valid_locale_code(language):
+            return jsonify({'error': f'Idioma inválido: {language}'}), 400
         
-        file_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), f'curriculo_{language}.json')
+        # Revisão em que a edição se baseou (opcional); o banco recebe um inteiro
+        revision = data.get('revision')
+        if revision is not None:
+            try:
+                if isinstance(revision, bool) or not isinstance(revision, (int, str)):
+                    raise TypeError(revision)
+                revision = int(revision)
+                if revision < 0:
+                    raise ValueError(revision)
+            except (TypeError, ValueError):
+                return jsonify({'error': 'Revisão inválida'}), 400
         
         try:
             # Verificar se o conteúdo é JSON válido
             parsed_content = json.loads(content) if isinstance(content, str) else content
             
-            # Salvar o arquivo
-            with open(file_path, 'w', encoding='utf-8') as f:
-                if isinstance(content, str):
-                    f.write(content)
-                else:
-                    json.dump(content, f, indent=2, ensure_ascii=False)
-                    
-            return jsonify({'success': True, 'message': 'Arquivo salvo com sucesso!'})
+            # Gravação atômica de uma nova revisão; com 'revision', falha se outra gravação veio antes
+            revision = resume_store.save(get_owner(), language, parsed_content, revision)
+            return jsonify({'success': True, 'message': 'Arquivo salvo com sucesso!', 'revision': revision})
         except json.JSONDecodeError:
             return jsonify({'error': 'JSON inválido'}), 400
+        except RevisionConflict as e:
+            return jsonify({'error': 'O currículo foi alterado por outra gravação. Recarregue antes de salvar.',
+                            'revision': e.current}), 409
         except Exception as e:
             return jsonify({'error': f'Erro ao salvar arquivo: {str(e)}'}), 500
             
     except Exception as e:
         return jsonify({'error': f'Erro ao processar requisição: {str(e)}'}), 500
 
+def load_resume_data(language, content=None):
+    """Retorna o conteúdo enviado pelo cliente ou o arquivo JSON do idioma (None se não existir)."""
+    if content:
+        print("Usando conteúdo JSON enviado pelo cliente")
+        return content
+    return resume_store.load(get_owner(), language, DEFAULT_OWNER)
+
+@app.route('/json_history', methods=['POST'])
+def json_history():
+    """Revisões guardadas do currículo de um idioma; com 'revision', o conteúdo dessa revisão."""
+    data = request.json or {}
+    language = data.get('language')
+    if not language:
+        return jsonify({'error': 'Idioma não especificado'}), 400
+    if data.get('revision') is not None:
+        try:
+            revision = int(data['revision'])
+        except (TypeError, ValueError):
+            return jsonify({'error': 'Revisão inválida'}), 400
+        content = resume_store.load_revision(get_owner(), language, revision)
+        if content is None:
+            return jsonify({'error': f"Revisão {data['revision']} não encontrada"}), 404
+        return jsonify({'revision': revision, 'content': content})
+    return jsonify({'revisions': resume_store.history(get_owner(), language)})
+
+def busy_response(error):
+    """Resposta 503 com Retry-After para quando a fila de renderização está cheia."""
+    print(f"Fila de renderização cheia: {str(error)}")
+    response = jsonify({'error': 'Servidor ocupado gerando outros currículos. Tente novamente em instantes.'})
+    response.status_code = 503
+    response.headers['Retry-After'] = str(error.retry_after)
+    return response
+
 @app.route('/generate_pdf', methods=['POST'])
 def generate_pdf():
     try:
@@ -418,131 +508,50 @@ def generate_pdf():
         format_type = data.get('format')
         template = data.get('template', None)
         content = data.get('content', None)  # Novo: conteúdo JSON do currículo
+        compact = bool(data.get('compact', False))  # PDF no modo compacto
         
         if not language or not format_type:
             return jsonify({'error': 'Dados incompletos'}), 400
         
         try:
-            # Determinar qual script usar com base no formato escolhido
-            root_dir = os.path.dirname(os.path.dirname(__file__))
-            print(f"Diretório raiz: {root_dir}")
-            
-            if format_type == 'pdf_ats':
-                script = os.path.join(root_dir, 'curriculo_pdf_ats.py')
-            elif format_type.startswith('pdf'):
-                script = os.path.join(root_dir, 'curriculo_pdf.py')
-            else:  # docx e outros
-                script = os.path.join(root_dir, 'curriculo_docx.py')
-                
-            print(f"Script selecionado: {script}")
+            resume_data = load_resume_data(language, content)
+            if resume_data is None:
+                return jsonify({'error': f'Arquivo para o idioma {language} não encontrado'}), 404
             
-            # Se o conteúdo foi enviado diretamente, salvar em um arquivo temporário
-            temp_json_file = None
-            if content:
-                print("Usando conteúdo JSON enviado pelo cliente")
-                import tempfile
-                
-                # Criar arquivo temporário com o conteúdo JSON
-                temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=f'_{language}.json', mode='w', encoding='utf-8')
-                json.dump(content, temp_file)
-                temp_file.close()
-                temp_json_file = temp_file.name
-                
-                # Ajustar os argumentos para usar o arquivo temporário
-                cmd = [sys.executable, script, language, '--json-file', temp_json_file]
-            else:
-                # Preparar os argumentos normais
-                cmd = [sys.executable, script, language]
-            
-            # Se um template específico foi selecionado, adicioná-lo aos argumentos
-            if template and template != format_type:
-                if '_' in template:
-                    # O nome do template já inclui o formato, usar como está
-                    cmd.extend(['--template', template])
-                else:
-                    # Adicionar o formato como prefixo
-                    cmd.extend(['--template', f"{format_type}_{template}"])
-            elif format_type and '_' in format_type:
-                # Se o formato já é um template composto (como pdf_ats), passá-lo como template
-                cmd.extend(['--template', format_type])
-                
-            print(f"Comando: {' '.join(cmd)}")
-              # Executar o script Python
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            
-            # Limpar arquivo temporário se foi criado
-            if 'temp_json_file' in locals() and temp_json_file and os.path.exists(temp_json_file):
-                try:
-                    os.unlink(temp_json_file)
-                    print(f"Arquivo temporário excluído: {temp_json_file}")
-                except Exception as e:
-                    print(f"Erro ao excluir arquivo temporário: {str(e)}")
+            # Gerar o documento em memória, sem gravar nada no disco
+            filename = os.path.basename(engine.get_output_filename(resume_data, language, format_type))
+            mimetype = engine.get_mimetype(format_type)
+            document = engine.render_cached(render_cache, resume_data, language, format_type, template,
+                                            render=render_pool.render, compact=compact)
             
-            if result.returncode != 0:
-                print(f"Erro ao gerar currículo: {result.stderr}")
-                return jsonify({'error': result.stderr}), 500
-                
-            # Localizar o arquivo gerado
-            output_dir = os.path.join(root_dir)
+            print(f"Arquivo gerado: {filename} ({len(document)} bytes)")
             
-            # Procurar o arquivo gerado (suponha que termina com o código do idioma e a extensão apropriada)
-            file_extension = '.pdf' if format_type.startswith('pdf') else '.docx'
-              # Ler a saída para encontrar o nome do arquivo gerado
-            output = result.stdout
-            filename = None
+            # Se o cliente pediu o arquivo diretamente, enviá-lo na própria resposta
+            if data.get('download'):
+                return serve_temporary_file(document, filename, mimetype)
             
-            for line in output.splitlines():
-                if 'Arquivo gerado:' in line:
-                    filename = line.split('Arquivo gerado:')[-1].strip()
-                    break
-                    
-            if not filename:
-                # Tentar encontrar qualquer arquivo recém-criado
-                files = glob.glob(os.path.join(output_dir, f"*{file_extension}"))
-                if files:
-                    # Ordenar por data de modificação e pegar o mais recente
-                    filename = sorted(files, key=os.path.getmtime)[-1]
-                    filename = os.path.basename(filename)
+            # Caso contrário, guardar o documento para um download posterior (em qualquer worker)
+            try:
+                file_id = download_store.put(document, filename, mimetype)
+            except ValueError as e:
+                # Maior que toda a cota de downloads: não há como guardá-lo
+                print(f"Download não armazenado: {str(e)}")
+                return jsonify({'error': 'Documento grande demais para download posterior; peça o download direto.'}), 413
             
-            if not filename:
-                return jsonify({'error': 'Não foi possível encontrar o arquivo gerado'}), 500
-                
-            print(f"Arquivo gerado: {filename}")
-            file_path = os.path.join(root_dir, filename)
-            
-            # Verificar se o arquivo realmente existe
-            if not os.path.exists(file_path):
-                print(f"ERRO: Arquivo gerado não encontrado: {file_path}")
-                return jsonify({'error': 'Arquivo gerado não encontrado no servidor'}), 500
-                
-            # Comportamento diferente baseado no ambiente
-            if is_production():
-                # Em produção (Render), usar sistema temporário
-                import uuid
-                file_id = str(uuid.uuid4())
-                  # Armazenar o caminho completo no cache global
-                global file_cache
-                file_cache[file_id] = file_path
-                
-                return jsonify({
-                    'success': True, 
-                    'filename': filename,
-                    'file_id': file_id,
-                    'download_url': url_for('download_file', file_id=file_id)
-                })
-            else:
-                # Em ambiente local, usar sistema de arquivos normal
-                # Garantir que a URL tenha o nome do arquivo correto
-                download_url = url_for('download_file_local', filename=filename)
-                print(f"URL de download local gerada: {download_url}")
-                print(f"Caminho completo do arquivo: {file_path}")
-                return jsonify({
-                    'success': True, 
-                    'filename': filename,
-                    'download_url': download_url,
-                    'file_path': file_path  # Adicionar o caminho completo para depuração
-                })
+            return jsonify({
+                'success': True, 
+                'filename': filename,
+                'file_id': file_id,
+                'download_url': url_for('download_file', file_id=file_id)
+            })
             
+        except PoolSaturated as e:
+            # Fila cheia: pedir ao cliente que tente novamente mais tarde
+            return busy_response(e)
+        except RenderTimeout as e:
+            # Renderização travada ou lenta demais: liberar o worker web
+            print(f"Tempo limite de renderização: {str(e)}")
+            return jsonify({'error': 'A geração do currículo demorou demais. Tente novamente.'}), 504
         except Exception as e:
             print(f"Erro ao gerar currículo: {str(e)}")
             return jsonify({'error': str(e)}), 500
@@ -550,56 +559,221 @@ def generate_pdf():
     except Exception as e:
         return jsonify({'error': f'Erro ao processar requisição: {str(e)}'}), 500
 
-@app.route('/download/<file_id>')
-def download_file(file_id):
-    """Download de um arquivo usando file_id temporário (para ambiente de produção)."""
-    # Verificar se o ID do arquivo existe no cache
-    global file_cache
-    if file_id not in file_cache:
-        return jsonify({'error': 'Arquivo não encontrado ou expirado'}), 404
-        
-    file_path = file_cache[file_id]
-    
-    if not os.path.exists(file_path):
-        return jsonify({'error': 'Arquivo não encontrado no servidor'}), 404
-    
-    # Determinar o tipo MIME com base na extensão
-    filename = os.path.basename(file_path)
-    mimetype = 'application/pdf' if filename.endswith('.pdf') else 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
-    
-    # Ler o conteúdo do arquivo
-    with open(file_path, 'rb') as f:
-        content = f.read()
-    
-    # Usar serve_temporary_file para enviar o arquivo
-    return serve_temporary_file(content, filename, mimetype)
+@app.route('/preview', methods=['POST'])
+def preview_resume():
+    """Pré-visualização HTML do currículo, usada pelo editor a cada alteração."""
+    try:
+        data = request.json
+        if data is None:
+            return jsonify({'error': 'Dados JSON não recebidos'}), 400
 
-@app.route('/download_local/<filename>')
-def download_file_local(filename):
-    """Download de um arquivo usando o sistema de arquivos local."""
-    root_dir = os.path.dirname(os.path.dirname(__file__))
-    file_path = os.path.join(root_dir, filename)
-    
-    print(f"Tentando baixar o arquivo: {file_path}")
-    
-    if not os.path.exists(file_path):
-        print(f"ERRO: Arquivo não encontrado: {file_path}")
-        return jsonify({'error': 'Arquivo não encontrado no servidor'}), 404
-    
+        language = data.get('language')
+        template = data.get('template') or 'pdf'
+        content = data.get('content', None)
+
+        if not language:
+            return jsonify({'error': 'Dados incompletos'}), 400
+
+        try:
+            if isinstance(content, str):
+                content = json.loads(content)
+            resume_data = load_resume_data(language, content)
+            if resume_data is None:
+                return jsonify({'error': f'Arquivo para o idioma {language} não encontrado'}), 404
+
+            key = preview.preview_key(resume_data, language, template)
+            html = preview_cache.get(key)
+            cache_status = 'hit'
+            if html is None:
+                cache_status = 'miss'
+                html = preview.render_html(resume_data, language, template).encode('utf-8')
+                preview_cache.put(key, html)
+
+            response = Response(html, mimetype='text/html')
+            response.headers['X-Preview-Cache'] = cache_status
+            response.headers['Cache-Control'] = 'no-store'
+            return response
+
+        except json.JSONDecodeError:
+            return jsonify({'error': 'JSON inválido'}), 400
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        except Exception as e:
+            print(f"Erro ao gerar pré-visualização: {str(e)}")
+            return jsonify({'error': str(e)}), 500
+
+    except Exception as e:
+        return jsonify({'error': f'Erro ao processar requisição: {str(e)}'}), 500
+
+@app.route('/generate_batch', methods=['POST'])
+def generate_batch():
+    """Gera vários currículos (idiomas x formatos/templates) e envia um ZIP em fluxo."""
     try:
-        # Determinar o tipo MIME com base na extensão
-        mimetype = 'application/pdf' if filename.endswith('.pdf') else 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
+        data = request.json or {}
         
-        # Usar o método mais robusto para enviar o arquivo
-        return send_file(
-            file_path, 
-            as_attachment=True, 
-            download_name=filename,
-            mimetype=mimetype
+        # Conteúdo enviado pelo cliente por idioma (opcional) e idiomas pedidos (padrão: todos)
+        contents = data.get('contents') or {}
+        languages = data.get('languages') or list(contents) or list(get_available_languages())
+        
+        # Alvos no formato [{"format": "pdf", "template": "pdf_moderno"}, ...] (padrão: todos)
+        targets = [(t.get('format'), t.get('template')) for t in data.get('targets') or []]
+        if any(not format_type for format_type, _ in targets):
+            return jsonify({'error': 'Formato não especificado em um dos alvos'}), 400
+        
+        # Ler os dados de cada idioma uma única vez para toda a matriz
+        resumes = {}
+        for language in languages:
+            resume_data = load_resume_data(language, contents.get(language))
+            if resume_data is None:
+                return jsonify({'error': f'Arquivo para o idioma {language} não encontrado'}), 404
+            resumes[language] = resume_data
+        
+        matrix = batch.build_matrix(resumes, targets)
+        members = batch.iter_rendered(resumes, matrix, pool=render_pool, cache=render_cache,
+                                      compact=bool(data.get('compact', False)))
+        
+        return Response(
+            stream_with_context(batch.stream_zip(members)),
+            mimetype='application/zip',
+            headers={'Content-Disposition': 'attachment; filename=curriculos.zip'}
         )
     except Exception as e:
-        print(f"ERRO ao enviar arquivo: {str(e)}")
-        return jsonify({'error': f'Erro ao baixar arquivo: {str(e)}'}), 500
+        return jsonify({'error': f'Erro ao processar requisição: {str(e)}'}), 500
+
+@app.route('/size_report', methods=['POST'])
+def size_report():
+    """Tamanho de cada PDF do currículo no modo normal e no compacto."""
+    try:
+        data = request.json
+        if data is None:
+            return jsonify({'error': 'Dados JSON não recebidos'}), 400
+        
+        language = data.get('language')
+        if not language:
+            return jsonify({'error': 'Dados incompletos'}), 400
+        
+        resume_data = load_resume_data(language, data.get('content', None))
+        if resume_data is None:
+            return jsonify({'error': f'Arquivo para o idioma {language} não encontrado'}), 404
+        
+        # Alvos no formato [{"format": "pdf", "template": "pdf_moderno"}, ...] (padrão: todos os PDFs)
+        targets = [(t.get('format'), t.get('template')) for t in data.get('targets') or []] or batch.DEFAULT_TARGETS
+        return jsonify({'report': engine.size_report(resume_data, language, targets)})
+    except Exception as e:
+        return jsonify({'error': f'Erro ao processar requisição: {str(e)}'}), 500
+
+@app.route('/match', methods=['POST'])
+def match_job():
+    """Compara o currículo com a descrição de uma vaga (pontuação, termos encontrados e ausentes)."""
+    try:
+        data = request.json
+        if data is None:
+            return jsonify({'error': 'Dados JSON não recebidos'}), 400
+        
+        language = data.get('language')
+        job_description = data.get('job_description')
+        if not language or not job_description:
+            return jsonify({'error': 'Dados incompletos'}), 400
+        
+        resume_data = load_resume_data(language, data.get('content', None))
+        if resume_data is None:
+            return jsonify({'error': f'Arquivo para o idioma {language} não encontrado'}), 404
+        
+        result = matching.match(resume_data, language, job_description,
+                                method=data.get('method', matching.DEFAULT_METHOD),
+                                top=int(data.get('top', matching.DEFAULT_TOP)))
+        return jsonify(result)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': f'Erro ao processar requisição: {str(e)}'}), 500
+
+@app.route('/jobs', methods=['POST'])
+def create_job():
+    """Agenda a geração de um currículo e retorna imediatamente o id do trabalho."""
+    try:
+        data = request.json
+        if data is None:
+            return jsonify({'error': 'Dados JSON não recebidos'}), 400
+            
+        language = data.get('language')
+        format_type = data.get('format')
+        template = data.get('template', None)
+        content = data.get('content', None)
+        compact = bool(data.get('compact', False))
+        
+        if not language or not format_type:
+            return jsonify({'error': 'Dados incompletos'}), 400
+        
+        resume_data = load_resume_data(language, content)
+        if resume_data is None:
+            return jsonify({'error': f'Arquivo para o idioma {language} não encontrado'}), 404
+        
+        filename = os.path.basename(engine.get_output_filename(resume_data, language, format_type))
+        job = job_store.create(filename, engine.get_mimetype(format_type))
+        
+        # Documento idêntico já gerado: o trabalho nasce concluído
+        key = engine.cache_key(resume_data, language, format_type, template, compact)
+        cached = render_cache.get(key)
+        if cached is not None:
+            job_store.finish(job, result=cached)
+        else:
+            try:
+                future = render_pool.submit(engine.render_bytes, resume_data, language, format_type, template, compact)
+            except PoolSaturated as e:
+                job_store.finish(job, error=str(e))
+                return busy_response(e)
+            job_store.attach(job, future, on_result=lambda document: render_cache.put(key, document))
+        
+        response = job.to_dict()
+        response['status_url'] = url_for('get_job', job_id=job.id)
+        response['result_url'] = url_for('get_job_result', job_id=job.id)
+        return jsonify(response), 202
+    except Exception as e:
+        return jsonify({'error': f'Erro ao processar requisição: {str(e)}'}), 500
+
+@app.route('/jobs/<job_id>')
+def get_job(job_id):
+    """Estado e tempos de um trabalho de renderização."""
+    job = job_store.get(job_id)
+    if job is None:
+        return jsonify({'error': 'Trabalho não encontrado ou expirado'}), 404
+    response = job.to_dict()
+    response['result_url'] = url_for('get_job_result', job_id=job.id)
+    return jsonify(response)
+
+@app.route('/jobs/<job_id>/result')
+def get_job_result(job_id):
+    """Download do documento gerado por um trabalho concluído."""
+    job = job_store.get(job_id)
+    if job is None:
+        return jsonify({'error': 'Trabalho não encontrado ou expirado'}), 404
+    if job.status == 'error':
+        return jsonify({'error': job.error}), 500
+    if job.status != 'done':
+        # Ainda em andamento: o cliente deve continuar consultando o estado
+        return jsonify(job.to_dict()), 202
+    entry = job_store.open_result(job)
+    if entry is None:
+        return jsonify({'error': 'Arquivo não encontrado ou expirado'}), 404
+    f, filename, mimetype = entry
+    return send_file(f, as_attachment=True, download_name=filename, mimetype=mimetype)
+
+@app.route('/download/<file_id>')
+def download_file(file_id):
+    """Download de um arquivo gerado usando seu file_id temporário."""
+    # Verificar se o ID do arquivo existe no armazenamento de downloads
+    entry = download_store.open(file_id)
+    if entry is None:
+        return jsonify({'error': 'Arquivo não encontrado ou expirado'}), 404
+    
+    f, filename, mimetype = entry
+    return send_file(
+        f,
+        as_attachment=True,
+        download_name=filename,
+        mimetype=mimetype
+    )
 
 # Adicionar função para servir arquivos temporários
 
@@ -611,9 +785,8 @@ def serve_temporary_file(content, filename, mimetype):
     print(f"Servindo arquivo temporário: {filename} ({len(content)} bytes)")
     print(f"Tipo MIME: {mimetype}")
     
-    buffer = BytesIO()
-    buffer.write(content)
-    buffer.seek(0)
+    # BytesIO compartilha o buffer de `content` até ser modificado: sem cópias extras
+    buffer = BytesIO(content)
     
     try:
         return send_file(
@@ -626,6 +799,31 @@ def serve_temporary_file(content, filename, mimetype):
         print(f"ERRO ao servir arquivo temporário: {str(e)}")
         return jsonify({'error': f'Erro ao servir arquivo temporário: {str(e)}'}), 500
 
+@app.route('/debug/render_cache')
+def debug_render_cache():
+    """Rota de depuração com as estatísticas do cache de renderização."""
+    return jsonify(render_cache.stats())
+
+@app.route('/debug/preview_cache')
+def debug_preview_cache():
+    """Rota de depuração com as estatísticas do cache de pré-visualização."""
+    return jsonify(preview_cache.stats())
+
+@app.route('/debug/render_pool')
+def debug_render_pool():
+    """Rota de depuração com o estado do pool de renderização."""
+    return jsonify(render_pool.stats())
+
+@app.route('/debug/download_store')
+def debug_download_store():
+    """Rota de depuração com o uso do armazenamento de downloads."""
+    return jsonify(download_store.stats())
+
+@app.route('/debug/resume_store')
+def debug_resume_store():
+    """Rota de depuração com o uso do banco de currículos."""
+    return jsonify(resume_store.stats())
+
 @app.route('/debug/file_exists/<filename>')
 def debug_file_exists(filename):
     """Rota de depuração para verificar se um arquivo existe."""
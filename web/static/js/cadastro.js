@@ -7,6 +7,7 @@ document.addEventListener('DOMContentLoaded', function() {
     const saveButton = document.getElementById('save-button');
     const resetButton = document.getElementById('reset-button');
     const alertBox = document.getElementById('alert-box');
+    const previewContainer = document.getElementById('preview-container');
       // Variáveis de estado
     let currentLanguage = '';
     let curriculoData = null;
@@ -40,6 +41,7 @@ document.addEventListener('DOMContentLoaded', function() {
         
         if (!currentLanguage) {
             formContainer.style.display = 'none';
+            previewContainer.style.display = 'none';
             return;
         }
         
@@ -58,8 +60,22 @@ document.addEventListener('DOMContentLoaded', function() {
         // Gerar o formulário com os dados carregados
         generateForm(curriculoData);
         formContainer.style.display = 'block';
+        showPreview();
     });
     
+    // Atualizar a pré-visualização a cada alteração no formulário
+    curriculoForm.addEventListener('input', function() {
+        if (!curriculoData) return;
+        updateCurriculoDataFromForm();
+        schedulePreview(currentLanguage, curriculoData);
+    });
+    
+    // Função para exibir a pré-visualização do currículo carregado
+    function showPreview() {
+        previewContainer.style.display = 'block';
+        schedulePreview(currentLanguage, curriculoData);
+    }
+    
     // Salvar o currículo quando o botão for clicado
     saveButton.addEventListener('click', function() {
         if (validateForm()) {
@@ -115,6 +131,7 @@ document.addEventListener('DOMContentLoaded', function() {
                 // Gerar o formulário
                 generateForm(curriculoData);
                 formContainer.style.display = 'block';
+                showPreview();
                 
                 showAlert(`Currículo em ${getLanguageName(language)} carregado do servidor.`, 'success');
             }
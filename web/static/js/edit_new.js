@@ -121,6 +121,15 @@ document.addEventListener('DOMContentLoaded', function() {      const languageSe
     editor.on('change', function() {
         jsonEditor.value = editor.getValue();
         updateJsonStats();
+
+        // Atualizar a pré-visualização apenas quando o JSON estiver válido
+        if (currentLanguage) {
+            try {
+                schedulePreview(currentLanguage, JSON.parse(jsonEditor.value));
+            } catch (e) {
+                // JSON incompleto durante a digitação: manter a última pré-visualização
+            }
+        }
     });
       // Carregar o conteúdo do JSON quando um idioma for selecionado
     languageSelect.addEventListener('change', function() {
@@ -4,6 +4,7 @@ document.addEventListener('DOMContentLoaded', function() {
     const languageSelect = document.getElementById('language-select');
     const formatOptions = document.querySelectorAll('.format-option');
     const generateButton = document.getElementById('generate-button');
+    const generateAllButton = document.getElementById('generate-all-button');
     const alertBox = document.getElementById('alert-box');
     const downloadLinkContainer = document.getElementById('download-link-container');
     const downloadLink = document.getElementById('download-link');
@@ -25,6 +26,9 @@ document.addEventListener('DOMContentLoaded', function() {
     let selectedFormat = null;
     let selectedTemplate = null;
     
+    // Intervalo entre consultas ao estado de um trabalho (ms)
+    const JOB_POLL_INTERVAL = 500;
+    
     // Selecionar um formato quando clicado
     formatOptions.forEach(option => {
         option.addEventListener('click', function() {
@@ -91,8 +95,8 @@ document.addEventListener('DOMContentLoaded', function() {
             requestData.content = storedResume;
         }
         
-        // Enviar a solicitação para gerar o PDF
-        fetch('/generate_pdf', {
+        // Enviar a solicitação como um trabalho assíncrono
+        fetch('/jobs', {
             method: 'POST',
             headers: {
                 'Content-Type': 'application/json'
@@ -107,90 +111,147 @@ document.addEventListener('DOMContentLoaded', function() {
                 });
             }
             
-            if (!response.ok) {
-                throw new Error(`HTTP error! Status: ${response.status}`);
+            if (response.status === 503) {
+                const retryAfter = response.headers.get('Retry-After') || '1';
+                throw new Error(`Servidor ocupado. Tente novamente em ${retryAfter}s.`);
             }
-            return response.json();
+            return response.json().then(data => {
+                if (!response.ok) {
+                    throw new Error(data.error || `HTTP error! Status: ${response.status}`);
+                }
+                return data;
+            });
         })
-        .then(data => {
+        .then(job => {
             if (debugOutput) {
-                addDebugInfo('Dados de resposta:', data);
+                addDebugInfo('Trabalho criado:', job);
             }
             
-            if (data.error) {
-                showAlert(data.error, 'danger');
-            } else {
-                showAlert('Arquivo gerado com sucesso!', 'success');
-                
-                // Log para depuração
-                console.log('Resposta do servidor:', data);
-                  // Exibir o link para download
-                downloadLink.href = data.download_url;
-                downloadLink.textContent = `Baixar ${data.filename}`;
-                downloadLinkContainer.style.display = 'block';
-                
-                // Log adicional para depuração
-                console.log('URL de download:', data.download_url);
-                console.log('Nome do arquivo:', data.filename);
-                  // Fazer o download automaticamente
-                setTimeout(function() {
-                    console.log('Redirecionando para:', data.download_url);
-                    if (debugOutput) {
-                        addDebugInfo('Iniciando download:', {
-                            url: data.download_url,
-                            filename: data.filename
-                        });
-                    }
-                    
-                    // Usar um link temporário para garantir o download
-                    const tempLink = document.createElement('a');
-                    tempLink.href = data.download_url;
-                    tempLink.setAttribute('download', data.filename);
-                    tempLink.setAttribute('target', '_blank');
-                    document.body.appendChild(tempLink);
-                    tempLink.click();
-                    document.body.removeChild(tempLink);
-                    
-                    // Verificar se o arquivo existe via API de depuração (apenas em localhost)
-                    if (isLocalhost) {
-                        setTimeout(function() {
-                            fetch(`/debug/file_exists/${data.filename}`)
-                                .then(response => response.json())
-                                .then(fileInfo => {
-                                    addDebugInfo('Informações do arquivo:', fileInfo);
-                                })
-                                .catch(error => {
-                                    addDebugInfo('Erro ao verificar arquivo:', error.message);
-                                });
-                        }, 500);
-                    }
-                    
-                    // Fallback: se o método acima não funcionar, redirecionar diretamente
-                    setTimeout(function() {
-                        if (debugOutput) {
-                            addDebugInfo('Usando fallback de download', { url: data.download_url });
-                        }
-                        window.location.href = data.download_url;
-                    }, 1000);
-                }, 1000);
+            // Liberar o botão: a geração continua em segundo plano
+            restoreGenerateButton();
+            showAlert('Gerando o arquivo...', 'info');
+            return waitForJob(job);
+        })
+        .then(job => {
+            showAlert('Arquivo gerado com sucesso!', 'success');
+            
+            // Log para depuração
+            console.log('Trabalho concluído:', job);
+            
+            // Exibir o link para download
+            downloadLink.href = job.result_url;
+            downloadLink.textContent = `Baixar ${job.filename}`;
+            downloadLinkContainer.style.display = 'block';
+            
+            if (debugOutput) {
+                addDebugInfo('Iniciando download:', {
+                    url: job.result_url,
+                    filename: job.filename,
+                    elapsed_seconds: job.elapsed_seconds
+                });
             }
-        })        .catch(error => {
+            
+            // Usar um link temporário para iniciar o download automaticamente
+            const tempLink = document.createElement('a');
+            tempLink.href = job.result_url;
+            tempLink.setAttribute('download', job.filename);
+            document.body.appendChild(tempLink);
+            tempLink.click();
+            document.body.removeChild(tempLink);
+        })
+        .catch(error => {
             console.error('Erro na requisição:', error);
-            showAlert('Erro ao gerar o arquivo: ' + error, 'danger');
+            showAlert('Erro ao gerar o arquivo: ' + error.message, 'danger');
             if (debugOutput) {
                 addDebugInfo('Erro na requisição:', {
                     message: error.message,
                     stack: error.stack
                 });
             }
+            restoreGenerateButton();
+        });
+    });
+    
+    // Gerar todos os idiomas e formatos de uma vez, recebendo um único ZIP
+    generateAllButton.addEventListener('click', function() {
+        const languages = Array.from(languageSelect.options)
+            .map(option => option.value)
+            .filter(value => value);
+        
+        // Enviar os currículos do localStorage, quando existirem
+        const contents = {};
+        languages.forEach(language => {
+            const storedResume = getStoredResume(language);
+            if (storedResume) {
+                contents[language] = storedResume;
+            }
+        });
+        
+        generateAllButton.innerHTML = '<span class="loading"></span> Gerando...';
+        generateAllButton.disabled = true;
+        
+        fetch('/generate_batch', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json'
+            },
+            body: JSON.stringify({ languages: languages, contents: contents })
+        }).then(response => {
+            if (!response.ok) {
+                return response.json().then(data => {
+                    throw new Error(data.error || `HTTP error! Status: ${response.status}`);
+                });
+            }
+            return response.blob();
+        })
+        .then(blob => {
+            const url = URL.createObjectURL(blob);
+            const tempLink = document.createElement('a');
+            tempLink.href = url;
+            tempLink.setAttribute('download', 'curriculos.zip');
+            document.body.appendChild(tempLink);
+            tempLink.click();
+            document.body.removeChild(tempLink);
+            URL.revokeObjectURL(url);
+            showAlert('Arquivos gerados com sucesso!', 'success');
+        })
+        .catch(error => {
+            console.error('Erro na requisição:', error);
+            showAlert('Erro ao gerar os arquivos: ' + error.message, 'danger');
         })
         .finally(() => {
-            // Restaurar o botão
-            generateButton.innerHTML = 'Gerar';
-            generateButton.disabled = false;
+            generateAllButton.innerHTML = 'Gerar todos (ZIP)';
+            generateAllButton.disabled = false;
         });
     });
     
+    // Restaurar o botão de geração
+    function restoreGenerateButton() {
+        generateButton.innerHTML = 'Gerar';
+        updateGenerateButton();
+    }
+    
+    // Consultar o estado do trabalho até que ele termine
+    function waitForJob(job) {
+        return new Promise((resolve, reject) => {
+            function poll() {
+                fetch(job.status_url)
+                    .then(response => response.json())
+                    .then(status => {
+                        if (status.status === 'done') {
+                            resolve(status);
+                        } else if (status.status === 'error' || status.error) {
+                            reject(new Error(status.error || 'Falha ao gerar o arquivo'));
+                        } else {
+                            setTimeout(poll, JOB_POLL_INTERVAL);
+                        }
+                    })
+                    .catch(reject);
+            }
+            poll();
+        });
+    }
+    
     // Função para adicionar informações de depuração
     function addDebugInfo(label, data) {
         if (debugOutput) {
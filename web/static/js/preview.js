@@ -0,0 +1,72 @@
+/**
+ * Pré-visualização HTML do currículo durante a edição
+ */
+
+// Tempo de espera após a última alteração antes de pedir uma nova pré-visualização
+const PREVIEW_DEBOUNCE_MS = 300;
+
+let previewTimer = null;
+let previewController = null;
+let previewState = { language: '', content: null };
+
+/**
+ * Agenda a atualização da pré-visualização (apenas a última alteração é enviada)
+ * @param {string} langCode - Código do idioma (pt, en, es)
+ * @param {Object} content - Dados do currículo
+ */
+function schedulePreview(langCode, content) {
+    previewState = { language: langCode, content: content };
+    clearTimeout(previewTimer);
+    previewTimer = setTimeout(updatePreview, PREVIEW_DEBOUNCE_MS);
+}
+
+/**
+ * Pede ao servidor a pré-visualização do estado atual e a exibe no iframe
+ */
+function updatePreview() {
+    const frame = document.getElementById('preview-frame');
+    const templateSelect = document.getElementById('preview-template');
+    if (!frame || !previewState.language || !previewState.content) {
+        return;
+    }
+
+    // Cancelar o pedido anterior, que já está desatualizado
+    if (previewController) {
+        previewController.abort();
+    }
+    previewController = new AbortController();
+
+    fetch('/preview', {
+        method: 'POST',
+        headers: {
+            'Content-Type': 'application/json'
+        },
+        body: JSON.stringify({
+            language: previewState.language,
+            template: templateSelect ? templateSelect.value : 'pdf',
+            content: previewState.content
+        }),
+        signal: previewController.signal
+    }).then(response => {
+        if (!response.ok) {
+            return response.json().then(data => {
+                throw new Error(data.error || `HTTP error! Status: ${response.status}`);
+            });
+        }
+        return response.text();
+    }).then(html => {
+        frame.srcdoc = `<!DOCTYPE html><html><head><meta charset="utf-8"></head>` +
+                       `<body style="margin: 0; padding: 16px; background: #eee;">${html}</body></html>`;
+    }).catch(error => {
+        if (error.name !== 'AbortError') {
+            console.error('Erro ao atualizar a pré-visualização:', error);
+        }
+    });
+}
+
+document.addEventListener('DOMContentLoaded', function() {
+    const templateSelect = document.getElementById('preview-template');
+    if (templateSelect) {
+        templateSelect.addEventListener('change', updatePreview);
+    }
+});